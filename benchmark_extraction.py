@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Benchmark do ModuleExtractor com fontes marcadas sintéticas.
+Mede cada fase da extração separadamente e grava os resultados em JSON
+para comparar versões.
+"""
+
+import argparse
+import io
+import json
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from extraction_script import MarkerIndex, ModuleExtractor, ModuleGraph, trim_region
+
+PHASES = ['read', 'marker_search', 'graph', 'dedent', 'generate', 'write']
+
+
+def generate_marked_source(regions, css_kb=10, fan_out=3, body_lines=20,
+                           indents=(4, 8, 12), seed=0):
+    """Gera um HTML marcado com `regions` regiões CORTE e dependências aleatórias"""
+    rng = random.Random(seed)
+    parts = ['<!DOCTYPE html>\n<html>\n<head>\n    <style>\n']
+
+    css_rule = '        .rule-{n} {{ margin: {n}px; padding: 0.5rem; color: #334155; }}\n'
+    css_size = 0
+    n = 0
+    while css_size < css_kb * 1024:
+        rule = css_rule.format(n=n)
+        parts.append(rule)
+        css_size += len(rule)
+        n += 1
+
+    parts.append('    </style>\n</head>\n<body>\n    <script>\n')
+
+    for i in range(regions):
+        indent = ' ' * rng.choice(indents)
+        path = f'src/gen/group{i % 50}/module{i}.js'
+        deps = rng.sample(range(i), min(fan_out, i)) if i else []
+
+        parts.append(f'{indent}// ===== CORTE: {path} - INÍCIO =====\n')
+        parts.append(f'{indent}class Module{i} {{\n')
+        parts.append(f'{indent}    constructor() {{\n')
+        for dep in deps:
+            parts.append(f'{indent}        this.dep{dep} = new Module{dep}();\n')
+        parts.append(f'{indent}    }}\n')
+        for line in range(body_lines):
+            parts.append(f'{indent}    method{line}(value) {{ return value * {line}; }}\n')
+        parts.append(f'{indent}}}\n')
+        parts.append(f'{indent}// ===== CORTE: {path} - FIM =====\n\n')
+
+    parts.append('    </script>\n</body>\n</html>\n')
+    return ''.join(parts)
+
+
+def time_phases(source_file, output_root):
+    """Executa uma extração fase a fase, retornando os tempos (s) e bytes"""
+    extractor = ModuleExtractor(str(source_file), output_root, stream=io.StringIO())
+    timings = dict.fromkeys(PHASES, 0.0)
+    bytes_written = 0
+
+    started = time.perf_counter()
+    content = extractor.read_source_file()
+    timings['read'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    marker_index = MarkerIndex(content)
+    timings['marker_search'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    graph = ModuleGraph(content, marker_index)
+    graph.levels()
+    extractor.modules = graph.module_map()
+    timings['graph'] = time.perf_counter() - started
+
+    for module_path, (start, end) in marker_index.regions.items():
+        started = time.perf_counter()
+        cleaned_content = extractor.dedent(trim_region(content[start:end]))
+        timings['dedent'] += time.perf_counter() - started
+
+        started = time.perf_counter()
+        final_content = extractor.generate_module_content(
+            cleaned_content, extractor.modules[module_path], module_path)
+        timings['generate'] += time.perf_counter() - started
+
+        started = time.perf_counter()
+        extractor.write_output(module_path, final_content)
+        timings['write'] += time.perf_counter() - started
+        bytes_written += len(final_content.encode('utf-8'))
+
+    return timings, bytes_written
+
+
+def run_case(regions, repeat, **source_options):
+    """Gera uma fonte sintética e mede `repeat` extrações em diretórios novos"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        source_file = tmp / 'marked.html'
+        source_file.write_text(generate_marked_source(regions, **source_options), encoding='utf-8')
+        source_bytes = source_file.stat().st_size
+
+        runs = []
+        for attempt in range(repeat):
+            timings, bytes_written = time_phases(source_file, tmp / f'out{attempt}')
+            runs.append(timings)
+
+    return {
+        'regions': regions,
+        'source_bytes': source_bytes,
+        'bytes_written': bytes_written,
+        'options': source_options,
+        'phases': {
+            phase: {
+                'min': min(run[phase] for run in runs),
+                'median': statistics.median(run[phase] for run in runs)
+            }
+            for phase in PHASES
+        }
+    }
+
+
+def git_revision():
+    """Revisão atual do repositório, se disponível"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark do extrator de módulos")
+    parser.add_argument('--regions', type=int, nargs='+', default=[10, 100, 1000, 10000],
+                        help="quantidades de regiões CORTE a medir")
+    parser.add_argument('--css-kb', type=int, default=10, help="tamanho do CSS sintético")
+    parser.add_argument('--fan-out', type=int, default=3, help="dependências por módulo")
+    parser.add_argument('--body-lines', type=int, default=20, help="linhas de corpo por módulo")
+    parser.add_argument('--repeat', type=int, default=3, help="repetições por caso")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_results.json',
+                        help="arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    print("⏱️  Benchmark do ModuleExtractor")
+    print("=" * 60)
+
+    results = []
+    for regions in args.regions:
+        result = run_case(regions, args.repeat, css_kb=args.css_kb, fan_out=args.fan_out,
+                          body_lines=args.body_lines, seed=args.seed)
+        results.append(result)
+        phases = '  '.join(f"{phase}={result['phases'][phase]['median'] * 1000:.1f}ms"
+                           for phase in PHASES)
+        print(f"   {regions:>6} regiões ({result['source_bytes'] / 1024:.0f} KB): {phases}")
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'repeat': args.repeat
+        },
+        'results': results
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print("=" * 60)
+    print(f"📄 Resultados gravados em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Divisão do CSS em crítico e restante para o index.html gerado.
+Uma regra é crítica quando algum de seus seletores casa com um elemento do
+template do index.html (o que existe na primeira pintura); o restante
+(elementos criados depois pelo JS) pode ser carregado de forma assíncrona.
+A correspondência é conservadora: pseudo-classes dinâmicas (:hover, :focus,
+...) e seletores não reconhecidos contam como casados.
+"""
+
+import re
+from collections import Counter
+from html.parser import HTMLParser
+
+# At-rules que agrupam regras: os filhos são divididos individualmente
+GROUPING_AT_RULES = ('@media', '@supports', '@layer', '@container')
+
+# Pseudo-classes estruturais avaliadas de fato; as demais são ignoradas
+STRUCTURAL_PSEUDOS = {'root', 'first-child', 'last-child', 'only-child'}
+
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+    'source', 'track', 'wbr'
+}
+
+SIMPLE_SELECTOR_PATTERN = re.compile(r"""
+    (?P<universal>\*)
+  | (?P<tag>[a-zA-Z][\w-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]
+  | ::?(?P<pseudo>[\w-]+)(?:\((?P<args>[^)]*)\))?
+""", re.VERBOSE)
+COMBINATOR_PATTERN = re.compile(r'\s*([>+~])\s*|\s+')
+
+
+class CSSRule:
+    """Regra (ou at-rule) do CSS com o texto original preservado"""
+
+    def __init__(self, prelude, body=None, children=None, text=''):
+        self.prelude = prelude
+        self.body = body
+        self.children = children
+        self.text = text
+
+    def signatures(self, context=()):
+        """Identidades normalizadas (contexto, seletor, declarações) das regras folha"""
+        if self.children is not None:
+            context = context + (normalize(self.prelude),)
+            return [sig for child in self.children for sig in child.signatures(context)]
+        return [(context, normalize(self.prelude), normalize(self.body or ''))]
+
+
+def normalize(text):
+    return ' '.join(text.split())
+
+
+def _skip_comment_or_string(css, i):
+    """Índice após um comentário ou string iniciado em css[i] (ou None)"""
+    if css.startswith('/*', i):
+        close = css.find('*/', i + 2)
+        return len(css) if close == -1 else close + 2
+    if css[i] in '\'"':
+        quote = css[i]
+        i += 1
+        while i < len(css) and css[i] != quote:
+            i += 2 if css[i] == '\\' else 1
+        return i + 1
+    return None
+
+
+def _strip_comments(css):
+    out = []
+    i = 0
+    while i < len(css):
+        end = _skip_comment_or_string(css, i)
+        if end is None:
+            out.append(css[i])
+            i += 1
+        else:
+            if not css.startswith('/*', i):
+                out.append(css[i:end])
+            i = end
+    return ''.join(out)
+
+
+def parse_css(css):
+    """Converte o CSS em uma lista de CSSRule (at-rules de agrupamento com filhos)"""
+    css = _strip_comments(css)
+    rules = []
+    i = start = 0
+    while i < len(css):
+        char = css[i]
+        end = _skip_comment_or_string(css, i)
+        if end is not None:
+            i = end
+            continue
+        if char == ';':
+            # At-rule de instrução (@import, @charset, ...)
+            statement = css[start:i + 1].strip()
+            if statement.strip(';').strip():
+                rules.append(CSSRule(statement[:-1].strip(), text=statement))
+            i = start = i + 1
+            continue
+        if char == '{':
+            close = _matching_brace(css, i)
+            prelude = css[start:i].strip()
+            body = css[i + 1:close]
+            text = css[start:close + 1].strip()
+            if prelude.lower().startswith(GROUPING_AT_RULES):
+                rules.append(CSSRule(prelude, children=parse_css(body), text=text))
+            else:
+                rules.append(CSSRule(prelude, body=body, text=text))
+            i = start = close + 1
+            continue
+        i += 1
+    return rules
+
+
+def _matching_brace(css, i):
+    depth = 0
+    while i < len(css):
+        end = _skip_comment_or_string(css, i)
+        if end is not None:
+            i = end
+            continue
+        if css[i] == '{':
+            depth += 1
+        elif css[i] == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return len(css)
+
+
+class Element:
+    def __init__(self, tag, attrs, parent):
+        self.tag = tag
+        self.attrs = {name: value or '' for name, value in attrs}
+        self.classes = set(self.attrs.get('class', '').split())
+        self.parent = parent
+        self.children = []
+
+    def siblings_before(self):
+        siblings = self.parent.children if self.parent else [self]
+        return siblings[:siblings.index(self)]
+
+
+class TemplateDocument(HTMLParser):
+    """Árvore mínima de elementos de um HTML, para casar seletores"""
+
+    def __init__(self, html):
+        super().__init__()
+        self.root = None
+        self.elements = []
+        self._stack = []
+        self.feed(html)
+        self.close()
+
+    def handle_starttag(self, tag, attrs):
+        parent = self._stack[-1] if self._stack else None
+        element = Element(tag, attrs, parent)
+        if parent is not None:
+            parent.children.append(element)
+        elif self.root is None:
+            self.root = element
+        self.elements.append(element)
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self._stack.pop()
+
+    def handle_endtag(self, tag):
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth].tag == tag:
+                del self._stack[depth:]
+                break
+
+
+def split_selector_list(prelude):
+    """Separa "a, b" respeitando parênteses e colchetes"""
+    parts, depth, current = [], 0, []
+    for char in prelude:
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        if char == ',' and depth == 0:
+            parts.append(''.join(current).strip())
+            current = []
+        else:
+            current.append(char)
+    parts.append(''.join(current).strip())
+    return [part for part in parts if part]
+
+
+def parse_selector(selector):
+    """Lista [(combinador, [seletores simples])] da esquerda para a direita; None se não reconhecido"""
+    compounds = []
+    combinator = None
+    i = 0
+    while i < len(selector):
+        simple = []
+        while i < len(selector):
+            match = SIMPLE_SELECTOR_PATTERN.match(selector, i)
+            if not match:
+                break
+            simple.append(match)
+            i = match.end()
+        if not simple:
+            return None
+        compounds.append((combinator, simple))
+        match = COMBINATOR_PATTERN.match(selector, i)
+        if i < len(selector):
+            if not match or not match.end() > i:
+                return None
+            combinator = match.group(1) or ' '
+            i = match.end()
+    return compounds
+
+
+def _matches_simple(element, match):
+    if match.group('universal'):
+        return True
+    if match.group('tag'):
+        return element.tag == match.group('tag').lower()
+    if match.group('id'):
+        return element.attrs.get('id') == match.group('id')
+    if match.group('cls'):
+        return match.group('cls') in element.classes
+    if match.group('attr'):
+        name = match.group('attr').lower()
+        if name not in element.attrs:
+            return False
+        if not match.group('op'):
+            return True
+        expected = match.group('value').strip('\'"')
+        actual = element.attrs[name]
+        return {
+            '=': actual == expected,
+            '~=': expected in actual.split(),
+            '|=': actual == expected or actual.startswith(expected + '-'),
+            '^=': actual.startswith(expected),
+            '$=': actual.endswith(expected),
+            '*=': expected in actual
+        }[match.group('op')]
+
+    pseudo = match.group('pseudo').lower()
+    if pseudo not in STRUCTURAL_PSEUDOS:
+        # Dinâmicas (:hover, :disabled, ...) e pseudo-elementos: conservador
+        return True
+    siblings = element.parent.children if element.parent else [element]
+    return {
+        'root': element.parent is None,
+        'first-child': siblings[0] is element,
+        'last-child': siblings[-1] is element,
+        'only-child': len(siblings) == 1
+    }[pseudo]
+
+
+def _matches_compound(element, compounds, index):
+    """Casa compounds[:index + 1] terminando em `element` (da direita para a esquerda)"""
+    combinator, simple = compounds[index]
+    if not all(_matches_simple(element, match) for match in simple):
+        return False
+    if index == 0:
+        return True
+
+    if combinator == '>':
+        candidates = [element.parent] if element.parent else []
+    elif combinator == ' ':
+        candidates = []
+        ancestor = element.parent
+        while ancestor is not None:
+            candidates.append(ancestor)
+            ancestor = ancestor.parent
+    elif combinator == '+':
+        before = element.siblings_before()
+        candidates = before[-1:]
+    else:
+        candidates = element.siblings_before()
+    return any(_matches_compound(candidate, compounds, index - 1) for candidate in candidates)
+
+
+def selector_matches(document, selector):
+    """Indica se o seletor casa com algum elemento do documento"""
+    compounds = parse_selector(selector)
+    if compounds is None:
+        return True
+    return any(_matches_compound(element, compounds, len(compounds) - 1)
+               for element in document.elements)
+
+
+def _is_critical(rule, document):
+    if rule.prelude.startswith('@'):
+        # @import/@charset precisam vir primeiro; @font-face/@keyframes ficam no restante
+        return rule.body is None and rule.children is None
+    return any(selector_matches(document, selector)
+               for selector in split_selector_list(rule.prelude))
+
+
+def _split_rules(rules, document):
+    critical, rest = [], []
+    for rule in rules:
+        if rule.children is not None:
+            inner_critical, inner_rest = _split_rules(rule.children, document)
+            if inner_critical:
+                critical.append(_wrap(rule.prelude, inner_critical))
+            if inner_rest:
+                rest.append(_wrap(rule.prelude, inner_rest))
+        elif _is_critical(rule, document):
+            critical.append(rule.text)
+        else:
+            rest.append(rule.text)
+    return critical, rest
+
+
+def _wrap(prelude, texts):
+    inner = '\n'.join(f'    {text}' for text in texts)
+    return f'{prelude} {{\n{inner}\n}}'
+
+
+def split_css(css, html):
+    """Divide o CSS pelo que casa com o HTML: (crítico, restante, relatório)
+
+    O relatório traz regras e bytes de cada parte e `complete`, que confirma
+    que a união das duas partes reproduz exatamente o conjunto de regras original.
+    """
+    document = TemplateDocument(html)
+    rules = parse_css(css)
+    critical_texts, rest_texts = _split_rules(rules, document)
+    critical = '\n\n'.join(critical_texts)
+    rest = '\n\n'.join(rest_texts)
+
+    original = Counter(sig for rule in rules for sig in rule.signatures())
+    critical_signatures = Counter(sig for rule in parse_css(critical) for sig in rule.signatures())
+    rest_signatures = Counter(sig for rule in parse_css(rest) for sig in rule.signatures())
+    report = {
+        'critical_rules': sum(critical_signatures.values()),
+        'rest_rules': sum(rest_signatures.values()),
+        'original_rules': sum(original.values()),
+        'critical_bytes': len(critical.encode('utf-8')),
+        'rest_bytes': len(rest.encode('utf-8')),
+        'original_bytes': len(css.encode('utf-8')),
+        'complete': critical_signatures + rest_signatures == original
+    }
+    return critical, rest, report
@@ -4,212 +4,1191 @@ Script de Extração Precisa para Card Creator v4.1
 Usa as marcações cirúrgicas para extrair módulos ES6 corretamente.
 """
 
+import argparse
+import glob
+import gzip
+import hashlib
+import io
+import json
+import mmap
 import os
+import posixpath
 import re
 import shutil
+import stat
+import string
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from critical_css import split_css
+from minifier import REGEX_PRECEDING_KEYWORDS, REGEX_PRECEDING_PUNCTUATION, minify_css, minify_js
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Marcadores de região: CORTE (INÍCIO/FIM) e o bloco de inicialização
+# ("INICIALIZAÇÃO - MOVER PARA src/app.js" ... "INICIALIZAÇÃO - FIM")
+MARKER_PATTERN = re.compile(
+    r'===== (?:CORTE: (?P<path>\S+) - (?P<kind>INÍCIO|FIM)'
+    r'|INICIALIZAÇÃO - (?:MOVER PARA (?P<init_path>\S+)|(?P<init_end>FIM))) ====='
+)
+MARKER_PATTERN_BYTES = re.compile(MARKER_PATTERN.pattern.encode('utf-8'))
+
+# Padrões usados pelo modo streaming (operam direto sobre o mmap)
+CSS_PATTERN = re.compile(r'<style>(.*?)</style>', re.DOTALL)
+CSS_PATTERN_BYTES = re.compile(CSS_PATTERN.pattern.encode('utf-8'), re.DOTALL)
+INDENT_PATTERN_BYTES = re.compile(rb'[ \t\r\f\v]*')
+WHITESPACE_BYTES = b' \t\r\n\f\v'
+
+# Ponto de entrada carregado pelo index.html
+ENTRY_MODULE = 'src/app.js'
+
+# Tipos de arquivo que recebem uma versão .gz pré-comprimida
+PRECOMPRESS_SUFFIXES = {'.js', '.css', '.html'}
+
+# Versão do formato dos módulos gerados: entra no hash de frescor de cada
+# módulo, então incremente ao mudar o que o gerador escreve (export, dedent,
+# imports...) para que manifestos antigos não mantenham saídas desatualizadas
+GENERATOR_VERSION = 3
+
+# Umask do processo: arquivos novos ganham o mesmo modo que open() daria
+# (mkstemp cria com 0600). Lido uma vez, antes de qualquer thread
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+# Nomes com hash do conteúdo (--fingerprint): dígitos hex e mapa gravado
+FINGERPRINT_LENGTH = 8
+ASSET_MANIFEST = 'asset-manifest.json'
+
+# Tokens relevantes para o índice de símbolos: comentários, strings e o texto
+# de template literals são ignorados, declarações (class/const/let/var/function)
+# e identificadores não. Um template para no fim ou em "${"; lá dentro as chaves
+# contam a profundidade para retomar o texto no "}" que a fecha. Uma "/"
+# fora de comentário pode abrir uma regex literal, decidido por iter_tokens
+TEMPLATE_TEXT = r"(?:\\.|[^`\\$]|\$(?!\{))*(?:`|\$\{|\Z)"
+TOKEN_PATTERN = re.compile(r"""
+    (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*")
+  | (?P<template>`""" + TEMPLATE_TEXT + r""")
+  | ^(?P<indent>[ \t]*)(?:export\s+)?(?:async\s+)?(?:class|const|let|var|function\*?)\s+(?P<decl>[A-Za-z_$][\w$]*)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<slash>/)
+""", re.MULTILINE | re.DOTALL | re.VERBOSE)
+TOKEN_PATTERN_BYTES = re.compile(TOKEN_PATTERN.pattern.encode('utf-8'), TOKEN_PATTERN.flags & ~re.UNICODE)
+# Dentro de ${...} as chaves também são tokens
+NESTED_TOKEN_PATTERN = re.compile(TOKEN_PATTERN.pattern + r"  | (?P<brace>[{}])", TOKEN_PATTERN.flags)
+NESTED_TOKEN_PATTERN_BYTES = re.compile(NESTED_TOKEN_PATTERN.pattern.encode('utf-8'), TOKEN_PATTERN_BYTES.flags)
+TEMPLATE_TEXT_PATTERN = re.compile(TEMPLATE_TEXT, re.DOTALL)
+TEMPLATE_TEXT_PATTERN_BYTES = re.compile(TEMPLATE_TEXT.encode('utf-8'), re.DOTALL)
+REGEX_LITERAL = r"/(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[\w$]*"
+REGEX_LITERAL_PATTERN = re.compile(REGEX_LITERAL)
+REGEX_LITERAL_PATTERN_BYTES = re.compile(REGEX_LITERAL.encode('utf-8'))
+
+# Declaração na coluna 0 (após o dedent, só as de topo da região); o nome é
+# conferido contra o conjunto de exports
+DECLARATION = r'(?P<export>export\s+)?(?P<decl>(?:async\s+)?(?:class|const|let|var|function\*?)\s+(?P<name>[A-Za-z_$][\w$]*))'
+DECLARATION_PATTERN = re.compile(rf'^{DECLARATION}', re.MULTILINE)
+DECLARATION_PATTERN_BYTES = re.compile(DECLARATION.encode('utf-8'))
+
+# Pontos de divisão declarados no fonte: loadChunk('src/...', () => Símbolo).
+# Com --split a chamada vira import() e o módulo alvo sai do grafo estático
+LOAD_CHUNK_PATTERN = re.compile(
+    r"loadChunk\(\s*'(?P<path>[^']+)'\s*,\s*\(\)\s*=>\s*(?P<name>[A-Za-z_$][\w$]*)\s*\)"
+)
+LOAD_CHUNK_PATTERN_BYTES = re.compile(LOAD_CHUNK_PATTERN.pattern.encode('utf-8'))
+
+class MarkerIndex:
+    """Índice de todas as marcações de região, construído em uma única varredura"""
+
+    def __init__(self, content):
+        # Aceita str ou bytes/mmap (modo streaming)
+        self.regions = {}
+        self.problems = []
+        self._scan(content)
+
+    def _scan(self, content):
+        """Percorre o conteúdo uma vez registrando início/fim de cada região"""
+        open_path = None
+        open_start = None
+        is_text = isinstance(content, str)
+        pattern = MARKER_PATTERN if is_text else MARKER_PATTERN_BYTES
+
+        for match in pattern.finditer(content):
+            if match.group('init_path') is not None:
+                path, kind = match.group('init_path'), 'INÍCIO'
+            elif match.group('init_end') is not None:
+                # O FIM da inicialização não repete o caminho
+                path, kind = (open_path or 'INICIALIZAÇÃO'), 'FIM'
+            else:
+                path, kind = match.group('path'), match.group('kind')
+            if not is_text:
+                path = path.decode('utf-8') if isinstance(path, bytes) else path
+                kind = kind.decode('utf-8') if isinstance(kind, bytes) else kind
+
+            if kind == 'INÍCIO':
+                if open_path is not None:
+                    self.problems.append(
+                        f"Marcação aninhada: {path} aberta dentro de {open_path}"
+                    )
+                    continue
+                if path in self.regions:
+                    self.problems.append(f"Marcação duplicada: {path}")
+                    continue
+                open_path = path
+                open_start = match.end()
+            else:
+                if open_path is None:
+                    self.problems.append(f"FIM sem INÍCIO: {path}")
+                    continue
+                if path != open_path:
+                    self.problems.append(
+                        f"FIM de {path} encontrado dentro de {open_path}"
+                    )
+                    continue
+                self.regions[path] = (open_start, self._region_end(content, open_start, match.start()))
+                open_path = None
+
+        if open_path is not None:
+            self.problems.append(f"INÍCIO sem FIM: {open_path}")
+
+    @staticmethod
+    def _region_end(content, region_start, marker_start):
+        """Fim da região: início da linha do FIM, se ela contém só o marcador"""
+        newline = b'\n' if not isinstance(content, str) else '\n'
+        line_start = content.rfind(newline, region_start, marker_start) + 1
+        if line_start == 0:
+            return marker_start
+        prefix = content[line_start:marker_start].strip()
+        return line_start if prefix in ('', '//', b'', b'//') else marker_start
+
+    def get(self, module_path):
+        """Retorna (início, fim) da região ou None"""
+        return self.regions.get(module_path)
+
+    def __contains__(self, module_path):
+        return module_path in self.regions
+
+    def __len__(self):
+        return len(self.regions)
+
+
+class ModuleGraph:
+    """Grafo de imports derivado dos símbolos declarados e referenciados em cada região"""
+
+    def __init__(self, content, marker_index, split=False):
+        self.declarations = {}   # módulo -> símbolos de topo, na ordem do fonte
+        self.references = {}     # módulo -> identificadores usados
+        self.symbols = {}        # símbolo -> módulo que o declara
+        self.duplicates = []     # símbolos declarados em mais de um módulo
+        self.lazy = {}           # módulo -> {ponto de divisão: símbolos via loadChunk}
+        self.problems = []
+        # Com split, o que está dentro de loadChunk() não gera import estático
+        self.split = split
+        self.order = sorted(marker_index.regions, key=lambda path: marker_index.regions[path][0])
+        self.position = {path: i for i, path in enumerate(self.order)}
+
+        for module_path in self.order:
+            start, end = marker_index.regions[module_path]
+            self._scan_region(module_path, content, start, end)
+
+        self.imports = self._resolve_imports()
+
+    @property
+    def split_points(self):
+        """Módulos alvo de loadChunk() em alguma região"""
+        return {target for targets in self.lazy.values() for target in targets}
+
+    def _scan_region(self, module_path, content, start, end):
+        """Varre a região uma vez coletando declarações de topo e referências"""
+        is_text = isinstance(content, str)
+        declared = []
+        references = set()
+
+        lazy_spans = []
+        chunk_pattern = LOAD_CHUNK_PATTERN if is_text else LOAD_CHUNK_PATTERN_BYTES
+        for match in chunk_pattern.finditer(content, start, end):
+            target, name = match.group('path', 'name')
+            if not is_text:
+                target, name = target.decode('utf-8'), name.decode('utf-8')
+            names = self.lazy.setdefault(module_path, {}).setdefault(target, [])
+            if name not in names:
+                names.append(name)
+            if self.split:
+                lazy_spans.append(match.span())
+
+        for match in iter_tokens(content, start, end):
+            if match.group('decl') is not None:
+                name = match.group('decl')
+                declared.append((len(match.group('indent')), name if is_text else name.decode('utf-8')))
+            elif match.group('ident') is not None:
+                if any(span_start <= match.start() < span_end for span_start, span_end in lazy_spans):
+                    continue
+                name = match.group('ident')
+                references.add(name if is_text else name.decode('utf-8'))
+
+        # Declarações de topo são as da indentação da primeira linha da região
+        top_indent = self._base_indent(content, start, end)
+        top_level = [name for indent, name in declared if indent == top_indent]
+
+        self.declarations[module_path] = top_level
+        self.references[module_path] = references
+        for name in top_level:
+            owner = self.symbols.get(name)
+            if owner is not None and owner != module_path:
+                self.duplicates.append(name)
+                self.problems.append(f"Símbolo {name} declarado em {owner} e {module_path}")
+                continue
+            self.symbols[name] = module_path
+
+    @staticmethod
+    def _base_indent(content, start, end):
+        """Indentação da primeira linha não-vazia da região"""
+        if isinstance(content, str):
+            text = content[start:end]
+            stripped = text.lstrip()
+            first = len(text) - len(stripped)
+            return first - (text.rfind('\n', 0, first) + 1)
+        first, _ = strip_bounds(content, start, end)
+        newline = content.rfind(b'\n', start, first)
+        return first - (newline + 1 if newline != -1 else start)
+
+    def _resolve_imports(self):
+        """Mapeia cada módulo para {módulo dependência: [símbolos usados]}"""
+        imports = {}
+        for module_path in self.order:
+            used = {}
+            for name in self.references[module_path]:
+                owner = self.symbols.get(name)
+                if owner is not None and owner != module_path:
+                    used.setdefault(owner, set()).add(name)
+            imports[module_path] = {
+                dep: [name for name in self.declarations[dep] if name in names]
+                for dep, names in sorted(used.items(), key=lambda item: self.position[item[0]])
+            }
+
+        for module_path, targets in self.lazy.items():
+            for target, names in targets.items():
+                if target not in self.position:
+                    self.problems.append(f"loadChunk em {module_path} aponta para {target}, que não tem marcações")
+                    continue
+                missing = [name for name in names if self.symbols.get(name) != target]
+                if missing:
+                    self.problems.append(
+                        f"loadChunk em {module_path}: {', '.join(missing)} não declarado(s) em {target}")
+        return imports
+
+    def dependencies(self, module_path):
+        """Dependências estáticas e, com split, os chunks carregados via import()"""
+        deps = list(self.imports[module_path])
+        if self.split:
+            deps.extend(target for target in self.lazy.get(module_path, {})
+                        if target in self.position and target not in deps)
+        return deps
+
+    def levels(self):
+        """Ordenação topológica em níveis; módulos do mesmo nível são independentes"""
+        # Os alvos de import() vêm antes: com fingerprint o nome deles entra no importador
+        edges = {path: self.dependencies(path) for path in self.order}
+        pending = {path: len(deps) for path, deps in edges.items()}
+        dependents = {path: [] for path in self.order}
+        for path, deps in edges.items():
+            for dep in deps:
+                dependents[dep].append(path)
+
+        levels = []
+        ready = [path for path in self.order if pending[path] == 0]
+        while ready:
+            levels.append(ready)
+            next_ready = []
+            for path in ready:
+                del pending[path]
+                for dependent in dependents[path]:
+                    pending[dependent] -= 1
+                    if pending[dependent] == 0:
+                        next_ready.append(dependent)
+            ready = sorted(next_ready, key=self.position.get)
+
+        if pending:
+            cycle = sorted(pending, key=self.position.get)
+            self.problems.append(f"Ciclo de dependências entre: {', '.join(cycle)}")
+            levels.append(cycle)
+
+        return levels
+
+    def reachable(self, entry):
+        """Módulos alcançáveis a partir de `entry` como (caminho, profundidade), em BFS"""
+        depths = {entry: 0}
+        queue = [entry]
+        for module_path in queue:
+            for dep in self.imports.get(module_path, {}):
+                if dep not in depths:
+                    depths[dep] = depths[module_path] + 1
+                    queue.append(dep)
+        del depths[entry]
+        return sorted(depths.items(), key=lambda item: (item[1], self.position[item[0]]))
+
+    def static_closure(self, roots):
+        """Módulos alcançados pelos imports estáticos a partir de `roots` (inclusive)"""
+        seen = set(roots)
+        queue = list(roots)
+        for module_path in queue:
+            for dep in self.imports.get(module_path, {}):
+                if dep not in seen:
+                    seen.add(dep)
+                    queue.append(dep)
+        return seen
+
+    def chunks(self, entry, levels):
+        """Divide os módulos em chunks: principal, um por ponto de divisão e compartilhados
+        
+        Um módulo alcançado por mais de um ponto de divisão (e não pelo principal)
+        vai para um chunk compartilhado por exatamente esses pontos, então nenhum
+        módulo é emitido duas vezes. Retorna [{'name', 'kind', 'modules', 'used_by'}].
+        """
+        rank = {path: i for i, path in enumerate(path for level in levels for path in level)}
+        split_points = sorted((point for point in self.split_points if point in self.position),
+                              key=self.position.get)
+        closures = {point: self.static_closure([point]) for point in split_points}
+        lazy_modules = set().union(*closures.values()) if closures else set()
+        # Principal: o que o entry alcança e tudo que nenhum ponto de divisão alcança
+        main = self.static_closure([entry] + [path for path in self.order if path not in lazy_modules])
+        for point in split_points:
+            if point in main:
+                self.problems.append(f"{point} também é importado estaticamente; fica no chunk principal")
+
+        groups = {}
+        for module_path in lazy_modules - main:
+            owners = tuple(point for point in split_points if module_path in closures[point])
+            groups.setdefault(owners, []).append(module_path)
+
+        chunks = [{'name': 'main', 'kind': 'entry', 'modules': sorted(main, key=rank.get), 'used_by': []}]
+        for owners, modules in sorted(groups.items(), key=lambda item: (len(item[0]), item[0])):
+            names = [posixpath.splitext(posixpath.basename(point))[0] for point in owners]
+            chunks.append({
+                'name': names[0] if len(owners) == 1 else 'shared-' + '-'.join(names),
+                'kind': 'lazy' if len(owners) == 1 else 'shared',
+                'modules': sorted(modules, key=rank.get),
+                'used_by': list(owners)
+            })
+        return chunks
+
+    def module_map(self):
+        """Mapa no formato de self.modules: dependências relativas, imports e exports
+        
+        Com split, os pontos de divisão de cada módulo entram em 'lazy'
+        (caminho relativo → símbolos) e viram import() na geração.
+        """
+        modules = {}
+        for module_path in self.order:
+            imports = {
+                relative_import(module_path, dep): names
+                for dep, names in self.imports[module_path].items()
+            }
+            modules[module_path] = {
+                'dependencies': list(imports),
+                'imports': imports,
+                'exports': list(self.declarations[module_path])
+            }
+            lazy = {
+                relative_import(module_path, target): names
+                for target, names in self.lazy.get(module_path, {}).items()
+                if target in self.position
+            }
+            if self.split and lazy:
+                modules[module_path]['lazy'] = lazy
+        return modules
+
+
+class ExtractionError(Exception):
+    """Erro de extração que invalida o módulo gerado"""
+
+
+class ExportMarker:
+    """Marca com `export` todas as declarações exportadas em uma única passada"""
+
+    def __init__(self, exports):
+        self.exports = frozenset(exports)
+        self.found = set()
+
+    def _replace(self, match):
+        name = match.group('name')
+        if name not in self.exports or name in self.found:
+            return match.group(0)
+        self.found.add(name)
+        if match.group('export'):
+            return match.group(0)
+        return f"export {match.group('decl')}"
+
+    def apply(self, text):
+        """Reescreve o texto inteiro com um único sub()"""
+        return DECLARATION_PATTERN.sub(self._replace, text)
+
+    def apply_line(self, buffer, start, end):
+        """Reescreve uma linha do buffer; retorna None se ela não muda"""
+        match = DECLARATION_PATTERN_BYTES.match(buffer, start, end)
+        if match is None:
+            return None
+        name = match.group('name').decode('utf-8')
+        if name not in self.exports or name in self.found:
+            return None
+        self.found.add(name)
+        if match.group('export'):
+            return None
+        return b''.join((b'export ', buffer[match.start('decl'):end]))
+
+    def check(self, module_path):
+        """Falha se algum export declarado não foi encontrado"""
+        missing = [name for name in sorted(self.exports) if name not in self.found]
+        if missing:
+            raise ExtractionError(
+                f"Exports não encontrados em {module_path}: {', '.join(missing)}"
+            )
+
+
+def relative_import(module_path, target):
+    """Especificador relativo ('./x.js', '../y/z.js') de `target` visto de `module_path`"""
+    relative = posixpath.relpath(target, posixpath.dirname(module_path) or '.')
+    return relative if relative.startswith('.') else f'./{relative}'
+
+
+def dynamic_import_expression(specifier, name):
+    """import() que resolve para o símbolo, como loadChunk(caminho, () => name)"""
+    return f"import('{specifier}').then(({{ {name} }}) => {name})"
+
+
+def region_text(content, region):
+    """Texto de uma região, seja o conteúdo str ou mmap"""
+    start, end = region
+    if isinstance(content, str):
+        return content[start:end]
+    return content[start:end].decode('utf-8')
+
+
+def content_hash(data):
+    """Hash SHA-256 de texto ou bytes"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def fingerprint_path(relative_path, data):
+    """Insere o hash do conteúdo no nome: src/app.js → src/app.3f9a1c2e.js"""
+    stem, ext = posixpath.splitext(relative_path)
+    return f'{stem}.{content_hash(data)[:FINGERPRINT_LENGTH]}{ext}'
+
+
+def replace_file(tmp_path, file_path):
+    """os.replace mantendo o modo do destino (ou o do umask, se ele ainda não existe)"""
+    try:
+        mode = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~UMASK
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, file_path)
+
+
+def atomic_write(file_path, data):
+    """Escreve bytes em um arquivo temporário e substitui o destino atomicamente"""
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        replace_file(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def file_hash(file_path, chunk_size=1 << 16):
+    """Hash SHA-256 de um arquivo lido em blocos"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def strip_bounds(buffer, start, end):
+    """Equivalente a str.strip() sobre uma janela do buffer, sem copiar"""
+    while start < end and buffer[start] in WHITESPACE_BYTES:
+        start += 1
+    while end > start and buffer[end - 1] in WHITESPACE_BYTES:
+        end -= 1
+    return start, end
+
+
+def trim_bounds(buffer, start, end):
+    """Remove linhas em branco iniciais e espaços finais, preservando a
+    indentação da primeira linha (necessária para o dedent)"""
+    first, end = strip_bounds(buffer, start, end)
+    newline = buffer.rfind(b'\n', start, first)
+    return (newline + 1 if newline != -1 else first), end
+
+
+def trim_region(text):
+    """Versão str de trim_bounds"""
+    stripped = text.lstrip()
+    if not stripped:
+        return ''
+    first = len(text) - len(stripped)
+    newline = text.rfind('\n', 0, first)
+    return text[newline + 1 if newline != -1 else first:].rstrip()
+
+
+def iter_line_bounds(buffer, start, end):
+    """Gera (início, fim) de cada linha da janela do buffer"""
+    pos = start
+    while pos <= end:
+        newline = buffer.find(b'\n', pos, end)
+        if newline == -1:
+            yield pos, end
+            return
+        yield pos, newline
+        pos = newline + 1
+
+
+def iter_tokens(content, start, end):
+    """Gera as declarações e identificadores de content[start:end] (str ou bytes/mmap).
+
+    Do template literal só o código dentro de ${...} é varrido (inclusive
+    templates aninhados); o corpo de uma regex literal é pulado inteiro
+    """
+    is_text = isinstance(content, str)
+    pattern = TOKEN_PATTERN if is_text else TOKEN_PATTERN_BYTES
+    nested_pattern = NESTED_TOKEN_PATTERN if is_text else NESTED_TOKEN_PATTERN_BYTES
+    template_text = TEMPLATE_TEXT_PATTERN if is_text else TEMPLATE_TEXT_PATTERN_BYTES
+    regex_literal = REGEX_LITERAL_PATTERN if is_text else REGEX_LITERAL_PATTERN_BYTES
+    opening, open_brace = ('${', '{') if is_text else (b'${', b'{')
+    # Chaves abertas dentro de cada ${...} pendente, do mais externo ao atual
+    substitutions = []
+    pos = start
+
+    while pos < end:
+        match = (nested_pattern if substitutions else pattern).search(content, pos, end)
+        if match is None:
+            return
+        pos = match.end()
+        kind = match.lastgroup
+
+        if kind == 'template':
+            if content[pos - 2:pos] == opening:
+                substitutions.append(0)
+        elif kind == 'brace':
+            if content[match.start():pos] == open_brace:
+                substitutions[-1] += 1
+            elif substitutions[-1]:
+                substitutions[-1] -= 1
+            else:
+                # "}" que fecha o ${...}: o template continua até "`" ou outro "${"
+                substitutions.pop()
+                pos = template_text.match(content, pos, end).end()
+                if content[pos - 2:pos] == opening:
+                    substitutions.append(0)
+        elif kind == 'slash':
+            if _regex_allowed(content, match.start(), start):
+                literal = regex_literal.match(content, match.start(), end)
+                if literal is not None:
+                    pos = literal.end()
+        elif kind in ('decl', 'ident'):
+            yield match
+
+
+def _regex_allowed(content, pos, start):
+    """Decide, pelo que precede a "/" em content[pos], se ela abre uma regex"""
+    while pos > start and content[pos - 1:pos].isspace():
+        pos -= 1
+    tail = content[max(start, pos - 16):pos]
+    if not isinstance(tail, str):
+        tail = tail.decode('latin-1')
+    if not tail or tail[-1] in REGEX_PRECEDING_PUNCTUATION:
+        return True
+    word = re.search(r'[\w$]+$', tail)
+    return word is not None and word.group() in REGEX_PRECEDING_KEYWORDS
+
+
+def peak_memory_kb():
+    """Pico de memória residente do processo em KB (None se indisponível)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class Span:
+    """Intervalo medido: tempo de parede e bytes lidos/gravados"""
+
+    def __init__(self, name, category, start):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.end = None
+        self.thread_id = threading.get_ident()
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    @property
+    def seconds(self):
+        return (self.end or time.perf_counter()) - self.start
+
+    def to_dict(self, origin):
+        return {
+            'name': self.name,
+            'category': self.category,
+            'start': self.start - origin,
+            'seconds': self.seconds,
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written
+        }
+
+
+class Instrumentation:
+    """Coleta tempos, bytes e pico de memória por fase e por módulo"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name, category='phase'):
+        """Mede o bloco; leituras/gravações dentro dele são atribuídas ao span"""
+        current = Span(name, category, time.perf_counter())
+        stack = self._local.__dict__.setdefault('stack', [])
+        stack.append(current)
+        try:
+            yield current
+        finally:
+            current.end = time.perf_counter()
+            stack.pop()
+            with self._lock:
+                self.spans.append(current)
+
+    def _current(self):
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1] if stack else None
+
+    def record_read(self, size):
+        current = self._current()
+        if current is not None:
+            current.bytes_read += size
+
+    def record_write(self, size):
+        current = self._current()
+        if current is not None:
+            current.bytes_written += size
+
+    def to_json(self):
+        """Resumo por fase e por módulo, pronto para dashboards"""
+        spans = sorted(self.spans, key=lambda span: span.start)
+        return {
+            'total_seconds': time.perf_counter() - self.origin,
+            'peak_memory_kb': peak_memory_kb(),
+            'bytes_read': sum(span.bytes_read for span in spans),
+            'bytes_written': sum(span.bytes_written for span in spans),
+            'phases': [span.to_dict(self.origin) for span in spans if span.category == 'phase'],
+            'modules': {
+                span.name: span.to_dict(self.origin)
+                for span in spans if span.category == 'module'
+            }
+        }
+
+    def to_chrome_trace(self):
+        """Eventos no formato Trace Event (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        events = [
+            {
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': (span.start - self.origin) * 1e6,
+                'dur': span.seconds * 1e6,
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': {'bytes_read': span.bytes_read, 'bytes_written': span.bytes_written}
+            }
+            for span in sorted(self.spans, key=lambda span: span.start)
+        ]
+        return {'traceEvents': events, 'otherData': {'peak_memory_kb': peak_memory_kb()}}
+
+    def write(self, file_path, trace_format='json'):
+        """Grava as métricas em JSON ou Chrome trace"""
+        data = self.to_chrome_trace() if trace_format == 'chrome' else self.to_json()
+        atomic_write(file_path, json.dumps(data, indent=2).encode('utf-8'))
+
+
+class ExtractionManifest:
+    """Manifesto com hashes das regiões marcadas e dos arquivos gerados"""
+
+    VERSION = 1
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.inputs = {}
+        self.outputs = {}
+        self.load()
+
+    def load(self):
+        """Carrega o manifesto existente (ignora versões incompatíveis)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') != self.VERSION:
+            return
+        self.inputs = data.get('inputs', {})
+        self.outputs = data.get('outputs', {})
+
+    def save(self):
+        """Grava o manifesto de forma atômica"""
+        data = {
+            'version': self.VERSION,
+            'inputs': self.inputs,
+            'outputs': self.outputs
+        }
+        atomic_write(self.path, json.dumps(data, indent=2, sort_keys=True).encode('utf-8'))
+
+    def is_fresh(self, key, input_hash, output_file):
+        """Indica se a entrada não mudou e a saída gerada continua intacta"""
+        if self.inputs.get(key) != input_hash:
+            return False
+        output_file = Path(output_file)
+        if not output_file.exists():
+            return False
+        return self.outputs.get(key) == content_hash(output_file.read_bytes())
+
+
 class ModuleExtractor:
-    def __init__(self, source_file='card-creator-com-marcacoes.html'):
+    def __init__(self, source_file='card-creator-com-marcacoes.html', project_root=None, stream=None,
+                 streaming=False, workers=None, quiet=False, minify=False, precompress=False,
+                 fingerprint=False, critical_css=False, split=False):
         self.source_file = source_file
-        self.project_root = Path.cwd()
+        self.minify = minify
+        # Pontos de divisão (loadChunk) viram import() de chunks sob demanda
+        self.split = split
+        self.chunks = []
+        self.critical_css = critical_css
+        # CSS crítico inline no <head> (só com critical_css e divisão válida)
+        self.critical_css_content = None
+        self.fingerprint = fingerprint
+        # Caminho lógico → nome final com hash (só com fingerprint)
+        self.output_names = {}
+        self.size_report = []
+        self.precompress = precompress
+        self.compression_report = []
+        self.stream = stream
+        self.quiet = quiet
+        self.metrics = Instrumentation()
+        self.streaming = streaming
+        self.workers = workers
+        self._log_lock = threading.Lock()
+        self._css_hash = None
+        self.project_root = Path(project_root) if project_root else Path.cwd()
         self.src_dir = self.project_root / 'src'
         self.styles_dir = self.project_root / 'styles'
+        self.manifest = ExtractionManifest(self.project_root / '.extract-manifest.json')
+        self.changed_files = []
+        self.skipped_files = []
+        self.extracted_modules = []
+        self.failed_modules = []
         
-        # Mapa de módulos com suas dependências
-        self.modules = {
-            # Utils (sem dependências externas)
-            'src/utils/result.js': {
-                'dependencies': [],
-                'exports': ['Result']
-            },
-            'src/utils/customErrors.js': {
-                'dependencies': [],
-                'exports': ['CardCreatorError', 'LayoutError', 'ValidationError']
-            },
-            'src/utils/simpleObservable.js': {
-                'dependencies': [],
-                'exports': ['SimpleObservable']
-            },
-            'src/utils/debouncer.js': {
-                'dependencies': [],
-                'exports': ['Debouncer']
-            },
-            'src/utils/constants.js': {
-                'dependencies': [],
-                'exports': ['SCALE_OPTIONS']
-            },
-            
-            # Plugins (dependem de utils)
-            'src/plugins/blockPlugin.js': {
-                'dependencies': ['../utils/result.js'],
-                'exports': ['BlockPlugin']
-            },
-            'src/plugins/pluginRegistry.js': {
-                'dependencies': ['./blockPlugin.js', '../utils/result.js'],
-                'exports': ['BlockPluginRegistry']
-            },
-            'src/plugins/textBlockPlugin.js': {
-                'dependencies': ['./blockPlugin.js', '../utils/result.js', '../utils/customErrors.js'],
-                'exports': ['TextBlockPlugin']
-            },
-            'src/plugins/imageBlockPlugin.js': {
-                'dependencies': ['./blockPlugin.js', '../utils/result.js', '../utils/customErrors.js'],
-                'exports': ['ImageBlockPlugin']
-            },
-            
-            # Analysis
-            'src/analysis/contentAnalyzer.js': {
-                'dependencies': [],
-                'exports': ['ContentAnalyzer']
-            },
-            
-            # Layout (dependem de analysis, utils)
-            'src/layout/layoutComposer.js': {
-                'dependencies': ['../utils/result.js', '../utils/customErrors.js'],
-                'exports': ['LayoutComposer']
-            },
-            'src/layout/layoutOptimizer.js': {
-                'dependencies': ['../utils/result.js', '../utils/customErrors.js'],
-                'exports': ['LayoutOptimizer']
-            },
-            'src/layout/adaptiveLayoutComposer.js': {
-                'dependencies': [
-                    '../analysis/contentAnalyzer.js',
-                    './layoutComposer.js',
-                    './layoutOptimizer.js',
-                    '../plugins/pluginRegistry.js',
-                    '../utils/result.js',
-                    '../utils/customErrors.js'
-                ],
-                'exports': ['LayoutStrategy', 'TextOptimizedStrategy', 'MixedContentStrategy', 'BalancedStrategy', 'AdaptiveLayoutComposer']
-            },
-            
-            # Renderer
-            'src/renderer/enhancedLayoutRenderer.js': {
-                'dependencies': [
-                    '../plugins/textBlockPlugin.js',
-                    '../plugins/imageBlockPlugin.js',
-                    '../plugins/pluginRegistry.js',
-                    '../utils/result.js',
-                    '../utils/customErrors.js'
-                ],
-                'exports': ['EnhancedLayoutRenderer']
-            },
-            
-            # State
-            'src/state/enhancedCardState.js': {
-                'dependencies': [
-                    '../utils/simpleObservable.js',
-                    '../utils/debouncer.js',
-                    '../plugins/textBlockPlugin.js',
-                    '../plugins/imageBlockPlugin.js',
-                    '../plugins/pluginRegistry.js',
-                    '../layout/adaptiveLayoutComposer.js',
-                    '../utils/result.js',
-                    '../utils/customErrors.js'
-                ],
-                'exports': ['EnhancedCardState']
-            },
-            
-            # UI
-            'src/ui/enhancedUIController.js': {
-                'dependencies': [
-                    '../state/enhancedCardState.js',
-                    '../renderer/enhancedLayoutRenderer.js',
-                    '../utils/debouncer.js',
-                    '../utils/constants.js'
-                ],
-                'exports': ['EnhancedUIController']
-            },
-            
-            # App
-            'src/app.js': {
-                'dependencies': ['./ui/enhancedUIController.js'],
-                'exports': []
-            }
-        }
+        # Mapa de módulos (dependências, imports e exports), derivado das
+        # próprias regiões marcadas por build_module_graph
+        self.modules = {}
+        self.graph = None
+        
+        # Sistema de arquivos virtual (virtual_files): estado do último fonte
+        # lido e saídas memoizadas por (caminho, hash da região)
+        self._virtual = None
+        self._virtual_memo = {}
+        self._virtual_lock = threading.RLock()
+
+    @property
+    def buffered(self):
+        """Minificação, fingerprint, CSS crítico e split precisam do conteúdo inteiro antes de gravar"""
+        return self.minify or self.fingerprint or self.critical_css or self.split
+
+    def output_name(self, relative_path):
+        """Nome final de um arquivo gerado (com hash se foi gravado com fingerprint)"""
+        return self.output_names.get(relative_path, relative_path)
+
+    def write_fingerprinted(self, relative_path, content, input_hash=None):
+        """Grava o arquivo com o hash do conteúdo no nome e registra o mapeamento"""
+        output_path = fingerprint_path(relative_path, content)
+        self.output_names[relative_path] = output_path
+        if input_hash is not None:
+            self.manifest.inputs[relative_path] = input_hash
+        return self.write_output(output_path, content)
+
+    def _log(self, message):
+        """Escreve uma linha de progresso no stream configurado (padrão: stdout)"""
+        if self.quiet:
+            return
+        with self._log_lock:
+            (self.stream or sys.stdout).write(f"{message}\n")
 
     def setup_directories(self):
         """Cria a estrutura de diretórios"""
-        print("📁 Criando estrutura de diretórios...")
-        
-        directories = [
-            'src/utils',
-            'src/plugins', 
-            'src/analysis',
-            'src/layout',
-            'src/renderer',
-            'src/state',
-            'src/ui',
-            'styles'
-        ]
+        self._log("📁 Criando estrutura de diretórios...")
+        
+        directories = sorted({posixpath.dirname(path) for path in self.modules}) + ['styles']
         
         for dir_path in directories:
             (self.project_root / dir_path).mkdir(parents=True, exist_ok=True)
-            print(f"   ✓ {dir_path}")
+            self._log(f"   ✓ {dir_path}")
 
-    def backup_original(self):
-        """Cria backup do arquivo marcado"""
-        if Path(self.source_file).exists():
-            backup_name = f"{self.source_file}.backup"
-            shutil.copy2(self.source_file, backup_name)
-            print(f"🔒 Backup criado: {backup_name}")
+    def write_output(self, relative_path, content, input_hash=None):
+        """Grava um arquivo gerado apenas se os bytes mudaram"""
+        data = content.encode('utf-8')
+        file_path = self.project_root / relative_path
+        
+        if file_path.exists() and file_path.read_bytes() == data:
+            self.skipped_files.append(relative_path)
+            written = False
+        else:
+            atomic_write(file_path, data)
+            self.metrics.record_write(len(data))
+            self.changed_files.append(relative_path)
+            written = True
+        
+        self.write_precompressed(relative_path, data, written)
+        self.manifest.outputs[relative_path] = content_hash(data)
+        if input_hash is not None:
+            self.manifest.inputs[relative_path] = input_hash
+        return written
+
+    def write_output_stream(self, relative_path, chunks, input_hash=None):
+        """Grava um arquivo gerado a partir de blocos (bytes/memoryview) sem montá-lo em memória"""
+        file_path = self.project_root / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        
+        fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.")
+        try:
+            size = 0
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    size += f.write(chunk)
+            
+            output_hash = digest.hexdigest()
+            if file_path.exists() and file_hash(file_path) == output_hash:
+                os.unlink(tmp_path)
+                self.skipped_files.append(relative_path)
+                written = False
+            else:
+                replace_file(tmp_path, file_path)
+                self.metrics.record_write(size)
+                self.changed_files.append(relative_path)
+                written = True
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        
+        self.write_precompressed(relative_path, file_path.read_bytes() if self.precompress else None, written)
+        self.manifest.outputs[relative_path] = output_hash
+        if input_hash is not None:
+            self.manifest.inputs[relative_path] = input_hash
+        return written
+
+    def write_precompressed(self, relative_path, data, source_changed):
+        """Grava o irmão .gz (gzip nível 9) quando o arquivo gerado mudou
+        
+        Sem --gzip, um .gz de uma execução anterior é removido: o serve.py
+        prefere o irmão comprimido e serviria o conteúdo antigo.
+        """
+        if Path(relative_path).suffix not in PRECOMPRESS_SUFFIXES:
+            return
+        
+        gz_path = self.project_root / f'{relative_path}.gz'
+        if not self.precompress:
+            if gz_path.exists():
+                gz_path.unlink()
+                self._log(f"   🗑️  {relative_path}.gz removido (sem --gzip)")
+            return
+        if not source_changed and gz_path.exists():
+            return
+        
+        # mtime=0 torna o .gz determinístico (mesma entrada, mesmos bytes)
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        atomic_write(gz_path, compressed)
+        self.metrics.record_write(len(compressed))
+        self.compression_report.append((relative_path, len(data), len(compressed)))
+
+    def minify_output(self, relative_path, content, minifier):
+        """Minifica um arquivo gerado registrando o tamanho antes/depois"""
+        minified = minifier(content)
+        self.size_report.append(
+            (relative_path, len(content.encode('utf-8')), len(minified.encode('utf-8')))
+        )
+        return minified
+
+    def backup_original(self, content):
+        """Cria backup do arquivo marcado (somente quando o fonte mudou)
+        
+        O backup fica na raiz de saída, então o lote não escreve no diretório de entrada.
+        """
+        if not Path(self.source_file).exists():
+            return
+        
+        backup_name = self.project_root / f"{Path(self.source_file).name}.backup"
+        source_hash = content_hash(content)
+        if backup_name.exists() and self.manifest.inputs.get('__source__') == source_hash:
+            self._log(f"🔒 Backup já atualizado: {backup_name}")
+            return
+        
+        self.project_root.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(self.source_file, backup_name)
+        self.metrics.record_write(os.path.getsize(backup_name))
+        self.manifest.inputs['__source__'] = source_hash
+        self._log(f"🔒 Backup criado: {backup_name}")
 
     def read_source_file(self):
-        """Lê o arquivo fonte com as marcações"""
+        """Lê o arquivo fonte com as marcações (mmap somente-leitura no modo streaming)"""
         try:
+            if self.streaming:
+                with open(self.source_file, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size == 0:
+                        return None
+                    self.metrics.record_read(size)
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
             with open(self.source_file, 'r', encoding='utf-8') as f:
+                self.metrics.record_read(os.fstat(f.fileno()).st_size)
                 return f.read()
         except FileNotFoundError:
-            print(f"❌ Erro: Arquivo '{self.source_file}' não encontrado!")
-            print("   Certifique-se de que o arquivo com marcações está no diretório atual.")
+            self._log(f"❌ Erro: Arquivo '{self.source_file}' não encontrado!")
+            self._log("   Certifique-se de que o arquivo com marcações está no diretório atual.")
             return None
 
     def extract_css(self, content):
         """Extrai CSS para styles/main.css"""
-        print("🎨 Extraindo CSS...")
+        self._log("🎨 Extraindo CSS...")
         
-        css_pattern = r'<style>(.*?)</style>'
-        css_match = re.search(css_pattern, content, re.DOTALL)
+        if not isinstance(content, str) and not self.buffered:
+            return self._extract_css_streaming(content)
         
-        if css_match:
-            css_content = css_match.group(1).strip()
-            css_file = self.styles_dir / 'main.css'
-            
-            with open(css_file, 'w', encoding='utf-8') as f:
-                f.write(css_content)
-            
-            print(f"   ✓ styles/main.css criado ({len(css_content)} chars)")
+        css_content = self.build_css(content)
+        
+        if css_content is not None:
+            if self.fingerprint:
+                written = self.write_fingerprinted('styles/main.css', css_content)
+            else:
+                written = self.write_output('styles/main.css', css_content)
+            if written:
+                self._log(f"   ✓ {self.output_name('styles/main.css')} criado ({len(css_content)} chars)")
+            else:
+                self._log("   ⏭️  styles/main.css sem alterações")
             return True
         
-        print("   ❌ CSS não encontrado")
+        self._log("   ❌ CSS não encontrado")
         return False
 
-    def extract_module(self, content, module_path):
-        """Extrai um módulo específico usando as marcações"""
-        print(f"⚙️  Extraindo {module_path}...")
+    def build_css(self, content):
+        """CSS final de styles/main.css (dividido/minificado conforme as opções) ou None"""
+        pattern = CSS_PATTERN if isinstance(content, str) else CSS_PATTERN_BYTES
+        css_match = pattern.search(content)
+        if not css_match:
+            return None
+        
+        self._css_hash = content_hash(css_match.group(1))
+        css_content = css_match.group(1)
+        if not isinstance(css_content, str):
+            css_content = css_content.decode('utf-8')
+        css_content = css_content.strip()
+        if self.critical_css:
+            css_content = self.split_critical_css(css_content)
+        if self.minify:
+            css_content = self.minify_output('styles/main.css', css_content, minify_css)
+        return css_content
+
+    def _extract_css_streaming(self, buffer):
+        """Extrai o CSS gravando a fatia do mmap diretamente"""
+        css_match = CSS_PATTERN_BYTES.search(buffer)
+        if not css_match:
+            self._log("   ❌ CSS não encontrado")
+            return False
+        
+        self._css_hash = content_hash(memoryview(buffer)[slice(*css_match.span(1))])
+        start, end = strip_bounds(buffer, *css_match.span(1))
+        if self.write_output_stream('styles/main.css', [memoryview(buffer)[start:end]]):
+            self._log(f"   ✓ styles/main.css criado ({end - start} bytes)")
+        else:
+            self._log("   ⏭️  styles/main.css sem alterações")
+        return True
+
+    def split_critical_css(self, css_content):
+        """Separa as regras usadas pelo template do index.html; retorna o CSS restante"""
+        critical, rest, report = split_css(css_content, self.render_index_html([], []))
+        if not report['complete']:
+            # Nunca publica uma divisão que perca ou duplique regras
+            self._log("   ❌ Divisão do CSS crítico não reproduz as regras originais; "
+                      "mantendo um único stylesheet")
+            self.critical_css_content = None
+            return css_content
+        
+        if self.minify:
+            critical = self.minify_output('index.html (CSS crítico)', critical, minify_css)
+        self.critical_css_content = critical
+        self._log(f"   ✂️  CSS crítico: {report['critical_rules']} regras, "
+                  f"{report['critical_bytes']} bytes inline; restante: {report['rest_rules']} regras, "
+                  f"{report['rest_bytes']} bytes assíncronos (de {report['original_bytes']} bytes)")
+        return rest
+
+    def stylesheet_tags(self, href):
+        """Tags do <head> para o CSS: bloqueante, ou crítico inline + restante assíncrono"""
+        if self.critical_css_content is None:
+            return [
+                f'<link rel="preload" href="{href}" as="style">',
+                f'<link rel="stylesheet" href="{href}">'
+            ]
+        return [
+            f'<style>\n{self.critical_css_content}\n    </style>',
+            f'<link rel="preload" href="{href}" as="style" '
+            f'onload="this.onload=null;this.rel=\'stylesheet\'">',
+            f'<noscript><link rel="stylesheet" href="{href}"></noscript>'
+        ]
+
+    def build_marker_index(self, content):
+        """Indexa todas as marcações do arquivo em uma única passada"""
+        self._log("🔎 Indexando marcações...")
+        
+        index = MarkerIndex(content)
+        for problem in index.problems:
+            self._log(f"   ⚠️  {problem}")
+        
+        self._log(f"   ✓ {len(index)} regiões encontradas")
+        return index
+
+    def module_input_hash(self, content, module_path, region):
+        """Hash da região marcada somado ao mapa de imports/exports do módulo e à versão do gerador"""
+        start, end = region
+        if isinstance(content, str):
+            region_bytes = content[start:end].encode('utf-8')
+        else:
+            region_bytes = memoryview(content)[start:end]
+        digest = hashlib.sha256(f'generator:{GENERATOR_VERSION}\n'.encode('utf-8'))
+        digest.update(region_bytes)
+        digest.update(json.dumps(self.modules.get(module_path, {}), sort_keys=True).encode('utf-8'))
+        digest.update(b'minify' if self.minify else b'')
+        digest.update(b'gzip' if self.precompress else b'')
+        return digest.hexdigest()
+
+    def build_module_graph(self, content, marker_index):
+        """Deriva dependências, imports e exports das regiões e retorna os níveis topológicos"""
+        self._log("🧭 Derivando grafo de dependências...")
+        
+        graph = ModuleGraph(content, marker_index, split=self.split)
+        levels = graph.levels()
+        self.graph = graph
+        self.modules = graph.module_map()
+        if self.split:
+            self.chunks = graph.chunks(ENTRY_MODULE, levels)
+        for problem in graph.problems:
+            self._log(f"   ⚠️  {problem}")
         
-        # Padrão para encontrar o bloco marcado
-        start_marker = f"===== CORTE: {module_path} - INÍCIO ====="
-        end_marker = f"===== CORTE: {module_path} - FIM ====="
+        self._log(f"   ✓ {len(self.modules)} módulos em {len(levels)} níveis")
+        if self.split:
+            self._log(f"   ✓ {len(graph.split_points)} pontos de divisão, {len(self.chunks)} chunks")
+        return levels
+
+    def extract_level(self, content, level, marker_index):
+        """Extrai em paralelo os módulos independentes de um nível do grafo"""
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(
+                lambda module_path: self.extract_module(content, module_path, marker_index),
+                level
+            ))
+        
+        for module_path, success in zip(level, results):
+            if success:
+                self.extracted_modules.append(module_path)
+            else:
+                self.failed_modules.append(module_path)
+
+    def extract_module(self, content, module_path, marker_index=None):
+        """Extrai um módulo específico usando as marcações"""
+        with self.metrics.span(module_path, 'module'):
+            return self._extract_module(content, module_path, marker_index)
+
+    def _extract_module(self, content, module_path, marker_index):
+        self._log(f"⚙️  Extraindo {module_path}...")
         
-        start_idx = content.find(start_marker)
-        end_idx = content.find(end_marker)
+        if marker_index is None:
+            marker_index = MarkerIndex(content)
         
-        if start_idx == -1 or end_idx == -1:
-            print(f"   ❌ Marcações não encontradas para {module_path}")
+        region = marker_index.get(module_path)
+        if region is None:
+            self._log(f"   ❌ Marcações não encontradas para {module_path}")
             return False
         
         # Extrai o conteúdo entre as marcações
-        start_content = start_idx + len(start_marker)
-        extracted_content = content[start_content:end_idx].strip()
+        start_content, end_idx = region
+        self.metrics.record_read(end_idx - start_content)
+        if not isinstance(content, str) and not self.buffered:
+            return self._extract_module_streaming(content, module_path, region)
+        region_content = region_text(content, region)
         
-        if not extracted_content:
-            print(f"   ❌ Conteúdo vazio para {module_path}")
-            return False
+        # Pula módulos cuja região, dependências e exports não mudaram. Com
+        # fingerprint os imports dependem dos hashes das dependências, então o
+        # módulo é sempre regerado (a gravação ainda é pulada se o nome existe)
+        input_hash = self.module_input_hash(content, module_path, region)
+        if not self.fingerprint and self.manifest.is_fresh(
+                module_path, input_hash, self.project_root / module_path):
+            self.skipped_files.append(module_path)
+            self._log(f"   ⏭️  {module_path} sem alterações")
+            return True
         
+        try:
+            final_content = self.build_module_content(region_content, module_path)
+        except ExtractionError as error:
+            self._log(f"   ❌ {error}")
+            return False
+
+        # Salva o arquivo
+        if self.fingerprint:
+            written = self.write_fingerprinted(module_path, final_content, input_hash)
+        else:
+            written = self.write_output(module_path, final_content, input_hash)
+        if written:
+            lines_count = final_content.count('\n') + 1
+            self._log(f"   ✓ {self.output_name(module_path)} criado ({lines_count} linhas)")
+        else:
+            self._log(f"   ⏭️  {module_path} sem alterações")
+        return True
+
+    def build_module_content(self, region_content, module_path):
+        """Conteúdo final de um módulo a partir do texto da sua região (sem gravar)"""
+        extracted_content = trim_region(region_content)
+
+        if not extracted_content:
+            raise ExtractionError(f"Conteúdo vazio para {module_path}")
+
         # Remove indentação excessiva
+        cleaned_content = self.dedent(extracted_content)
+
+        # Gera imports e exports
+        final_content = self.generate_module_content(
+            cleaned_content, self.modules.get(module_path, {}), module_path)
+
+        if self.minify:
+            final_content = self.minify_output(module_path, final_content, minify_js)
+        return final_content
+
+    def dedent(self, extracted_content):
+        """Remove a indentação comum das linhas do módulo"""
         lines = extracted_content.split('\n')
         if lines:
             # Encontra a menor indentação não-vazia
@@ -223,99 +1202,134 @@ class ModuleExtractor:
             if min_indent != float('inf'):
                 lines = [line[min_indent:] if len(line) > min_indent else line for line in lines]
         
-        cleaned_content = '\n'.join(lines)
-        
-        # Gera imports e exports
+        return '\n'.join(lines)
+
+    def _extract_module_streaming(self, buffer, module_path, region):
+        """Extrai um módulo direto do mmap, gravando fatias sem montar o conteúdo"""
         module_info = self.modules.get(module_path, {})
-        final_content = self.generate_module_content(cleaned_content, module_info)
         
-        # Salva o arquivo
-        file_path = self.project_root / module_path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        input_hash = self.module_input_hash(buffer, module_path, region)
+        if self.manifest.is_fresh(module_path, input_hash, self.project_root / module_path):
+            self.skipped_files.append(module_path)
+            self._log(f"   ⏭️  {module_path} sem alterações")
+            return True
+        
+        start, end = trim_bounds(buffer, *region)
+        if start == end:
+            self._log(f"   ❌ Conteúdo vazio para {module_path}")
+            return False
+        
+        # Primeira passada: menor indentação entre as linhas não-vazias
+        min_indent = None
+        for line_start, line_end in iter_line_bounds(buffer, start, end):
+            indent = INDENT_PATTERN_BYTES.match(buffer, line_start, line_end).end() - line_start
+            if line_start + indent < line_end:
+                min_indent = indent if min_indent is None else min(min_indent, indent)
+        min_indent = min_indent or 0
+        
+        marker = ExportMarker(module_info.get('exports', []))
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(final_content)
+        line_count = 0
+        
+        def chunks():
+            nonlocal line_count
+            view = memoryview(buffer)
+            import_lines = self.generate_import_lines(module_info, module_path)
+            for import_line in import_lines:
+                yield f"{import_line}\n".encode('utf-8')
+                line_count += 1
+            if import_lines:
+                yield b'\n'
+                line_count += 1
+            
+            first = True
+            for line_start, line_end in iter_line_bounds(buffer, start, end):
+                if not first:
+                    yield b'\n'
+                first = False
+                line_count += 1
+                if line_end - line_start > min_indent:
+                    line_start += min_indent
+                rewritten = marker.apply_line(buffer, line_start, line_end) if marker.exports else None
+                yield view[line_start:line_end] if rewritten is None else rewritten
+            
+            if marker.exports:
+                marker.check(module_path)
+                yield b'\n'
+                line_count += 1
+        
+        try:
+            written = self.write_output_stream(module_path, chunks(), input_hash)
+        except ExtractionError as error:
+            self._log(f"   ❌ {error}")
+            return False
         
-        lines_count = len(final_content.split('\n'))
-        print(f"   ✓ {module_path} criado ({lines_count} linhas)")
+        if written:
+            self._log(f"   ✓ {module_path} criado ({line_count} linhas)")
+        else:
+            self._log(f"   ⏭️  {module_path} sem alterações")
         return True
 
-    def generate_module_content(self, extracted_content, module_info):
+    def import_specifier(self, module_path, dep):
+        """Especificador do import de `dep`, apontando para o nome com hash se houver"""
+        if not self.fingerprint:
+            return dep
+        base_dir = posixpath.dirname(module_path)
+        target = self.output_name(posixpath.normpath(posixpath.join(base_dir, dep)))
+        specifier = posixpath.relpath(target, base_dir or '.')
+        return specifier if specifier.startswith('../') else f'./{specifier}'
+
+    def generate_import_lines(self, module_info, module_path=''):
+        """Gera um import por dependência com apenas os símbolos usados"""
+        return [
+            f"import {{ {', '.join(names)} }} from '{self.import_specifier(module_path, dep)}';"
+            for dep, names in module_info.get('imports', {}).items()
+        ]
+
+    def dynamic_import(self, module_path, match, lazy):
+        """import() equivalente a uma chamada loadChunk() do módulo"""
+        dep = relative_import(module_path, match.group('path'))
+        if dep not in lazy:
+            return match.group(0)
+        return dynamic_import_expression(self.import_specifier(module_path, dep), match.group('name'))
+
+    def generate_module_content(self, extracted_content, module_info, module_path=''):
         """Gera o conteúdo final do módulo com imports e exports"""
-        lines = []
+        parts = []
         
         # Adiciona imports
-        dependencies = module_info.get('dependencies', [])
-        if dependencies:
-            for dep in dependencies:
-                # Determina o que importar baseado no caminho
-                import_name = self.get_import_name_from_path(dep)
-                lines.append(f"import {{ {import_name} }} from '{dep}';")
-            lines.append('')  # Linha em branco após imports
-        
-        # Adiciona o conteúdo extraído
-        lines.append(extracted_content)
-        
-        # Adiciona exports se necessário
+        import_lines = self.generate_import_lines(module_info, module_path)
+        if import_lines:
+            parts.append('\n'.join(import_lines))
+            parts.append('\n\n')  # Linha em branco após imports
+        
+        # Pontos de divisão viram import() do módulo, baixado só quando usado
+        lazy = module_info.get('lazy')
+        if lazy:
+            extracted_content = LOAD_CHUNK_PATTERN.sub(
+                lambda match: self.dynamic_import(module_path, match, lazy), extracted_content)
+        
+        # Marca todos os exports declarados em uma única passada
         exports = module_info.get('exports', [])
         if exports:
-            lines.append('')  # Linha em branco antes dos exports
-            for export in exports:
-                # Se a classe já não tem export, adiciona
-                if f'export class {export}' not in extracted_content:
-                    # Substitui 'class Nome' por 'export class Nome'
-                    content_with_exports = '\n'.join(lines[:-1])  # Remove linha vazia
-                    content_with_exports = re.sub(
-                        rf'\bclass ({export})\b',
-                        r'export class \1',
-                        content_with_exports
-                    )
-                    lines = content_with_exports.split('\n')
-                    lines.append('')  # Linha em branco no final
-                    break
+            marker = ExportMarker(exports)
+            extracted_content = marker.apply(extracted_content)
+            marker.check(module_path)
         
-        return '\n'.join(lines)
-
-    def get_import_name_from_path(self, dep_path):
-        """Determina o que importar baseado no caminho da dependência"""
-        import_map = {
-            '../utils/result.js': 'Result',
-            '../utils/customErrors.js': 'CardCreatorError, LayoutError, ValidationError',
-            '../utils/simpleObservable.js': 'SimpleObservable',
-            '../utils/debouncer.js': 'Debouncer',
-            '../utils/constants.js': 'SCALE_OPTIONS',
-            './blockPlugin.js': 'BlockPlugin',
-            '../plugins/blockPlugin.js': 'BlockPlugin',
-            './pluginRegistry.js': 'BlockPluginRegistry',
-            '../plugins/pluginRegistry.js': 'BlockPluginRegistry',
-            './textBlockPlugin.js': 'TextBlockPlugin',
-            '../plugins/textBlockPlugin.js': 'TextBlockPlugin',
-            './imageBlockPlugin.js': 'ImageBlockPlugin',
-            '../plugins/imageBlockPlugin.js': 'ImageBlockPlugin',
-            '../analysis/contentAnalyzer.js': 'ContentAnalyzer',
-            './layoutComposer.js': 'LayoutComposer',
-            '../layout/layoutComposer.js': 'LayoutComposer',
-            './layoutOptimizer.js': 'LayoutOptimizer',
-            '../layout/layoutOptimizer.js': 'LayoutOptimizer',
-            './adaptiveLayoutComposer.js': 'LayoutStrategy, TextOptimizedStrategy, MixedContentStrategy, BalancedStrategy, AdaptiveLayoutComposer',
-            '../layout/adaptiveLayoutComposer.js': 'AdaptiveLayoutComposer',
-            '../renderer/enhancedLayoutRenderer.js': 'EnhancedLayoutRenderer',
-            '../state/enhancedCardState.js': 'EnhancedCardState',
-            './ui/enhancedUIController.js': 'EnhancedUIController'
-        }
+        parts.append(extracted_content)
+        if exports:
+            parts.append('\n')  # Linha em branco no final
         
-        return import_map.get(dep_path, 'UnknownImport')
+        return ''.join(parts)
 
-    def create_index_html(self):
-        """Cria o novo index.html modular"""
-        print("📄 Criando index.html...")
-        
-        html_content = '''<!DOCTYPE html>
+    def render_index_html(self, head_tags, script_tags):
+        """Monta o index.html com as tags de <head> e de scripts informadas"""
+        template = string.Template('''<!DOCTYPE html>
 <html lang="pt-BR">
 <head>
     <meta charset="UTF-8">
     <title>Card Creator v4.1 - Arquitetura Refatorada</title>
-    <link rel="stylesheet" href="styles/main.css">
+$head
 </head>
 <body>
     <div class="app-container">
@@ -384,18 +1398,61 @@ class ModuleExtractor:
     </div>
     
     <script src="https://cdnjs.cloudflare.com/ajax/libs/Sortable/1.15.0/Sortable.min.js"></script>
-    <script type="module" src="src/app.js"></script>
+$scripts
 </body>
-</html>'''
+</html>''')
+        
+        return template.substitute(
+            head='\n'.join(f'    {tag}' for tag in head_tags),
+            scripts='\n'.join(f'    {tag}' for tag in script_tags)
+        )
+
+    def build_index_html(self):
+        """Conteúdo do index.html modular para o grafo e o CSS atuais"""
+        head_tags = self.stylesheet_tags(self.output_name('styles/main.css'))
         
-        with open(self.project_root / 'index.html', 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Preload de todo o grafo do app.js: o navegador busca todos os módulos
+        # em paralelo em vez de descobrir cada import após o anterior
+        if self.graph is not None and ENTRY_MODULE in self.graph.imports:
+            for module_path, _ in self.graph.reachable(ENTRY_MODULE):
+                head_tags.append(f'<link rel="modulepreload" href="{self.output_name(module_path)}">')
+        else:
+            self._log(f"   ⚠️  {ENTRY_MODULE} fora do grafo; sem modulepreload")
         
-        print("   ✓ index.html criado")
+        return self.render_index_html(
+            head_tags,
+            [f'<script type="module" src="{self.output_name(ENTRY_MODULE)}"></script>']
+        )
+
+    def create_index_html(self):
+        """Cria o novo index.html modular"""
+        self._log("📄 Criando index.html...")
+        
+        if self.write_output('index.html', self.build_index_html()):
+            self._log("   ✓ index.html criado")
+        else:
+            self._log("   ⏭️  index.html sem alterações")
+
+    def write_asset_manifest(self, output_dir=''):
+        """Grava o mapa caminho lógico → nome com hash dos arquivos gerados"""
+        relative_path = posixpath.join(output_dir, ASSET_MANIFEST)
+        self._log(f"🏷️  Gravando {relative_path}...")
+        
+        prefix = f'{output_dir}/' if output_dir else ''
+        assets = {
+            logical[len(prefix):]: output[len(prefix):]
+            for logical, output in sorted(self.output_names.items())
+            if logical.startswith(prefix)
+        }
+        content = json.dumps(assets, indent=2, sort_keys=True) + '\n'
+        if self.write_output(relative_path, content):
+            self._log(f"   ✓ {len(assets)} arquivos com hash")
+        else:
+            self._log(f"   ⏭️  {relative_path} sem alterações")
 
     def create_readme(self):
         """Cria README.md"""
-        print("📚 Criando README.md...")
+        self._log("📚 Criando README.md...")
         
         readme_content = '''# Card Creator v4.1 - Arquitetura Refatorada
 
@@ -440,9 +1497,11 @@ Como a aplicação utiliza Módulos ES6, você precisa de um servidor web local:
 
 ### Opção 2: Python
 ```bash
-python3 -m http.server 8000
+python3 serve.py 8000
 # Acesse http://localhost:8000
 ```
+`serve.py` mantém os arquivos em cache na memória, responde com ETag/304 e
+comprime com gzip, então recarregar a página não baixa tudo de novo.
 
 ### Opção 3: Node.js
 ```bash
@@ -465,96 +1524,738 @@ O sistema é altamente modular e extensível. Para adicionar novos tipos de bloc
 - **Estado Centralizado**: Gerenciamento unificado
 '''
         
-        with open(self.project_root / 'README.md', 'w', encoding='utf-8') as f:
-            f.write(readme_content)
-        
-        print("   ✓ README.md criado")
+        if self.write_output('README.md', readme_content):
+            self._log("   ✓ README.md criado")
+        else:
+            self._log("   ⏭️  README.md sem alterações")
 
     def run_extraction(self):
         """Executa todo o processo de extração"""
-        print("🚀 Iniciando extração modular do Card Creator v4.1")
-        print("=" * 60)
+        self._log("🚀 Iniciando extração modular do Card Creator v4.1")
+        self._log("=" * 60)
         
         # Lê o arquivo fonte
-        content = self.read_source_file()
+        with self.metrics.span('read_source_file'):
+            content = self.read_source_file()
         if not content:
             return False
         
+        try:
+            return self._run_extraction(content)
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+
+    def _run_extraction(self, content):
+        """Etapas da extração sobre o conteúdo já carregado (str ou mmap)"""
+        span = self.metrics.span
+        
+        # Indexa todas as marcações uma única vez e deriva o grafo de imports
+        with span('build_marker_index'):
+            marker_index = self.build_marker_index(content)
+        with span('build_module_graph'):
+            levels = self.build_module_graph(content, marker_index)
+        if not self.modules:
+            self._log("❌ Nenhuma marcação CORTE encontrada")
+            return False
+        
         # Setup inicial
-        self.backup_original()
-        self.setup_directories()
+        with span('backup_original'):
+            self.backup_original(content)
+        with span('setup_directories'):
+            self.setup_directories()
         
         # Extrai CSS
-        self.extract_css(content)
-        
-        # Extrai módulos na ordem correta (dependências primeiro)
-        extraction_order = [
-            # Utils primeiro (sem dependências)
-            'src/utils/result.js',
-            'src/utils/customErrors.js',
-            'src/utils/simpleObservable.js',
-            'src/utils/debouncer.js', 
-            'src/utils/constants.js',
-            
-            # Plugins (dependem de utils)
-            'src/plugins/blockPlugin.js',
-            'src/plugins/pluginRegistry.js',
-            'src/plugins/textBlockPlugin.js',
-            'src/plugins/imageBlockPlugin.js',
+        with span('extract_css'):
+            self.extract_css(content)
+        
+        # Extrai módulos nível a nível (dependências primeiro); módulos do
+        # mesmo nível são independentes e extraídos em paralelo
+        with span('extract_modules'):
+            for level in levels:
+                self.extract_level(content, level, marker_index)
+        extracted_count = len(self.extracted_modules)
+        
+        # Cria arquivos auxiliares
+        with span('create_index_html'):
+            self.create_index_html()
+        if self.fingerprint:
+            with span('write_asset_manifest'):
+                self.write_asset_manifest()
+        with span('create_readme'):
+            self.create_readme()
+        
+        # Persiste os hashes para a próxima execução
+        with span('save_manifest'):
+            self.manifest.save()
+        
+        self._log("=" * 60)
+        self._log("✅ Extração concluída!")
+        self._log(f"📦 {extracted_count} módulos extraídos com sucesso")
+        self._log("📁 Estrutura modular criada")
+        self.print_change_summary()
+        if self.split:
+            self.print_chunk_report({
+                chunk['name']: sum(self._output_size(module_path) for module_path in chunk['modules'])
+                for chunk in self.chunks
+            })
+        self._log('')
+        self._log("🧪 Para testar:")
+        self._log("   1. Execute um servidor local (Live Server, Python, etc.)")
+        self._log("   2. Abra index.html no navegador")
+        self._log("   3. Verifique se os blocos aparecem corretamente")
+        
+        return True
+
+    def build_bundle(self, content, marker_index, levels):
+        """Concatena os módulos em ordem topológica em um único escopo (scope hoisting)"""
+        parts = [
+            '// Card Creator v4.1 - bundle de produção gerado por extraction_script.py',
+            '(() => {',
+            '"use strict";',
+            ''
+        ]
+        
+        for level in levels:
+            for module_path in level:
+                code = self.dedent(trim_region(region_text(content, marker_index.get(module_path))))
+                # Num único escopo os exports viram declarações comuns
+                code = DECLARATION_PATTERN.sub(lambda match: match.group('decl'), code)
+                parts.extend([f'// --- {module_path} ---', code, ''])
+        
+        parts.append('})();\n')
+        return '\n'.join(parts)
+
+    def chunk_file(self, output_dir, chunk):
+        """Caminho lógico do arquivo de um chunk do bundle dividido"""
+        if chunk['kind'] == 'entry':
+            return f'{output_dir}/app.bundle.js'
+        return f'{output_dir}/chunk-{chunk["name"]}.js'
+
+    def _chunk_write_order(self, chunk_of, references):
+        """Chunks referenciados antes de quem os referencia (o nome com hash entra no importador)"""
+        order = []
+        visiting = set()
+        
+        def visit(chunk):
+            if chunk['name'] in visiting or chunk in order:
+                return
+            visiting.add(chunk['name'])
+            for name in sorted(references[chunk['name']]):
+                visit(next(other for other in self.chunks if other['name'] == name))
+            order.append(chunk)
+        
+        # O principal é o último: os chunks o importam pelo nome estável app.bundle.js
+        for chunk in self.chunks[1:] + self.chunks[:1]:
+            visit(chunk)
+        return order
+
+    def write_chunked_bundle(self, content, marker_index, output_dir):
+        """Grava o bundle dividido em módulos ES: principal, chunks sob demanda e compartilhados
+        
+        Cada chunk concatena seus módulos em um único escopo (como build_bundle)
+        e importa/exporta só os símbolos que cruzam a fronteira entre chunks.
+        Retorna {nome do chunk: bytes gravados}.
+        """
+        chunk_of = {module_path: chunk for chunk in self.chunks for module_path in chunk['modules']}
+        exports = {chunk['name']: set() for chunk in self.chunks}
+        imports = {chunk['name']: {} for chunk in self.chunks}
+        references = {chunk['name']: set() for chunk in self.chunks}
+        for chunk in self.chunks:
+            for module_path in chunk['modules']:
+                for dep, names in self.graph.imports[module_path].items():
+                    owner = chunk_of[dep]
+                    if owner is not chunk:
+                        exports[owner['name']].update(names)
+                        imports[chunk['name']].setdefault(owner['name'], set()).update(names)
+                for target, names in self.graph.lazy.get(module_path, {}).items():
+                    if target in chunk_of:
+                        exports[chunk_of[target]['name']].update(names)
+                        references[chunk['name']].add(chunk_of[target]['name'])
+            references[chunk['name']].update(imports[chunk['name']])
+            references[chunk['name']].discard(chunk['name'])
+            references[chunk['name']].discard(self.chunks[0]['name'])
+        
+        def chunk_url(name):
+            chunk = next(other for other in self.chunks if other['name'] == name)
+            return './' + posixpath.basename(self.output_name(self.chunk_file(output_dir, chunk)))
+        
+        sizes = {}
+        for chunk in self._chunk_write_order(chunk_of, references):
+            name = chunk['name']
+            parts = [f'// Card Creator v4.1 - chunk {name} gerado por extraction_script.py']
+            for other, names in imports[name].items():
+                parts.append(f"import {{ {', '.join(sorted(names))} }} from '{chunk_url(other)}';")
+            parts.append('')
+            for module_path in chunk['modules']:
+                code = self.dedent(trim_region(region_text(content, marker_index.get(module_path))))
+                code = DECLARATION_PATTERN.sub(lambda match: match.group('decl'), code)
+                code = LOAD_CHUNK_PATTERN.sub(
+                    lambda match: (dynamic_import_expression(chunk_url(chunk_of[match.group('path')]['name']),
+                                                             match.group('name'))
+                                   if match.group('path') in chunk_of else match.group(0)),
+                    code
+                )
+                parts.extend([f'// --- {module_path} ---', code, ''])
+            if exports[name]:
+                parts.append(f"export {{ {', '.join(sorted(exports[name]))} }};\n")
+            code = '\n'.join(parts)
             
-            # Analysis
-            'src/analysis/contentAnalyzer.js',
+            relative_path = self.chunk_file(output_dir, chunk)
+            if self.minify:
+                code = self.minify_output(relative_path, code, minify_js)
+            # O principal mantém o nome: os chunks o importam e ele importa os chunks
+            if self.fingerprint and chunk['kind'] != 'entry':
+                self.write_fingerprinted(relative_path, code)
+            else:
+                self.write_output(relative_path, code)
+            sizes[name] = len(code.encode('utf-8'))
+        return sizes
+
+    def print_chunk_report(self, sizes):
+        """Tamanho de cada chunk e quanto a carga inicial deixa de baixar"""
+        total = sum(sizes.values())
+        initial = sizes.get('main', 0)
+        self._log(f"🧩 Chunks: carga inicial de {initial} de {total} bytes "
+                  f"(-{100 * (1 - initial / max(total, 1)):.1f}% até um ponto de divisão ser usado)")
+        for chunk in self.chunks:
+            count = len(chunk['modules'])
+            if chunk['kind'] == 'entry':
+                origin = 'principal'
+            elif chunk['kind'] == 'lazy':
+                origin = f"sob demanda: {chunk['used_by'][0]}"
+            else:
+                origin = 'compartilhado por ' + ', '.join(
+                    posixpath.basename(point) for point in chunk['used_by'])
+            self._log(f"   {chunk['name']} ({origin}): {count} módulo{'s' if count != 1 else ''}, "
+                      f"{sizes.get(chunk['name'], 0)} bytes")
+
+    def _output_size(self, relative_path):
+        try:
+            return (self.project_root / self.output_name(relative_path)).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def run_bundle(self, output_dir='dist'):
+        """Gera um único bundle de produção com seu próprio index.html"""
+        output_dir = output_dir.strip('/')
+        self._log("📦 Gerando bundle de produção do Card Creator v4.1")
+        self._log("=" * 60)
+        
+        with self.metrics.span('read_source_file'):
+            content = self.read_source_file()
+        if not content:
+            return False
+        
+        try:
+            with self.metrics.span('build_marker_index'):
+                marker_index = self.build_marker_index(content)
+            with self.metrics.span('build_module_graph'):
+                levels = self.build_module_graph(content, marker_index)
+            if not self.modules:
+                self._log("❌ Nenhuma marcação CORTE encontrada")
+                return False
             
-            # Layout (dependem de analysis e utils)
-            'src/layout/layoutComposer.js',
-            'src/layout/layoutOptimizer.js',
-            'src/layout/adaptiveLayoutComposer.js',
+            if self.graph.duplicates:
+                self._log("   ❌ Símbolos duplicados impedem o escopo único do bundle")
+                return False
             
-            # Renderer (depende de plugins)
-            'src/renderer/enhancedLayoutRenderer.js',
+            with self.metrics.span('build_bundle'):
+                if self.split:
+                    chunk_sizes = self.write_chunked_bundle(content, marker_index, output_dir)
+                    bundle = None
+                else:
+                    bundle = self.build_bundle(content, marker_index, levels)
+                css_match = CSS_PATTERN.search(region_text(content, (0, len(content))))
+                css_content = css_match.group(1).strip() if css_match else None
+                if self.critical_css and css_content is not None:
+                    css_content = self.split_critical_css(css_content)
+                if self.minify and bundle is not None:
+                    bundle = self.minify_output(f'{output_dir}/app.bundle.js', bundle, minify_js)
+                    if css_content is not None:
+                        css_content = self.minify_output(f'{output_dir}/main.css', css_content, minify_css)
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+        
+        write = self.write_fingerprinted if self.fingerprint else self.write_output
+        with self.metrics.span('write_bundle'):
+            if bundle is not None:
+                write(f'{output_dir}/app.bundle.js', bundle)
+            head_tags = []
+            if css_content is not None:
+                write(f'{output_dir}/main.css', css_content)
+                css_name = posixpath.basename(self.output_name(f'{output_dir}/main.css'))
+                if self.critical_css_content is None:
+                    head_tags.append(f'<link rel="stylesheet" href="{css_name}">')
+                else:
+                    head_tags.extend(self.stylesheet_tags(css_name))
+            bundle_name = posixpath.basename(self.output_name(f'{output_dir}/app.bundle.js'))
+            # Os chunks são módulos ES: o principal também precisa ser um
+            script_type = ' type="module"' if self.split else ''
+            self.write_output(
+                f'{output_dir}/index.html',
+                self.render_index_html(head_tags, [f'<script{script_type} src="{bundle_name}"></script>'])
+            )
+            if self.fingerprint:
+                self.write_asset_manifest(output_dir)
+            self.manifest.save()
+        
+        bundle_size = chunk_sizes['main'] if bundle is None else len(bundle.encode('utf-8'))
+        self._log(f"   ✓ {self.output_name(f'{output_dir}/app.bundle.js')} ({bundle_size} bytes, "
+                  f"{len(self.modules)} módulos)")
+        self._log(f"   ✓ {output_dir}/index.html")
+        self._log("=" * 60)
+        self.print_change_summary()
+        if self.split:
+            self.print_chunk_report(chunk_sizes)
+        return True
+
+    def _source_signature(self):
+        """Assinatura barata do fonte (mtime, tamanho); None se indisponível"""
+        try:
+            info = os.stat(self.source_file)
+        except FileNotFoundError:
+            return None
+        return info.st_mtime_ns, info.st_size
+
+    def _virtual_state(self):
+        """Relê o fonte se a assinatura mudou; retorna o estado atual ou None"""
+        signature = self._source_signature()
+        if signature is None:
+            return None
+        if self._virtual is not None and self._virtual['signature'] == signature:
+            return self._virtual
+        
+        content = Path(self.source_file).read_text(encoding='utf-8')
+        marker_index = MarkerIndex(content)
+        graph = ModuleGraph(content, marker_index, split=self.split)
+        levels = graph.levels()
+        self.graph = graph
+        self.modules = graph.module_map()
+        
+        # Chave de cada saída: muda só quando o que a gera muda
+        keys = {}
+        css_match = CSS_PATTERN.search(content)
+        if css_match:
+            keys['styles/main.css'] = content_hash(css_match.group(1))
+        for level in levels:
+            for module_path in level:
+                keys[module_path] = self.module_input_hash(
+                    content, module_path, marker_index.get(module_path))
+        keys['index.html'] = content_hash(json.dumps(keys, sort_keys=True))
+        
+        # Descarta saídas de regiões que mudaram ou deixaram de existir
+        self._virtual_memo = {
+            memo_key: output for memo_key, output in self._virtual_memo.items()
+            if keys.get(memo_key[0]) == memo_key[1]
+        }
+        self._virtual = {'signature': signature, 'content': content,
+                         'marker_index': marker_index, 'keys': keys}
+        return self._virtual
+
+    def virtual_file(self, relative_path):
+        """Conteúdo de uma saída gerado em memória, sem gravar; None se não existe
+        
+        Usa os caminhos lógicos (src/..., styles/main.css, index.html): o
+        fingerprint não se aplica ao sistema de arquivos virtual.
+        """
+        with self._virtual_lock:
+            state = self._virtual_state()
+            if state is None:
+                return None
+            key = state['keys'].get(relative_path)
+            if key is None:
+                return None
+            output = self._virtual_memo.get((relative_path, key))
+            if output is not None:
+                return output
             
-            # State (depende de quase tudo)
-            'src/state/enhancedCardState.js',
+            if relative_path == 'styles/main.css':
+                output = self.build_css(state['content'])
+            elif relative_path == 'index.html':
+                # O CSS crítico inline vem da divisão feita ao gerar o CSS
+                self.virtual_file('styles/main.css')
+                output = self.build_index_html()
+            else:
+                region = state['marker_index'].get(relative_path)
+                try:
+                    output = self.build_module_content(
+                        region_text(state['content'], region), relative_path)
+                except ExtractionError as error:
+                    self._log(f"   ❌ {error}")
+                    return None
+            self._virtual_memo[(relative_path, key)] = output
+            return output
+
+    def virtual_files(self):
+        """Gera (caminho, conteúdo) das saídas sob demanda, sem tocar o disco
+        
+        Ordem: styles/main.css, módulos por nível do grafo e index.html. Cada
+        saída só é gerada quando o consumidor chega nela e fica memoizada pelo
+        hash da sua região; uma edição no fonte aparece na próxima leitura.
+        """
+        with self._virtual_lock:
+            state = self._virtual_state()
+            paths = list(state['keys']) if state is not None else []
+        for relative_path in paths:
+            output = self.virtual_file(relative_path)
+            if output is not None:
+                yield relative_path, output
+
+    def refresh(self):
+        """Reindexa o fonte e regenera apenas os módulos cuja região mudou"""
+        content = self.read_source_file()
+        if not content:
+            return []
+        
+        try:
+            marker_index = MarkerIndex(content)
+            graph = ModuleGraph(content, marker_index, split=self.split)
+            levels = graph.levels()
+            # O modulepreload do index.html segue o grafo: compara o que o
+            # app.js alcança (e em que ordem) antes e depois da edição
+            previous_graph, self.graph = self.graph, graph
+            preload_changed = (previous_graph is None
+                               or previous_graph.reachable(ENTRY_MODULE) != graph.reachable(ENTRY_MODULE))
+            removed = [module_path for module_path in self.modules if module_path not in marker_index.regions]
+            self.modules = graph.module_map()
+            for module_path in removed:
+                self.remove_output(module_path)
+            if self.split:
+                self.chunks = graph.chunks(ENTRY_MODULE, levels)
+            for problem in marker_index.problems + graph.problems:
+                self._log(f"   ⚠️  {problem}")
             
-            # UI (depende do state)
-            'src/ui/enhancedUIController.js',
+            pattern = CSS_PATTERN if isinstance(content, str) else CSS_PATTERN_BYTES
+            css_match = pattern.search(content)
+            css_hash = content_hash(css_match.group(1)) if css_match else None
+            css_changed = css_hash != self._css_hash
+            if css_changed:
+                self.extract_css(content)
+                self._css_hash = css_hash
             
-            # App (entry point)
-            'src/app.js'
-        ]
+            changed = [
+                module_path
+                for level in levels
+                for module_path in level
+                if self.manifest.inputs.get(module_path) != self.module_input_hash(
+                    content, module_path, marker_index.get(module_path))
+            ]
+            if self.fingerprint and changed:
+                # Um hash novo muda os imports dos dependentes: regera tudo em
+                # ordem topológica (só os bytes diferentes são gravados)
+                changed = [module_path for level in levels for module_path in level]
+            for module_path in changed:
+                self.extract_module(content, module_path, marker_index)
+            if (preload_changed or removed or (self.fingerprint and changed)
+                    or (css_changed and (self.fingerprint or self.critical_css))):
+                self.create_index_html()
+                if self.fingerprint:
+                    self.write_asset_manifest()
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
         
-        extracted_count = 0
-        for module_path in extraction_order:
-            if self.extract_module(content, module_path):
-                extracted_count += 1
+        self.manifest.save()
+        return changed
+
+    def remove_output(self, relative_path):
+        """Apaga a saída (e o .gz) de uma região que saiu do fonte e a esquece no manifesto"""
+        output_path = self.output_names.pop(relative_path, relative_path)
+        for path in (output_path, f'{output_path}.gz'):
+            try:
+                (self.project_root / path).unlink()
+            except FileNotFoundError:
+                pass
+        self.manifest.inputs.pop(relative_path, None)
+        self.manifest.outputs.pop(relative_path, None)
+        self.manifest.outputs.pop(output_path, None)
+        self._log(f"   🗑️  {relative_path} removido (região não existe mais)")
+
+    def watch(self, interval=0.02, debounce=0.02):
+        """Observa o fonte marcado e reextrai as regiões editadas a cada gravação
         
-        # Cria arquivos auxiliares
-        self.create_index_html()
-        self.create_readme()
-        
-        print("=" * 60)
-        print(f"✅ Extração concluída!")
-        print(f"📦 {extracted_count} módulos extraídos com sucesso")
-        print(f"📁 Estrutura modular criada")
-        print()
-        print("🧪 Para testar:")
-        print("   1. Execute um servidor local (Live Server, Python, etc.)")
-        print("   2. Abra index.html no navegador")
-        print("   3. Verifique se os blocos aparecem corretamente")
+        interval é o período de polling e debounce a espera até o arquivo parar
+        de mudar (segundos); com os padrões uma gravação é vista em 40-60 ms.
+        """
+        self.run_extraction()
+        last_signature = self._source_signature()
         
-        return True
+        self._log('')
+        self._log(f"👀 Observando {self.source_file} (Ctrl+C para sair)")
+        try:
+            while True:
+                time.sleep(interval)
+                signature = self._source_signature()
+                if signature is None or signature == last_signature:
+                    continue
+                
+                # Debounce: espera o arquivo parar de mudar (uma gravação pode
+                # gerar vários eventos de escrita)
+                while True:
+                    time.sleep(debounce)
+                    settled = self._source_signature()
+                    if settled == signature:
+                        break
+                    signature = settled
+                if signature is None:
+                    continue
+                last_signature = signature
+                
+                started = time.perf_counter()
+                try:
+                    changed = self.refresh()
+                except (UnicodeDecodeError, OSError) as error:
+                    # Gravação pela metade: a próxima gravação completa muda a assinatura
+                    self._log(f"⚠️  Falha ao ler {self.source_file} ({error}); aguardando a próxima gravação")
+                    continue
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                if changed:
+                    self._log(f"🔁 {len(changed)} módulos regenerados em {elapsed_ms:.1f} ms")
+                else:
+                    self._log(f"🔁 Nenhuma região alterada ({elapsed_ms:.1f} ms)")
+        except KeyboardInterrupt:
+            self._log("👋 Observação encerrada")
+
+    def print_change_summary(self):
+        """Mostra o que foi regenerado e o que foi mantido"""
+        self._log(f"📊 {len(self.changed_files)} arquivos alterados, "
+              f"{len(self.skipped_files)} sem alterações")
+        for relative_path in self.changed_files:
+            self._log(f"   ✎ {relative_path}")
+        
+        if self.size_report:
+            before_total = sum(before for _, before, _ in self.size_report)
+            after_total = sum(after for _, _, after in self.size_report)
+            self._log(f"📉 Minificação: {before_total} → {after_total} bytes "
+                      f"(-{100 * (1 - after_total / max(before_total, 1)):.1f}%)")
+            for relative_path, before, after in self.size_report:
+                self._log(f"   {relative_path}: {before} → {after} bytes")
+        
+        if self.compression_report:
+            raw_total = sum(raw for _, raw, _ in self.compression_report)
+            gz_total = sum(gz for _, _, gz in self.compression_report)
+            self._log(f"🗜️  Pré-compressão: {len(self.compression_report)} arquivos .gz, "
+                      f"{raw_total} → {gz_total} bytes (razão {gz_total / max(raw_total, 1):.2f})")
+            for relative_path, raw, gz in self.compression_report:
+                self._log(f"   {relative_path}.gz: {raw} → {gz} bytes ({gz / max(raw, 1):.2f})")
+
+def _extract_source(source_file, project_root, extractor_options, bundle=False):
+    """Executa a extração (ou o bundle) de um arquivo marcado (usado pelos workers do lote)"""
+    log = io.StringIO()
+    result = {
+        'source': str(source_file),
+        'output_root': str(project_root),
+        'success': False,
+        'extracted': 0,
+        'failed': 0,
+        'error': None
+    }
+    try:
+        extractor = ModuleExtractor(source_file, project_root, stream=log, **extractor_options)
+        if bundle:
+            result['success'] = extractor.run_bundle()
+            result['extracted'] = len(extractor.modules) if result['success'] else 0
+        else:
+            result['success'] = extractor.run_extraction()
+            result['extracted'] = len(extractor.extracted_modules)
+        result['failed'] = len(extractor.failed_modules)
+        result['metrics'] = extractor.metrics.to_json()
+        result['trace'] = extractor.metrics.to_chrome_trace()['traceEvents']
+        if extractor.graph is not None and not extractor.modules:
+            result['error'] = "nenhuma marcação CORTE encontrada"
+    except Exception as error:
+        result['error'] = f"{type(error).__name__}: {error}"
+    result['log'] = log.getvalue()
+    return result
+
+
+def find_marked_sources(pattern):
+    """Resolve um diretório ou glob para a lista de arquivos marcados"""
+    path = Path(pattern)
+    if path.is_dir():
+        return sorted(path.glob('*.html'))
+    return sorted(Path(match) for match in glob.glob(pattern, recursive=True))
 
-def main():
+
+def batch_output_roots(sources, output_dir=None):
+    """Raiz de saída de cada fonte do lote
+    
+    Com output_dir, a raiz espelha o caminho da fonte relativo à raiz comum do
+    lote (a/card.html → <saída>/a/card), então um glob recursivo não junta
+    fontes de mesmo nome; sem ela, fica ao lado da fonte (<dir>/card).
+    """
+    if not sources:
+        return {}
+    common = Path(os.path.commonpath([source.parent for source in sources]))
+    return {
+        source: (Path(output_dir) / source.parent.relative_to(common) if output_dir
+                 else source.parent) / source.stem
+        for source in sources
+    }
+
+
+def run_batch(sources, output_dir=None, workers=None, use_threads=False, quiet=False,
+              bundle=False, **extractor_options):
+    """Extrai vários arquivos marcados em paralelo, um diretório de saída por fonte
+
+    Com bundle, cada fonte gera o bundle de produção em <saída>/dist/.
+    Opções extras (streaming, minify, ...) são repassadas ao ModuleExtractor.
+    """
+    def log(message):
+        if not quiet:
+            print(message)
+    
+    sources = [Path(source).resolve() for source in sources]
+    if not sources:
+        log("❌ Nenhum arquivo marcado encontrado")
+        return []
+    
+    output_roots = batch_output_roots(sources, output_dir)
+    collisions = {}
+    for source, project_root in output_roots.items():
+        collisions.setdefault(project_root, []).append(source)
+    collisions = {root: names for root, names in collisions.items() if len(names) > 1}
+    if collisions:
+        for project_root, names in collisions.items():
+            log(f"❌ {', '.join(map(str, names))} teriam a mesma saída {project_root}")
+        return []
+    
+    executor_class = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    log(f"🚀 Extraindo {len(sources)} arquivos em lote "
+        f"({'threads' if use_threads else 'processos'}: {workers or os.cpu_count()})")
+    log("=" * 60)
+    
+    results = []
+    with executor_class(max_workers=workers) as executor:
+        futures = {}
+        for source, project_root in output_roots.items():
+            futures[executor.submit(_extract_source, source, project_root, extractor_options, bundle)] = source
+        
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result['error']:
+                log(f"   ❌ {result['source']}: {result['error']}")
+            else:
+                status = '✓' if result['success'] and not result['failed'] else '⚠️ '
+                log(f"   {status} {result['source']} → {result['output_root']} "
+                    f"({result['extracted']} ok, {result['failed']} falhas)")
+    
+    results.sort(key=lambda r: r['source'])
+    succeeded = sum(1 for r in results if r['success'] and not r['error'])
+    log("=" * 60)
+    log(f"✅ Lote concluído: {succeeded}/{len(results)} fontes extraídas")
+    return results
+
+
+def write_batch_metrics(results, file_path, trace_format='json'):
+    """Grava as métricas coletadas pelos workers do lote, uma entrada por fonte
+    
+    No Chrome trace cada fonte vira um processo próprio (pid = posição no lote).
+    """
+    if trace_format == 'chrome':
+        events = []
+        for pid, result in enumerate(results, 1):
+            events.append({'name': 'process_name', 'ph': 'M', 'pid': pid,
+                           'args': {'name': result['source']}})
+            events.extend(dict(event, pid=pid) for event in result.get('trace', []))
+        data = {'traceEvents': events, 'otherData': {'peak_memory_kb': peak_memory_kb()}}
+    else:
+        data = {
+            'sources': {result['source']: result.get('metrics') for result in results},
+            'bytes_read': sum(result.get('metrics', {}).get('bytes_read', 0) for result in results),
+            'bytes_written': sum(result.get('metrics', {}).get('bytes_written', 0) for result in results)
+        }
+    atomic_write(file_path, json.dumps(data, indent=2).encode('utf-8'))
+
+
+def parse_args(argv=None):
+    """Interpreta os argumentos de linha de comando"""
+    parser = argparse.ArgumentParser(description="Extração modular do Card Creator")
+    parser.add_argument('source', nargs='?', default='card-creator-com-marcacoes.html',
+                        help="arquivo HTML com as marcações CORTE")
+    parser.add_argument('--batch', metavar='DIR_OU_GLOB',
+                        help="extrai todos os arquivos marcados de um diretório ou glob")
+    parser.add_argument('--output-dir',
+                        help="raiz de saída do lote (um subdiretório por fonte)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="número de workers do lote (padrão: núcleos da CPU)")
+    parser.add_argument('--threads', action='store_true',
+                        help="usa threads em vez de processos no lote")
+    parser.add_argument('--watch', action='store_true',
+                        help="observa o fonte e reextrai só as regiões alteradas")
+    parser.add_argument('--interval', type=float, default=20, metavar='MS',
+                        help="período de polling do --watch em ms (padrão: 20)")
+    parser.add_argument('--debounce', type=float, default=20, metavar='MS',
+                        help="espera do --watch até o fonte parar de mudar, em ms (padrão: 20)")
+    parser.add_argument('--quiet', action='store_true',
+                        help="suprime as mensagens de progresso")
+    parser.add_argument('--metrics', metavar='ARQUIVO',
+                        help="grava tempos, bytes e pico de memória por fase/módulo")
+    parser.add_argument('--metrics-format', choices=['json', 'chrome'], default='json',
+                        help="formato das métricas: resumo JSON ou Chrome trace")
+    parser.add_argument('--minify', action='store_true',
+                        help="minifica os JS e o CSS gerados (relata tamanho antes/depois)")
+    parser.add_argument('--gzip', action='store_true',
+                        help="grava irmãos .gz pré-comprimidos dos .js/.css/.html gerados")
+    parser.add_argument('--bundle', action='store_true',
+                        help="gera um único bundle de produção em dist/ em vez de src/")
+    parser.add_argument('--mmap', action='store_true',
+                        help="lê o fonte via mmap e grava os módulos em streaming")
+    parser.add_argument('--critical-css', action='store_true',
+                        help="inline no index.html o CSS usado pelo template; o restante carrega assíncrono")
+    parser.add_argument('--fingerprint', action='store_true',
+                        help="nomeia as saídas pelo hash do conteúdo e grava asset-manifest.json")
+    parser.add_argument('--split', action='store_true',
+                        help="emite os alvos de loadChunk() como chunks carregados sob demanda via import()")
+    args = parser.parse_args(argv)
+    if args.metrics and args.watch:
+        parser.error("--metrics não pode ser usado com --watch")
+    if args.interval <= 0 or args.debounce < 0:
+        parser.error("--interval deve ser positivo e --debounce não pode ser negativo")
+    if args.bundle and args.watch:
+        parser.error("--bundle não pode ser usado com --watch (o watch reextrai src/ por região)")
+    return args
+
+
+def main(argv=None):
     """Função principal"""
-    extractor = ModuleExtractor()
-    success = extractor.run_extraction()
+    args = parse_args(argv)
+    options = {
+        'streaming': args.mmap,
+        'minify': args.minify,
+        'precompress': args.gzip,
+        'fingerprint': args.fingerprint,
+        'critical_css': args.critical_css,
+        'split': args.split
+    }
     
-    if success:
-        print("\n🎉 Refatoração concluída com sucesso!")
-        print("   Sua aplicação agora está modularizada e pronta para desenvolvimento com IA!")
+    if args.batch:
+        results = run_batch(find_marked_sources(args.batch), args.output_dir,
+                            args.workers, args.threads, args.quiet, args.bundle, **options)
+        success = bool(results) and all(r['success'] and not r['error'] for r in results)
+        if args.metrics:
+            write_batch_metrics(results, args.metrics, args.metrics_format)
+    elif args.watch:
+        ModuleExtractor(args.source, quiet=args.quiet, **options).watch(
+            args.interval / 1000, args.debounce / 1000)
+        return
     else:
-        print("\n❌ Erro durante a extração.")
-        print("   Verifique os arquivos e tente novamente.")
+        extractor = ModuleExtractor(args.source, quiet=args.quiet, **options)
+        success = extractor.run_bundle() if args.bundle else extractor.run_extraction()
+        if args.metrics:
+            extractor.metrics.write(args.metrics, args.metrics_format)
+    
+    if not args.quiet:
+        if success:
+            print("\n🎉 Refatoração concluída com sucesso!")
+            print("   Sua aplicação agora está modularizada e pronta para desenvolvimento com IA!")
+        else:
+            print("\n❌ Erro durante a extração.")
+            print("   Verifique os arquivos e tente novamente.")
+    sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Derivados redimensionados das imagens dos cards (ImageBlockPlugin).
+Lê as fontes citadas nas specs JSONL (as mesmas do render_cards.py) ou todas
+as imagens de um diretório local, que também responde pelas URLs remotas, e
+gera em paralelo versões de prévia e de card 1x/2x com o hash do conteúdo no
+nome. O image-manifest.json mapeia cada src original para os derivados e as
+dimensões intrínsecas, para o layout conhecer a proporção sem baixar a imagem.
+"""
+
+import argparse
+import io
+import json
+import os
+import posixpath
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from PIL import Image, ImageOps
+
+from extraction_script import atomic_write, file_hash, fingerprint_path
+
+MANIFEST_VERSION = 1
+
+# Largura do conteúdo do card medida pelo LayoutComposer (layout_engine.CARD_CONTENT_WIDTH)
+CARD_CONTENT_WIDTH = 336
+
+# Nome do derivado → largura em px; a prévia do editor é exibida com no
+# máximo 100px (.image-preview) e ganha o dobro para telas HiDPI
+DERIVATIVE_WIDTHS = {
+    'preview': 200,
+    '1x': CARD_CONTENT_WIDTH,
+    '2x': 2 * CARD_CONTENT_WIDTH
+}
+
+IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp', '.tif', '.tiff'}
+
+
+def image_sources(stream):
+    """src de cada bloco de imagem das specs JSONL, na ordem, sem repetir
+
+    Aceita blocos no formato da spec ({"type": "image", "src"}) ou do estado
+    ({"content": {"data": {"src"}}}).
+    """
+    seen = set()
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            blocks = json.loads(line).get('blocks', [])
+        except (ValueError, AttributeError) as error:
+            sys.stderr.write(f"   ❌ linha {line_number}: spec inválida: {error}\n")
+            continue
+        for block in blocks:
+            if not isinstance(block, dict) or block.get('type') != 'image':
+                continue
+            content = block.get('content')
+            data = content.get('data') if isinstance(content, dict) else None
+            src = block.get('src') or (data.get('src') if isinstance(data, dict) else None)
+            if src and src not in seen:
+                seen.add(src)
+                yield src
+
+
+def directory_sources(source_dir):
+    """Todas as imagens do diretório, com o caminho relativo como src"""
+    source_dir = Path(source_dir)
+    for file_path in sorted(source_dir.rglob('*')):
+        if file_path.suffix.lower() in IMAGE_SUFFIXES and file_path.is_file():
+            yield file_path.relative_to(source_dir).as_posix()
+
+
+def resolve_source(src, root, source_dir=None):
+    """Arquivo local de um src: caminho relativo/absoluto ou URL espelhada em source_dir
+
+    Uma URL http(s) é procurada em source_dir/<host>/<caminho> e depois em
+    source_dir/<nome do arquivo>. data:, blob: e URLs sem espelho dão None.
+    """
+    parsed = urlsplit(src)
+    if parsed.scheme in ('http', 'https'):
+        if source_dir is None:
+            return None
+        url_path = unquote(parsed.path).lstrip('/')
+        for candidate in (Path(source_dir) / parsed.netloc / url_path,
+                          Path(source_dir) / posixpath.basename(url_path)):
+            if url_path and candidate.is_file():
+                return candidate
+        return None
+    if parsed.scheme in ('', 'file'):
+        path = Path(unquote(parsed.path))
+        for base in ([] if path.is_absolute() else [source_dir, root]):
+            if base is not None and (Path(base) / path).is_file():
+                return Path(base) / path
+        return path if path.is_file() else None
+    return None
+
+
+def derivative_stem(src):
+    """Nome base legível dos derivados (o hash garante a unicidade)"""
+    name = posixpath.basename(unquote(urlsplit(src).path)) or 'image'
+    stem = posixpath.splitext(name)[0]
+    return ''.join(char if char.isalnum() or char in '-_' else '-' for char in stem) or 'image'
+
+
+def encode(image, has_alpha, quality):
+    """JPEG progressivo para fotos; PNG quando há transparência"""
+    buffer = io.BytesIO()
+    if has_alpha:
+        image.save(buffer, 'PNG', optimize=True)
+        return buffer.getvalue(), '.png'
+    image.convert('RGB').save(buffer, 'JPEG', quality=quality, optimize=True, progressive=True)
+    return buffer.getvalue(), '.jpg'
+
+
+def build_derivatives(src, source_path, output_dir, quality):
+    """Decodifica uma fonte e grava seus derivados (executa nos processos do pool)
+
+    Retorna (src, entrada do manifesto, bytes gravados).
+    """
+    source_path = Path(source_path)
+    stat = source_path.stat()
+    with Image.open(source_path) as original:
+        # Respeita a orientação EXIF: é a que o navegador exibe
+        image = ImageOps.exif_transpose(original)
+        image.load()
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    if has_alpha:
+        image = image.convert('RGBA')
+    elif image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+
+    width, height = image.size
+    stem = derivative_stem(src)
+    derivatives = {}
+    written = 0
+    for name, target_width in DERIVATIVE_WIDTHS.items():
+        # Nunca amplia: uma fonte estreita vira o próprio tamanho reencodado
+        derivative_width = min(target_width, width)
+        derivative_height = max(1, round(height * derivative_width / width))
+        resized = image if derivative_width == width else image.resize(
+            (derivative_width, derivative_height), Image.LANCZOS, reducing_gap=3.0)
+        data, suffix = encode(resized, has_alpha, quality)
+        relative_path = fingerprint_path(f'{stem}-{derivative_width}w{suffix}', data)
+        output_path = Path(output_dir) / relative_path
+        if not output_path.exists():
+            atomic_write(output_path, data)
+            written += len(data)
+        derivatives[name] = {
+            'src': posixpath.join(Path(output_dir).as_posix(), relative_path),
+            'width': derivative_width,
+            'height': derivative_height,
+            'bytes': len(data)
+        }
+
+    entry = {
+        'width': width,
+        'height': height,
+        'derivatives': derivatives,
+        'source': {
+            'path': str(source_path),
+            'sha256': file_hash(source_path),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'quality': quality
+        }
+    }
+    return src, entry, written
+
+
+class ImageManifest:
+    """image-manifest.json: src original → dimensões intrínsecas e derivados"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.images = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding='utf-8'))
+            except (ValueError, OSError):
+                data = {}
+            if data.get('version') == MANIFEST_VERSION:
+                self.images = data.get('images', {})
+
+    def is_fresh(self, src, source_path, quality, output_dir):
+        """Fonte inalterada (mtime/tamanho ou, se mudaram, o SHA-256) e derivados presentes"""
+        entry = self.images.get(src)
+        if entry is None:
+            return False
+        source = entry.get('source', {})
+        if source.get('quality') != quality or set(entry.get('derivatives', {})) != set(DERIVATIVE_WIDTHS):
+            return False
+        prefix = Path(output_dir).as_posix() + '/'
+        if not all(derivative['src'].startswith(prefix) and Path(derivative['src']).exists()
+                   for derivative in entry['derivatives'].values()):
+            return False
+        stat = Path(source_path).stat()
+        if source.get('mtime_ns') == stat.st_mtime_ns and source.get('size') == stat.st_size:
+            return True
+        if source.get('sha256') != file_hash(source_path):
+            return False
+        # Só o mtime mudou (ex.: cópia): atualiza para evitar o hash na próxima vez
+        source.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size, path=str(source_path))
+        return True
+
+    def save(self):
+        data = {'version': MANIFEST_VERSION, 'images': dict(sorted(self.images.items()))}
+        atomic_write(self.path, json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
+
+
+def process_images(sources, output_dir='images', manifest_path='image-manifest.json',
+                   source_dir=None, root='.', workers=None, quality=82, log=sys.stderr):
+    """Gera os derivados das fontes alteradas em paralelo e atualiza o manifesto"""
+    workers = workers or os.cpu_count()
+    manifest = ImageManifest(manifest_path)
+    started = time.perf_counter()
+    pending = []
+    skipped = missing = failed = 0
+
+    for src in sources:
+        source_path = resolve_source(src, root, source_dir)
+        if source_path is None:
+            missing += 1
+            log.write(f"   ⚠️  {src[:80]}: sem arquivo local correspondente\n")
+            continue
+        if manifest.is_fresh(src, source_path, quality, output_dir):
+            skipped += 1
+            continue
+        pending.append((src, source_path))
+
+    processed = written = 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+            futures = {
+                executor.submit(build_derivatives, src, str(source_path), output_dir, quality): src
+                for src, source_path in pending
+            }
+            for future in as_completed(futures):
+                src = futures[future]
+                try:
+                    _, entry, size = future.result()
+                except (OSError, ValueError, Image.DecompressionBombError) as error:
+                    failed += 1
+                    log.write(f"   ❌ {src[:80]}: {error}\n")
+                    continue
+                manifest.images[src] = entry
+                processed += 1
+                written += size
+                sizes = ', '.join(f"{name} {d['width']}×{d['height']} ({d['bytes']} bytes)"
+                                  for name, d in entry['derivatives'].items())
+                log.write(f"   ✓ {src[:80]} ({entry['width']}×{entry['height']}): {sizes}\n")
+
+    manifest.save()
+    elapsed = time.perf_counter() - started
+    log.write(f"🖼️  {processed} imagens processadas, {skipped} sem alterações, "
+              f"{missing} sem fonte local, {failed} falhas em {elapsed:.2f}s "
+              f"({written} bytes gravados em {output_dir}/, {workers} processos)\n")
+    return processed, failed
+
+
+def main(argv=None):
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Gera derivados redimensionados das imagens dos cards")
+    parser.add_argument('specs', nargs='?',
+                        help="JSONL de specs de card (- para stdin); sem ele, usa todas as imagens de --source-dir")
+    parser.add_argument('--source-dir',
+                        help="diretório local que espelha as URLs remotas (<host>/<caminho> ou nome do arquivo)")
+    parser.add_argument('--root', default='.', help="base dos src relativos")
+    parser.add_argument('--output-dir', default='images', help="diretório dos derivados")
+    parser.add_argument('--manifest', default='image-manifest.json',
+                        help="mapa src → derivados e dimensões intrínsecas")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="processos do pool (padrão: núcleos da CPU)")
+    parser.add_argument('--quality', type=int, default=82, help="qualidade dos JPEG gerados")
+    args = parser.parse_args(argv)
+
+    if args.specs is None and args.source_dir is None:
+        parser.error("informe um JSONL de specs ou --source-dir")
+
+    if args.specs is None:
+        sources = list(directory_sources(args.source_dir))
+    elif args.specs == '-':
+        sources = list(image_sources(sys.stdin))
+    else:
+        with open(args.specs, 'r', encoding='utf-8') as stream:
+            sources = list(image_sources(stream))
+
+    _, failed = process_images(sources, args.output_dir, args.manifest, args.source_dir,
+                               args.root, args.workers, args.quality)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
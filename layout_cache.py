@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Cache persistente de resultados de layout do Card Creator.
+A chave é o SHA-256 da lista canônica de blocos (tipo, hierarquia, texto,
+dimensões de imagem) mais a razão tipográfica, a mesma calculada pelo
+LayoutCache do navegador (src/layout/layoutCache.js). Há uma camada LRU em
+memória e uma opcional em SQLite, e o conteúdo pode ser exportado em JSON
+para o navegador pré-carregar. O SQLite guarda a impressão digital da
+configuração do motor (glifos, largura, fonte mínima) que gerou os
+resultados e recusa ser aberto com outra.
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from extraction_script import atomic_write
+
+CACHE_VERSION = 1
+
+
+class CacheConfigError(Exception):
+    """O cache em disco foi gerado com outra configuração do motor de layout"""
+
+
+def _js_number(value):
+    """Números como o JSON.stringify os escreve (3, não 3.0)"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def canonical_key(blocks, ratio):
+    """JSON canônico dos blocos na ordem do LayoutComposer (hierarquia decrescente)"""
+    entries = []
+    for block in sorted(blocks, key=lambda block: -block['hierarchy']):
+        content = block.get('content')
+        data = content.get('data') if isinstance(content, dict) else None
+        data = data if isinstance(data, dict) else {}
+        entries.append([
+            block['type'],
+            _js_number(block['hierarchy']),
+            data.get('text'),
+            _js_number(data.get('width')),
+            _js_number(data.get('height'))
+        ])
+    return json.dumps([_js_number(ratio), entries], ensure_ascii=False, separators=(',', ':'))
+
+
+def layout_key(blocks, ratio):
+    """Chave do cache: SHA-256 (hex) do JSON canônico"""
+    return hashlib.sha256(canonical_key(blocks, ratio).encode('utf-8')).hexdigest()
+
+
+class LayoutCache:
+    """LRU em memória com camada SQLite opcional e contagem de hits/misses"""
+
+    def __init__(self, max_entries=10000, db_path=None, config=None):
+        self.max_entries = max_entries
+        # Impressão digital da configuração do motor (LayoutEngine.config_fingerprint)
+        self.config = config
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            # WAL permite vários processos do lote lendo e gravando o mesmo arquivo
+            self._db = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('CREATE TABLE IF NOT EXISTS layouts (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+            self._db.execute('CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)')
+            self._db.commit()
+            if config is not None:
+                self._check_config(db_path, config)
+
+    def _check_config(self, db_path, config):
+        """Registra a configuração num cache novo; falha se o existente usa outra"""
+        with self._db:
+            empty = self._db.execute('SELECT 1 FROM layouts LIMIT 1').fetchone() is None
+            if empty:
+                self._db.execute("INSERT OR IGNORE INTO meta (name, value) VALUES ('config', ?)", (config,))
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'config'").fetchone()
+        if row is None or row[0] != config:
+            self.close()
+            raise CacheConfigError(
+                f"{db_path} foi gerado com outra configuração do motor "
+                f"(glifos, largura ou fonte mínima); use outro arquivo ou apague-o"
+            )
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """Resultado em cache ou None; um hit em disco é promovido para a memória"""
+        with self._lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+            if self._db is not None:
+                row = self._db.execute('SELECT value FROM layouts WHERE key = ?', (key,)).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._store(key, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def put_many(self, items):
+        """Grava vários (chave, resultado) em memória e, numa transação, no SQLite"""
+        items = list(items)
+        with self._lock:
+            for key, value in items:
+                self._store(key, value)
+            if self._db is not None and items:
+                with self._db:
+                    self._db.executemany(
+                        'INSERT OR REPLACE INTO layouts (key, value) VALUES (?, ?)',
+                        [(key, json.dumps(value, sort_keys=True)) for key, value in items]
+                    )
+
+    def put(self, key, value):
+        self.put_many([(key, value)])
+
+    def _store(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def stored_config(self):
+        """Impressão digital da configuração registrada no SQLite (None se não houver)"""
+        with self._lock:
+            if self._db is None:
+                return self.config
+            row = self._db.execute("SELECT value FROM meta WHERE name = 'config'").fetchone()
+            return row[0] if row else None
+
+    def stored(self):
+        """Quantidade de resultados na camada persistente (ou em memória, sem SQLite)"""
+        with self._lock:
+            if self._db is None:
+                return len(self.entries)
+            return self._db.execute('SELECT COUNT(*) FROM layouts').fetchone()[0]
+
+    def stats(self):
+        """Contadores de uso do cache"""
+        return {'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses,
+                'entries': len(self.entries)}
+
+    def export_json(self, path):
+        """Exporta todos os resultados (do SQLite, se houver) para o navegador pré-carregar"""
+        with self._lock:
+            if self._db is not None:
+                rows = self._db.execute('SELECT key, value FROM layouts ORDER BY key').fetchall()
+                entries = {key: json.loads(value) for key, value in rows}
+            else:
+                entries = dict(sorted(self.entries.items()))
+        data = {'version': CACHE_VERSION, 'entries': entries}
+        atomic_write(path, json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+        return len(entries)
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+def main(argv=None):
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Cache persistente de layouts do Card Creator")
+    parser.add_argument('db', help="arquivo SQLite do cache (ex.: layout-cache.db)")
+    parser.add_argument('--export', metavar='JSON',
+                        help="exporta o cache para o navegador (ex.: layout-cache.json)")
+    args = parser.parse_args(argv)
+
+    cache = LayoutCache(db_path=args.db)
+    try:
+        print(f"🗃️  {args.db}: {cache.stored()} layouts em cache "
+              f"(configuração {(cache.stored_config() or 'desconhecida')[:12]})")
+        if args.export:
+            exported = cache.export_json(args.export)
+            print(f"   ✓ {exported} layouts exportados para {args.export}")
+    finally:
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+Motor de layout headless do Card Creator.
+Porta para NumPy a busca de LayoutComposer (src/layout/layoutComposer.js):
+em vez de montar e medir cada candidato no DOM, estima as linhas de cada
+bloco com tabelas de avanço de glifos e pontua todos os candidatos de
+vários cards de uma vez.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import unicodedata
+from functools import lru_cache
+
+import numpy as np
+
+from layout_cache import layout_key
+
+# Largura (e altura) do container de medição usado pelo LayoutComposer
+CARD_CONTENT_WIDTH = 336
+LINE_HEIGHTS = (1.1, 1.2, 1.3)
+
+# O que o DOM mede quando o bloco não tem texto: fallback do JS e o
+# textContent de um objeto (ex.: conteúdo de imagem sem data.text)
+FALLBACK_TEXT = 'Sample text'
+OBJECT_TEXT = '[object Object]'
+
+# Tolerância de ponto flutuante ao comparar larguras de linha (em)
+WRAP_EPSILON = 1e-9
+
+# Avanços (1/1000 em) da Helvetica/Arial, métrica da sans-serif padrão
+# (Liberation Sans/Arial) em navegadores headless
+SANS_ADVANCES = dict(zip(
+    ' !"#$%&\'()*+,-./0123456789:;<=>?@'
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`'
+    'abcdefghijklmnopqrstuvwxyz{|}~',
+    [278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+     556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556, 1015,
+     667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833,
+     722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611,
+     278, 278, 278, 469, 556, 333,
+     556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833,
+     556, 556, 556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500,
+     334, 260, 334, 584]
+))
+
+
+def base_font_sizes(ratio):
+    """Tamanhos-base testados para uma razão tipográfica (igual ao JS)"""
+    if ratio >= 1.6:
+        return [5, 6, 7, 8, 10]
+    if ratio >= 1.5:
+        return [6, 7, 8, 10, 12]
+    return [8, 10, 12, 14, 16, 20]
+
+
+def generate_candidates(ratio):
+    """Porta de LayoutComposer._generateCandidates: tamanho-base × altura de linha"""
+    return [
+        {'baseFontSize': base_font_size, 'lineHeight': line_height}
+        for base_font_size in base_font_sizes(ratio)
+        for line_height in LINE_HEIGHTS
+    ]
+
+
+def block_text(block):
+    """Texto que o LayoutComposer coloca no elemento de medição do bloco"""
+    content = block.get('content')
+    data = content.get('data') if isinstance(content, dict) else None
+    if isinstance(data, dict) and data.get('text'):
+        return str(data['text'])
+    if content:
+        return content if isinstance(content, str) else OBJECT_TEXT
+    return FALLBACK_TEXT
+
+
+def analyze_content(blocks):
+    """Porta de ContentAnalyzer.analyze"""
+    analysis = {
+        'hasImages': False,
+        'hasOnlyText': True,
+        'textDensity': 0,
+        'totalBlocks': len(blocks),
+        'dominantType': 'text'
+    }
+    if not blocks:
+        return analysis
+
+    type_counts = {}
+    for block in blocks:
+        type_counts[block['type']] = type_counts.get(block['type'], 0) + 1
+
+    analysis['hasImages'] = type_counts.get('image', 0) > 0
+    analysis['hasOnlyText'] = type_counts.get('text') == len(blocks)
+    analysis['textDensity'] = type_counts.get('text', 0) / len(blocks)
+
+    max_count = 0
+    for block_type, count in type_counts.items():
+        if count > max_count:
+            max_count = count
+            analysis['dominantType'] = block_type
+    return analysis
+
+
+def select_strategy(analysis):
+    """Porta de AdaptiveLayoutComposer.selectOptimalStrategy (retorna o nome)"""
+    if analysis['hasImages'] and analysis['textDensity'] > 0.7:
+        return 'mixed-content'
+    if analysis['hasOnlyText'] and analysis['totalBlocks'] > 3:
+        return 'text-optimized'
+    return 'balanced'
+
+
+def calculate_hierarchy(blocks, global_contrast):
+    """Porta de AdaptiveLayoutComposer._calculateHierarchy: hierarquia 5 → mínima por ordem"""
+    sorted_blocks = sorted(blocks, key=lambda block: block.get('order', 0))
+    if len(sorted_blocks) < 2:
+        return [{**block, 'hierarchy': 5} for block in sorted_blocks]
+
+    highest = 5
+    lowest = max(1, 6 - global_contrast)
+    steps = len(sorted_blocks) - 1
+    return [
+        {**block, 'hierarchy': int(js_round(highest - index * (highest - lowest) / steps))}
+        for index, block in enumerate(sorted_blocks)
+    ]
+
+
+class GlyphTable:
+    """Tabela de avanços de glifos de uma fonte, em unidades de em"""
+
+    def __init__(self, advances, default=556, units_per_em=1000, name='custom'):
+        self.name = name
+        self.units_per_em = units_per_em
+        self.advances = {char: width / units_per_em for char, width in advances.items()}
+        self.default = default / units_per_em
+        self.space = self.advance(' ')
+        # Cache por instância (textos se repetem muito entre cards)
+        self.word_widths = lru_cache(maxsize=4096)(self._word_widths)
+
+    @classmethod
+    def builtin(cls):
+        """Tabela embutida com a métrica Helvetica/Arial"""
+        return cls(SANS_ADVANCES, name='sans-serif')
+
+    @classmethod
+    def load(cls, path):
+        """Carrega uma tabela JSON: {"name", "units_per_em", "default", "advances": {char: largura}}"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['advances'], data.get('default', 556),
+                   data.get('units_per_em', 1000), data.get('name', path))
+
+    def advance(self, char):
+        """Avanço de um caractere; acentuados usam a letra-base (á → a)"""
+        width = self.advances.get(char)
+        if width is None:
+            base = unicodedata.normalize('NFD', char)[0]
+            width = self.advances.get(base, self.default)
+        return width
+
+    def _word_widths(self, text):
+        """Larguras (em) das palavras após o colapso de espaços do CSS"""
+        return np.array([sum(self.advance(char) for char in word) for word in text.split()],
+                        dtype=np.float64)
+
+
+def count_lines(prefix, word_counts, space, available):
+    """Quebra gulosa de linhas (white-space: normal) para várias linhas da matriz de uma vez
+
+    prefix: (R, M + 1) somas acumuladas das larguras das palavras (em)
+    word_counts: (R,) palavras de cada linha; available: (R,) largura útil (em)
+    Uma palavra maior que a largura ocupa sozinha a sua linha (transborda).
+    """
+    # Fim da linha que começa na palavra s e termina na k: prefix[k+1] + space*k
+    # <= available + prefix[s] + space*s. O lado esquerdo cresce com k, então
+    # basta contar quantos k satisfazem (os anteriores a s sempre satisfazem)
+    word_index = np.arange(prefix.shape[1] - 1)
+    line_end = prefix[:, 1:] + space * word_index
+    line_end[word_index[None, :] >= word_counts[:, None]] = np.inf
+
+    lines = np.zeros(len(word_counts), dtype=np.int64)
+    start = np.zeros(len(word_counts), dtype=np.int64)
+    live = np.flatnonzero(word_counts > 0)
+    while live.size:
+        threshold = available[live] + prefix[live, start[live]] + space * start[live] + WRAP_EPSILON
+        fitting = (line_end[live] <= threshold[:, None]).sum(axis=1)
+        start[live] = np.maximum(fitting, start[live] + 1)
+        lines[live] += 1
+        live = live[start[live] < word_counts[live]]
+
+    return lines
+
+
+def js_round(values):
+    """Math.round do JS (meio arredonda para cima, não para o par)"""
+    return np.floor(values + 0.5)
+
+
+class LayoutEngine:
+    """Pontua e escolhe candidatos de layout sem DOM, vetorizado por lote de cards"""
+
+    def __init__(self, glyphs=None, width=CARD_CONTENT_WIDTH, min_font_size=0, cache=None):
+        self.glyphs = glyphs or GlyphTable.builtin()
+        self.width = width
+        # Tamanho mínimo de fonte do navegador (getComputedStyle nunca fica abaixo)
+        self.min_font_size = min_font_size
+        # LayoutCache opcional: só os cards ausentes do cache são pontuados
+        self.cache = cache
+
+    def config_fingerprint(self):
+        """Hash de tudo que, além dos blocos e da razão, muda o resultado do motor"""
+        config = {
+            'advances': sorted(self.glyphs.advances.items()),
+            'default': self.glyphs.default,
+            'width': self.width,
+            'min_font_size': self.min_font_size,
+            'line_heights': LINE_HEIGHTS
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _prepare_blocks(self, cards):
+        """Hierarquias, máscara e somas acumuladas das palavras por (card, bloco)"""
+        max_blocks = max((len(card['blocks']) for card in cards), default=0)
+        hierarchy = np.zeros((len(cards), max_blocks))
+        block_mask = np.zeros((len(cards), max_blocks), dtype=bool)
+        widths = []
+
+        for c, card in enumerate(cards):
+            # Mesma ordem do construtor JS: hierarquia decrescente, estável
+            blocks = sorted(card['blocks'], key=lambda block: -block['hierarchy'])
+            for b, block in enumerate(blocks):
+                hierarchy[c, b] = block['hierarchy']
+                block_mask[c, b] = True
+            widths.extend(self.glyphs.word_widths(block_text(block)) for block in blocks)
+            widths.extend(np.empty(0) for _ in range(max_blocks - len(blocks)))
+
+        max_words = max((len(w) for w in widths), default=0)
+        prefix = np.zeros((len(widths), max_words + 1))
+        word_counts = np.array([len(w) for w in widths], dtype=np.int64)
+        for row, w in enumerate(widths):
+            prefix[row, 1:len(w) + 1] = np.cumsum(w)
+            prefix[row, len(w) + 1:] = prefix[row, len(w)]
+
+        lowest = np.where(block_mask, hierarchy, np.inf).min(axis=1)
+        exponent = np.where(block_mask, hierarchy - lowest[:, None], 0)
+        return hierarchy, block_mask, exponent, prefix, word_counts
+
+    def _count_block_lines(self, prefix, word_counts, font_sizes):
+        """Linhas de cada bloco para K tamanhos de fonte: font_sizes (cards, blocos, K)"""
+        n_sizes = font_sizes.shape[2]
+        lines = count_lines(
+            np.repeat(prefix, n_sizes, axis=0),
+            np.repeat(word_counts, n_sizes),
+            self.glyphs.space,
+            (self.width / font_sizes).reshape(-1)
+        )
+        return lines.reshape(font_sizes.shape)
+
+    def score(self, cards):
+        """Badness de todos os candidatos: matriz (cards, candidatos), inf onde não há candidato
+
+        Cada card é {"ratio": float, "blocks": [{"hierarchy", "content", ...}]}, como
+        recebido por new LayoutComposer(blocks, ratio).
+        """
+        n_cards = len(cards)
+        n_line_heights = len(LINE_HEIGHTS)
+        max_sizes = max((len(base_font_sizes(card['ratio'])) for card in cards), default=0)
+        if not any(card['blocks'] for card in cards):
+            return np.full((n_cards, max_sizes * n_line_heights), np.inf)
+        hierarchy, block_mask, exponent, prefix, word_counts = self._prepare_blocks(cards)
+
+        ratio = np.array([card['ratio'] for card in cards], dtype=np.float64)
+        base_sizes = np.ones((n_cards, max_sizes))
+        size_mask = np.zeros((n_cards, max_sizes), dtype=bool)
+        for c, card in enumerate(cards):
+            sizes = base_font_sizes(card['ratio'])
+            base_sizes[c, :len(sizes)] = sizes
+            size_mask[c, :len(sizes)] = True
+
+        # (cards, blocos, tamanhos-base)
+        target = base_sizes[:, None, :] * ratio[:, None, None] ** exponent[:, :, None]
+        actual = np.maximum(target, self.min_font_size)
+
+        # Linhas por (card, bloco, tamanho): não dependem da altura de linha
+        lines = self._count_block_lines(prefix, word_counts, actual)
+
+        # (cards, blocos, tamanhos-base, alturas de linha)
+        line_heights = np.array(LINE_HEIGHTS)
+        line_px = actual[..., None] * line_heights
+        offset_height = js_round(lines[..., None] * line_px)
+        line_counts = js_round(offset_height / line_px)
+        mask = block_mask[:, :, None, None]
+
+        n_blocks = block_mask.sum(axis=1)
+        base_gap = base_sizes[:, :, None] * line_heights * 0.5
+        total_height = (np.where(mask, offset_height, 0).sum(axis=1)
+                        + (n_blocks - 1)[:, None, None] * base_gap)
+
+        # _calculateBadness
+        badness = (100 - actual[:, 0, :, None]) * 300 + np.zeros_like(total_height)
+        distortion = np.abs(actual - target) / target * 100
+        badness += np.where(block_mask[:, :, None], distortion ** 2, 0).sum(axis=1)[..., None]
+        line_penalty = (line_counts - 1) * hierarchy[:, :, None, None] ** 2 * 50
+        badness += np.where(mask & (line_counts > 1), line_penalty, 0).sum(axis=1)
+        with np.errstate(divide='ignore'):
+            required_zoom = self.width / total_height
+        badness += np.where(required_zoom < 0.9, (1 - required_zoom) ** 2 * 50000, 0)
+
+        badness = np.where(np.isnan(badness), np.inf, badness)
+        badness = np.where(size_mask[:, :, None], badness, np.inf)
+        badness[n_blocks == 0] = np.inf
+        # Ordem dos candidatos do JS: tamanho-base externo, altura de linha interna
+        return badness.reshape(n_cards, max_sizes * n_line_heights)
+
+    def find_best(self, cards):
+        """Porta de findBestCandidate para um lote: um resultado (ou None) por card"""
+        results = [None] * len(cards)
+        pending = list(range(len(cards)))
+        keys = {}
+        if self.cache is not None:
+            pending = []
+            for i, card in enumerate(cards):
+                if not card['blocks']:
+                    continue
+                keys[i] = layout_key(card['blocks'], card['ratio'])
+                cached = self.cache.get(keys[i])
+                if cached is None:
+                    pending.append(i)
+                else:
+                    results[i] = {**cached, 'ratio': card['ratio']}
+
+        badness = self.score([cards[i] for i in pending])
+        computed = []
+        for i, row in zip(pending, badness):
+            # argmin devolve o primeiro mínimo, como o "<" estrito do JS
+            index = int(np.argmin(row)) if row.size else 0
+            if not row.size or not np.isfinite(row[index]):
+                continue
+            candidate = {**generate_candidates(cards[i]['ratio'])[index], 'badness': float(row[index])}
+            results[i] = {**candidate, 'ratio': cards[i]['ratio']}
+            if i in keys:
+                computed.append((keys[i], candidate))
+
+        if self.cache is not None:
+            self.cache.put_many(computed)
+        return results
+
+    def optimize_zoom(self, cards, layouts):
+        """Porta de LayoutOptimizer.optimizeZoom: bisseção de 8 passos, vetorizada por card
+
+        layouts traz baseFontSize, lineHeight e ratio de cada card (None é ignorado).
+        """
+        zooms = [None] * len(cards)
+        indices = [i for i, layout in enumerate(layouts) if layout is not None]
+        if not indices:
+            return zooms
+
+        selected = [cards[i] for i in indices]
+        _, block_mask, exponent, prefix, word_counts = self._prepare_blocks(selected)
+        base = np.array([layouts[i]['baseFontSize'] for i in indices], dtype=np.float64)
+        line_height = np.array([layouts[i]['lineHeight'] for i in indices], dtype=np.float64)
+        ratio = np.array([layouts[i]['ratio'] for i in indices], dtype=np.float64)
+        n_blocks = block_mask.sum(axis=1)
+        sizes = base[:, None] * ratio[:, None] ** exponent
+        base_gap = base * line_height * 0.5
+
+        low = np.full(len(indices), 0.1)
+        high = np.full(len(indices), 5.0)
+        best = np.ones(len(indices))
+        for _ in range(8):
+            guess = (low + high) / 2
+            font_sizes = np.maximum(sizes * guess[:, None], self.min_font_size)
+            lines = self._count_block_lines(prefix, word_counts, font_sizes[:, :, None])[:, :, 0]
+            offset_height = js_round(lines * font_sizes * line_height[:, None])
+            total = (np.where(block_mask, offset_height, 0).sum(axis=1)
+                     + (n_blocks - 1) * base_gap * guess)
+            fits = total <= self.width
+            best = np.where(fits, guess, best)
+            low = np.where(fits, guess, low)
+            high = np.where(fits, high, guess)
+
+        for i, zoom in zip(indices, best):
+            zooms[i] = float(zoom)
+        return zooms
+
+    def create_layouts(self, specs):
+        """Porta de AdaptiveLayoutComposer.createLayout para um lote de cards
+
+        Cada spec é {"blocks": [...], "config": {"globalContrast", "typographicRatio"}},
+        os mesmos argumentos do JS; se todos os blocos trazem "hierarchy", ela é usada
+        como está. Retorna o layout final (ou None) por card.
+        """
+        prepared = []
+        for spec in specs:
+            config = spec['config']
+            blocks = spec['blocks']
+            if blocks and all('hierarchy' in block for block in blocks):
+                # Hierarquia explícita (specs offline) dispensa o cálculo pelo contraste
+                blocks = sorted(blocks, key=lambda block: block.get('order', 0))
+            else:
+                blocks = calculate_hierarchy(blocks, config['globalContrast'])
+            analysis = analyze_content(spec['blocks'])
+            prepared.append({
+                'ratio': config['typographicRatio'],
+                'blocks': blocks,
+                'analysis': analysis,
+                'strategy': select_strategy(analysis)
+            })
+
+        candidates = self.find_best(prepared)
+        for card, candidate in zip(prepared, candidates):
+            if candidate is not None and card['strategy'] == 'mixed-content':
+                candidate['baseFontSize'] = max(candidate['baseFontSize'] * 0.9, 6)
+
+        zooms = self.optimize_zoom(prepared, candidates)
+        return [
+            None if candidate is None else {
+                **candidate,
+                'zoom': zoom,
+                'blocks': card['blocks'],
+                'strategy': card['strategy'],
+                'analysis': card['analysis']
+            }
+            for card, candidate, zoom in zip(prepared, candidates, zooms)
+        ]
+
+
+def read_cards(path):
+    """Lê cards de um arquivo JSONL (um card por linha)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def read_reference(path):
+    """Lê os resultados de referência do LayoutComposer (JSONL): {baseFontSize, lineHeight, ...} ou null por card
+
+    Levanta ValueError apontando a linha de um resultado malformado.
+    """
+    reference = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                expected = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"{path}:{line_number}: JSON inválido ({error.msg})") from None
+            if expected is not None:
+                if not isinstance(expected, dict):
+                    raise ValueError(f"{path}:{line_number}: esperado objeto ou null")
+                for field in ('baseFontSize', 'lineHeight'):
+                    value = expected.get(field)
+                    if isinstance(value, bool) or not isinstance(value, (int, float)):
+                        raise ValueError(f"{path}:{line_number}: campo numérico '{field}' ausente")
+            reference.append(expected)
+    return reference
+
+
+def compare_with_reference(results, reference):
+    """Compara com os resultados de referência; retorna os índices divergentes"""
+    if len(results) != len(reference):
+        raise ValueError(f"{len(reference)} resultados de referência para {len(results)} cards")
+    mismatches = []
+    for index, (result, expected) in enumerate(zip(results, reference)):
+        if result is None or expected is None:
+            if result is not expected:
+                mismatches.append(index)
+            continue
+        if (result['baseFontSize'] != expected['baseFontSize']
+                or result['lineHeight'] != expected['lineHeight']):
+            mismatches.append(index)
+    return mismatches
+
+
+def main(argv=None):
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Motor de layout headless do Card Creator")
+    parser.add_argument('cards', help="arquivo JSONL com {ratio, blocks} por linha")
+    parser.add_argument('--glyphs', help="tabela JSON de avanços de glifos (padrão: sans-serif)")
+    parser.add_argument('--min-font-size', type=float, default=0,
+                        help="tamanho mínimo de fonte imposto pelo navegador")
+    parser.add_argument('--reference',
+                        help="JSONL com os resultados do LayoutComposer "
+                             "(tests/export_layout_reference.js)")
+    args = parser.parse_args(argv)
+
+    glyphs = GlyphTable.load(args.glyphs) if args.glyphs else GlyphTable.builtin()
+    engine = LayoutEngine(glyphs, min_font_size=args.min_font_size)
+    cards = read_cards(args.cards)
+    results = engine.find_best(cards)
+
+    if not args.reference:
+        for result in results:
+            sys.stdout.write(json.dumps(result) + '\n')
+        return
+
+    try:
+        mismatches = compare_with_reference(results, read_reference(args.reference))
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    print(f"📐 {len(cards) - len(mismatches)}/{len(cards)} cards iguais à referência "
+          f"(fonte: {glyphs.name})")
+    for index in mismatches:
+        print(f"   ✗ card {index}: {results[index]}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
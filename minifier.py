@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Minificação conservadora de JS e CSS para os arquivos extraídos.
+Remove comentários, indentação e espaços redundantes sem tocar em strings,
+template literals ou expressões regulares. Quebras de linha significativas
+para a inserção automática de ponto e vírgula (ASI) são preservadas.
+"""
+
+# Palavras após as quais uma "/" inicia uma expressão regular, não uma divisão
+REGEX_PRECEDING_KEYWORDS = {
+    'return', 'typeof', 'case', 'do', 'else', 'in', 'instanceof', 'new',
+    'delete', 'void', 'throw', 'yield', 'await', 'of'
+}
+REGEX_PRECEDING_PUNCTUATION = set('(,=:[!&|?{};+-*%<>~^')
+
+# Uma quebra de linha depois/antes destes caracteres nunca muda o significado
+NEWLINE_DROP_AFTER = set('{;,([')
+NEWLINE_DROP_BEFORE = set('});,]')
+
+
+def _is_word_char(char):
+    return char.isalnum() or char in '_$' or ord(char) > 127
+
+
+def _skip_string(code, i):
+    """Retorna o índice após a string iniciada em code[i]"""
+    quote = code[i]
+    i += 1
+    while i < len(code):
+        if code[i] == '\\':
+            i += 2
+            continue
+        if code[i] == quote or code[i] == '\n':
+            return i + 1
+        i += 1
+    return i
+
+
+def _skip_template(code, i):
+    """Retorna o índice após o template literal iniciado em code[i]"""
+    i += 1
+    while i < len(code):
+        char = code[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '`':
+            return i + 1
+        if char == '$' and code.startswith('${', i):
+            i = _skip_expression(code, i + 2)
+            continue
+        i += 1
+    return i
+
+
+def _skip_expression(code, i):
+    """Retorna o índice após a expressão ${...} (já sem o '${')"""
+    depth = 1
+    while i < len(code) and depth:
+        char = code[i]
+        if char in '\'"':
+            i = _skip_string(code, i)
+            continue
+        if char == '`':
+            i = _skip_template(code, i)
+            continue
+        if code.startswith('//', i):
+            newline = code.find('\n', i)
+            i = len(code) if newline == -1 else newline
+            continue
+        if code.startswith('/*', i):
+            close = code.find('*/', i + 2)
+            i = len(code) if close == -1 else close + 2
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+        i += 1
+    return i
+
+
+def _skip_regex(code, i):
+    """Retorna o índice após a regex (incluindo flags) iniciada em code[i]"""
+    i += 1
+    in_class = False
+    while i < len(code):
+        char = code[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '\n':
+            return i
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '/' and not in_class:
+            i += 1
+            while i < len(code) and _is_word_char(code[i]):
+                i += 1
+            return i
+        i += 1
+    return i
+
+
+def _regex_allowed(out):
+    """Decide, pelo último token emitido, se uma '/' inicia uma regex"""
+    tail = ''.join(out[-16:]).rstrip(' \n')
+    if not tail:
+        return True
+    last = tail[-1]
+    if last in REGEX_PRECEDING_PUNCTUATION:
+        return True
+    if _is_word_char(last):
+        start = len(tail)
+        while start and _is_word_char(tail[start - 1]):
+            start -= 1
+        return tail[start:] in REGEX_PRECEDING_KEYWORDS
+    return False
+
+
+def _emit_whitespace(out, pending_newline, next_char):
+    """Emite o separador mínimo entre o último caractere e o próximo"""
+    if not out:
+        return
+    prev = out[-1][-1]
+    if pending_newline and prev not in NEWLINE_DROP_AFTER and next_char not in NEWLINE_DROP_BEFORE:
+        out.append('\n')
+    elif _is_word_char(prev) and _is_word_char(next_char):
+        out.append(' ')
+    elif prev == next_char and prev in '+-/':
+        out.append(' ')
+    elif prev == '/' and next_char == '*':
+        out.append(' ')
+
+
+def minify_js(code):
+    """Minifica JavaScript preservando strings, templates, regex e ASI"""
+    out = []
+    i = 0
+    length = len(code)
+    pending_space = False
+    pending_newline = False
+
+    while i < length:
+        char = code[i]
+
+        if char in ' \t\r\f\v\n':
+            pending_space = True
+            pending_newline = pending_newline or char == '\n'
+            i += 1
+            continue
+
+        if code.startswith('//', i):
+            newline = code.find('\n', i)
+            i = length if newline == -1 else newline
+            continue
+
+        if code.startswith('/*', i):
+            close = code.find('*/', i + 2)
+            comment = code[i:length if close == -1 else close + 2]
+            pending_space = True
+            pending_newline = pending_newline or '\n' in comment
+            i += len(comment)
+            continue
+
+        if pending_space:
+            _emit_whitespace(out, pending_newline, char)
+            pending_space = pending_newline = False
+
+        if char in '\'"':
+            end = _skip_string(code, i)
+        elif char == '`':
+            end = _skip_template(code, i)
+        elif char == '/' and _regex_allowed(out):
+            end = _skip_regex(code, i)
+        else:
+            out.append(char)
+            i += 1
+            continue
+
+        out.append(code[i:end])
+        i = end
+
+    return ''.join(out).strip() + '\n'
+
+
+def minify_css(css):
+    """Minifica CSS: remove comentários e espaços ao redor de { } ; , : >"""
+    out = []
+    i = 0
+    length = len(css)
+    pending_space = False
+
+    while i < length:
+        char = css[i]
+
+        if char.isspace():
+            pending_space = True
+            i += 1
+            continue
+
+        if css.startswith('/*', i):
+            close = css.find('*/', i + 2)
+            i = length if close == -1 else close + 2
+            pending_space = True
+            continue
+
+        if char in '\'"':
+            end = _skip_string(css, i)
+        else:
+            end = i + 1
+
+        if pending_space and out and out[-1][-1] not in '{};,:>' and char not in '{};,>':
+            out.append(' ')
+        pending_space = False
+
+        if char == '}' and out and out[-1] == ';':
+            out.pop()
+        out.append(css[i:end])
+        i = end
+
+    return ''.join(out)
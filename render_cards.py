@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Renderização de cards em lote, sem navegador.
+Lê specs de card em JSONL (uma por linha, em streaming), escolhe o layout
+com o layout_engine em um pool de processos com trabalho em voo limitado e
+grava o HTML de cada card (o mesmo DOM do EnhancedLayoutRenderer) assim
+que o lote dele termina.
+"""
+
+import argparse
+import html
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from urllib.parse import quote
+
+from layout_cache import CacheConfigError, LayoutCache
+from layout_engine import CARD_CONTENT_WIDTH, GlyphTable, LayoutEngine
+
+DEFAULT_CONFIG = {'globalContrast': 3, 'typographicRatio': 1.250}
+
+# Motor de cada processo do pool (criado pelo initializer)
+_engine = None
+
+
+def js_number(value):
+    """Formata um número como o JS ao interpolar em string (12, não 12.0)"""
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _number(value, field):
+    """Valida um campo numérico da spec (bool não conta como número)"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{field} deve ser numérico, não {value!r}")
+    return value
+
+
+def card_from_spec(spec, line_number):
+    """Converte uma spec JSONL no formato de blocos/config usado pelo JS
+
+    Spec: {"id", "ratio", "contrast", "blocks": [{"type", "text" | "src"/"alt",
+    "hierarchy"?}]}. Blocos já no formato do estado ({"content": {...}}) passam direto.
+    Levanta ValueError para campos que fariam o lote inteiro falhar no motor.
+    """
+    if not isinstance(spec.get('blocks', []), list):
+        raise ValueError("blocks deve ser uma lista")
+    blocks = []
+    for order, block in enumerate(spec.get('blocks', []), start=1):
+        block_type = block.get('type', 'text')
+        content = block.get('content')
+        if content is None:
+            if block_type == 'image':
+                data = {'src': block.get('src', ''), 'alt': block.get('alt', 'Imagem'),
+                        'fit': block.get('fit', 'cover')}
+            else:
+                data = {'text': str(block.get('text', ''))}
+            content = {'type': block_type, 'data': data}
+        converted = {'id': str(block.get('id', order)), 'type': block_type,
+                     'order': block.get('order', order), 'content': content}
+        if 'hierarchy' in block:
+            converted['hierarchy'] = _number(block['hierarchy'], f"hierarchy do bloco {order}")
+        _number(converted['order'], f"order do bloco {order}")
+        blocks.append(converted)
+
+    return {
+        'id': str(spec.get('id', f'card-{line_number:06d}')),
+        'blocks': blocks,
+        'config': {
+            'globalContrast': _number(spec.get('contrast', DEFAULT_CONFIG['globalContrast']), 'contrast'),
+            'typographicRatio': _number(spec.get('ratio', DEFAULT_CONFIG['typographicRatio']), 'ratio')
+        }
+    }
+
+
+def render_block(block, font_size, line_height):
+    """HTML de um bloco, como o render() do plugin correspondente"""
+    data = block['content'].get('data') or {}
+    if block['type'] == 'text':
+        text = html.escape(str(data.get('text', '')), quote=False)
+        return (f'<div class="card-element" style="font-size: {js_number(font_size)}px; '
+                f'line-height: {js_number(line_height)};">{text}</div>')
+    if block['type'] == 'image':
+        if not data.get('src'):
+            return (f'<div class="card-element" style="font-size: {js_number(font_size)}px;">'
+                    '🖼️ Imagem</div>')
+        return (f'<img class="card-element image" src="{html.escape(data["src"])}" '
+                f'alt="{html.escape(data.get("alt", "Imagem"))}">')
+    # Fallback para blocos sem plugin
+    return (f'<div class="card-element" style="color: rgb(239, 68, 68);">'
+            f'⚠️ Plugin {html.escape(str(block["type"]), quote=False)} não encontrado</div>')
+
+
+def render_card_html(layout):
+    """Porta de EnhancedLayoutRenderer.render: conteúdo do #cardContent"""
+    base_gap = layout['baseFontSize'] * layout['lineHeight'] * 0.5
+    lowest = min(block['hierarchy'] for block in layout['blocks'])
+    elements = [
+        render_block(
+            block,
+            layout['baseFontSize'] * layout['ratio'] ** (block['hierarchy'] - lowest) * layout['zoom'],
+            layout['lineHeight']
+        )
+        for block in layout['blocks']
+    ]
+    return (f'<div id="cardContent" class="card-content" '
+            f'style="gap: {js_number(base_gap * layout["zoom"])}px;">'
+            + ''.join(elements) + '</div>')
+
+
+def wrap_document(card_id, fragment, stylesheet):
+    """Envolve o card em um documento HTML independente"""
+    return f'''<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+    <meta charset="UTF-8">
+    <title>{html.escape(card_id)}</title>
+    <link rel="stylesheet" href="{html.escape(stylesheet)}">
+</head>
+<body>
+    <div class="card">{fragment}</div>
+</body>
+</html>
+'''
+
+
+def _init_worker(glyphs_path, min_font_size, cache_db=None):
+    """Cria o motor de layout (e a conexão com o cache) uma vez por processo"""
+    global _engine
+    _engine = create_engine(glyphs_path, min_font_size, cache_db)
+
+
+def create_engine(glyphs_path=None, min_font_size=0, cache_db=None):
+    """Motor de layout com o cache em disco amarrado à sua configuração
+
+    Levanta CacheConfigError se cache_db foi gerado com outra configuração.
+    """
+    glyphs = GlyphTable.load(glyphs_path) if glyphs_path else GlyphTable.builtin()
+    engine = LayoutEngine(glyphs, CARD_CONTENT_WIDTH, min_font_size)
+    if cache_db:
+        engine.cache = LayoutCache(db_path=cache_db, config=engine.config_fingerprint())
+    return engine
+
+
+def _cache_counters():
+    cache = _engine.cache
+    return (cache.hits, cache.disk_hits, cache.misses) if cache is not None else (0, 0, 0)
+
+
+def render_batch(lines):
+    """Renderiza um lote de linhas JSONL
+
+    Retorna ([(número, id, html | None, erro | None)], (hits, hits em disco, misses)).
+    """
+    counters = _cache_counters()
+    results = []
+    cards = []
+    for line_number, line in lines:
+        try:
+            cards.append((line_number, card_from_spec(json.loads(line), line_number)))
+        except (ValueError, TypeError, AttributeError) as error:
+            results.append((line_number, f'card-{line_number:06d}', None, f"spec inválida: {error}"))
+
+    try:
+        layouts = _engine.create_layouts([card for _, card in cards])
+    except (KeyError, TypeError, ValueError):
+        # Um card inválido não derruba o lote: refaz card a card para isolar o erro
+        layouts = []
+        for _, card in cards:
+            try:
+                layouts.extend(_engine.create_layouts([card]))
+            except (KeyError, TypeError, ValueError) as error:
+                layouts.append(error)
+
+    for (line_number, card), layout in zip(cards, layouts):
+        if isinstance(layout, Exception):
+            results.append((line_number, card['id'], None, f"erro no layout: {layout}"))
+        elif layout is None:
+            results.append((line_number, card['id'], None, "nenhum candidato válido"))
+        else:
+            results.append((line_number, card['id'], render_card_html(layout), None))
+    return results, tuple(after - before for before, after in zip(counters, _cache_counters()))
+
+
+def iter_batches(stream, batch_size):
+    """Agrupa as linhas não-vazias do stream em lotes, sem ler o arquivo inteiro"""
+    numbered = ((number, line) for number, line in enumerate(stream, start=1) if line.strip())
+    while True:
+        batch = list(islice(numbered, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+class CardWriter:
+    """Grava cada card conforme chega: um .html por card ou JSONL na saída padrão"""
+
+    def __init__(self, output_dir=None, stylesheet='styles/main.css'):
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.stylesheet = stylesheet
+        self.written = set()
+        if self.output_dir:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def file_name(card_id):
+        """Nome do .html de um card; o escape %XX é injetivo (a/b e a_b não colidem)"""
+        return quote(card_id, safe='') + '.html'
+
+    def write(self, card_id, fragment, error):
+        """Grava o card e retorna o erro final (um id repetido não sobrescreve o anterior)"""
+        if self.output_dir is None:
+            sys.stdout.write(json.dumps({'id': card_id, 'html': fragment, 'error': error},
+                                        ensure_ascii=False) + '\n')
+            return error
+        if error is None:
+            file_name = self.file_name(card_id)
+            if file_name in self.written:
+                return f"id duplicado; {file_name} já foi gravado"
+            self.written.add(file_name)
+            (self.output_dir / file_name).write_text(
+                wrap_document(card_id, fragment, self.stylesheet), encoding='utf-8')
+        return error
+
+
+def render_stream(stream, writer, workers=None, batch_size=64, max_in_flight=None,
+                  glyphs_path=None, min_font_size=0, cache_db=None, log=sys.stderr):
+    """Processa o stream JSONL no pool com no máximo `max_in_flight` lotes pendentes"""
+    workers = workers or os.cpu_count()
+    max_in_flight = max_in_flight or workers * 2
+    rendered = failed = 0
+    cache_counters = [0, 0, 0]
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(glyphs_path, min_font_size, cache_db)) as executor:
+        pending = set()
+        batches = iter_batches(stream, batch_size)
+        exhausted = False
+        while pending or not exhausted:
+            # Mantém o pool cheio sem acumular o arquivo inteiro em memória
+            while not exhausted and len(pending) < max_in_flight:
+                batch = next(batches, None)
+                if batch is None:
+                    exhausted = True
+                    break
+                pending.add(executor.submit(render_batch, batch))
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results, counters = future.result()
+                cache_counters = [total + delta for total, delta in zip(cache_counters, counters)]
+                for line_number, card_id, fragment, error in results:
+                    error = writer.write(card_id, fragment, error)
+                    if error is None:
+                        rendered += 1
+                    else:
+                        failed += 1
+                        log.write(f"   ❌ linha {line_number} ({card_id}): {error}\n")
+
+    elapsed = time.perf_counter() - started
+    log.write(f"✅ {rendered} cards renderizados, {failed} falhas em {elapsed:.2f}s "
+              f"({rendered / max(elapsed, 1e-9):.0f} cards/s, {workers} processos)\n")
+    if cache_db:
+        hits, disk_hits, misses = cache_counters
+        log.write(f"🗃️  Cache de layout: {hits} hits ({disk_hits} do disco), {misses} misses\n")
+    return rendered, failed
+
+
+def main(argv=None):
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Renderiza cards em lote a partir de specs JSONL")
+    parser.add_argument('input', nargs='?', default='-',
+                        help="arquivo JSONL com uma spec de card por linha (- para stdin)")
+    parser.add_argument('--output-dir',
+                        help="grava um .html por card (padrão: JSONL {id, html, error} no stdout)")
+    parser.add_argument('--stylesheet', default='styles/main.css',
+                        help="CSS referenciado pelos .html gerados")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="processos do pool (padrão: núcleos da CPU)")
+    parser.add_argument('--batch-size', type=int, default=64,
+                        help="cards por tarefa (pontuados juntos em NumPy)")
+    parser.add_argument('--max-in-flight', type=int, default=None,
+                        help="lotes pendentes no pool (padrão: 2 × workers)")
+    parser.add_argument('--glyphs', help="tabela JSON de avanços de glifos")
+    parser.add_argument('--min-font-size', type=float, default=0,
+                        help="tamanho mínimo de fonte imposto pelo navegador")
+    parser.add_argument('--cache-db', metavar='SQLITE',
+                        help="cache persistente de layouts compartilhado pelos processos")
+    args = parser.parse_args(argv)
+
+    if args.cache_db:
+        # Confere (ou registra) a configuração antes de abrir o pool
+        try:
+            create_engine(args.glyphs, args.min_font_size, args.cache_db).cache.close()
+        except CacheConfigError as error:
+            parser.error(str(error))
+
+    writer = CardWriter(args.output_dir, args.stylesheet)
+    stream = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8')
+    try:
+        _, failed = render_stream(stream, writer, args.workers, args.batch_size,
+                                  args.max_in_flight, args.glyphs, args.min_font_size,
+                                  args.cache_db)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Servidor estático de desenvolvimento para o Card Creator.
+Substitui `python3 -m http.server` com threads, keep-alive, cache LRU em
+memória invalidado por mtime, ETags fortes com 304 e negociação de gzip.
+Com --from-source, src/, styles/main.css e index.html vêm direto do HTML
+marcado, gerados em memória a cada edição (sem extração e sem gravar em disco).
+"""
+
+import argparse
+import gzip
+import hashlib
+import mimetypes
+import posixpath
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from extraction_script import ModuleExtractor
+
+# Tipos que vale a pena comprimir
+COMPRESSIBLE_TYPES = {
+    'text/html', 'text/css', 'text/javascript', 'application/javascript',
+    'application/json', 'image/svg+xml', 'text/plain', 'text/markdown'
+}
+MIN_COMPRESS_SIZE = 256
+
+# Arquivos com hash do conteúdo no nome (extraction_script.py --fingerprint)
+# nunca mudam: podem ficar em cache indefinidamente
+FINGERPRINTED_NAME = re.compile(r'\.[0-9a-f]{8}\.(?:js|css)$')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+mimetypes.add_type('text/javascript', '.js')
+mimetypes.add_type('text/javascript', '.mjs')
+
+
+def guess_content_type(name):
+    """Content-Type pela extensão, com charset para texto"""
+    content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    if content_type.startswith('text/'):
+        content_type += '; charset=utf-8'
+    return content_type
+
+
+class CachedFile:
+    """Arquivo em memória com ETag forte e variante gzip opcional"""
+
+    def __init__(self, data, content_type, mtime_ns, gzip_data=None):
+        self.data = data
+        self.content_type = content_type
+        self.mtime_ns = mtime_ns
+        self.etag = f'"{hashlib.sha256(data).hexdigest()[:32]}"'
+        self.gzip_data = gzip_data
+
+    @property
+    def size(self):
+        return len(self.data) + len(self.gzip_data or b'')
+
+    @property
+    def compressible(self):
+        return self.content_type.split(';')[0] in COMPRESSIBLE_TYPES and len(self.data) >= MIN_COMPRESS_SIZE
+
+
+class FileCache:
+    """Cache LRU de arquivos do disco, limitado em bytes e validado por mtime/tamanho"""
+
+    def __init__(self, root, max_bytes=64 * 1024 * 1024):
+        self.root = Path(root).resolve()
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def resolve_path(self, url_path):
+        """Converte o caminho da URL em arquivo sob a raiz (None se inválido)"""
+        path = posixpath.normpath(unquote(url_path))
+        file_path = (self.root / path.lstrip('/')).resolve()
+        if file_path != self.root and self.root not in file_path.parents:
+            return None
+        if file_path.is_dir():
+            file_path = file_path / 'index.html'
+        return file_path
+
+    def get(self, url_path):
+        """Retorna o CachedFile do caminho, relendo o disco só se ele mudou"""
+        file_path = self.resolve_path(url_path)
+        if file_path is None:
+            return None
+        try:
+            stat = file_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+        key = str(file_path)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.mtime_ns == stat.st_mtime_ns and len(entry.data) == stat.st_size:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._load(file_path, stat)
+        with self._lock:
+            self.misses += 1
+            self._store(key, entry)
+        return entry
+
+    def _load(self, file_path, stat):
+        data = file_path.read_bytes()
+        entry = CachedFile(data, guess_content_type(file_path.name), stat.st_mtime_ns)
+
+        # Aproveita o .gz gerado pelo extrator (--gzip) se estiver atualizado
+        gz_path = file_path.with_name(file_path.name + '.gz')
+        try:
+            if gz_path.stat().st_mtime_ns >= stat.st_mtime_ns:
+                entry.gzip_data = gz_path.read_bytes()
+        except FileNotFoundError:
+            pass
+        if entry.gzip_data is None and entry.compressible:
+            entry.gzip_data = gzip.compress(data, compresslevel=6, mtime=0)
+        return entry
+
+    def _store(self, key, entry):
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= previous.size
+        if entry.size > self.max_bytes:
+            return
+        self.entries[key] = entry
+        self.total_bytes += entry.size
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= evicted.size
+
+
+class VirtualFileResolver:
+    """Resolve as saídas do extrator a partir do HTML marcado, em memória
+    
+    Caminhos que o extrator não gera (imagens, etc.) caem no FileCache.
+    """
+
+    def __init__(self, extractor, fallback):
+        self.extractor = extractor
+        self.fallback = fallback
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, url_path):
+        """Retorna o CachedFile gerado do fonte atual, comprimindo só quando muda"""
+        relative_path = posixpath.normpath(unquote(url_path)).lstrip('/')
+        if relative_path in ('', '.'):
+            relative_path = 'index.html'
+        content = self.extractor.virtual_file(relative_path)
+        if content is None:
+            return self.fallback.get(url_path)
+
+        with self._lock:
+            cached = self.entries.get(relative_path)
+            if cached is not None and cached[0] is content:
+                self.hits += 1
+                return cached[1]
+
+        entry = CachedFile(content.encode('utf-8'), guess_content_type(relative_path), 0)
+        if entry.compressible:
+            entry.gzip_data = gzip.compress(entry.data, compresslevel=6, mtime=0)
+        with self._lock:
+            self.misses += 1
+            # O extrator devolve o mesmo objeto enquanto a região não muda
+            self.entries[relative_path] = (content, entry)
+        return entry
+
+
+class CachingRequestHandler(BaseHTTPRequestHandler):
+    """Serve arquivos do cache com ETag, 304, keep-alive e gzip"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'CardCreatorDevServer/1.0'
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def _serve(self, send_body):
+        started = time.perf_counter()
+        url_path = urlsplit(self.path).path
+        entry = self.server.resolver.get(url_path)
+
+        if entry is None:
+            self._finish(HTTPStatus.NOT_FOUND, b'Not Found', 'text/plain; charset=utf-8',
+                         send_body, started)
+            return
+
+        body = entry.data
+        etag = entry.etag
+        encoding = None
+        if entry.gzip_data is not None and self._accepts_gzip():
+            # Cada representação tem sua própria ETag forte
+            body = entry.gzip_data
+            etag = entry.etag[:-1] + '-gzip"'
+            encoding = 'gzip'
+
+        if self._etag_matches(etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._common_headers(etag, url_path)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            self._log_request(HTTPStatus.NOT_MODIFIED, 0, started)
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self._common_headers(etag, url_path)
+        self.send_header('Content-Type', entry.content_type)
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+        self._log_request(HTTPStatus.OK, len(body) if send_body else 0, started, encoding)
+
+    def _common_headers(self, etag, url_path):
+        self.send_header('ETag', etag)
+        if FINGERPRINTED_NAME.search(url_path):
+            self.send_header('Cache-Control', IMMUTABLE_CACHE_CONTROL)
+        else:
+            self.send_header('Cache-Control', self.server.cache_control)
+        self.send_header('Vary', 'Accept-Encoding')
+
+    def _finish(self, status, body, content_type, send_body, started):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+        self._log_request(status, len(body), started)
+
+    def _etag_matches(self, etag):
+        header = self.headers.get('If-None-Match')
+        if not header:
+            return False
+        candidates = {candidate.strip() for candidate in header.split(',')}
+        return '*' in candidates or etag in candidates
+
+    def _accepts_gzip(self):
+        for part in self.headers.get('Accept-Encoding', '').split(','):
+            name, _, params = part.strip().partition(';')
+            if name.strip().lower() != 'gzip':
+                continue
+            params = params.replace(' ', '')
+            return params not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+        return False
+
+    def _log_request(self, status, size, started, encoding=None):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        suffix = f' {encoding}' if encoding else ''
+        self.server.log(f"{self.command} {self.path} {int(status)} {size}B{suffix} {elapsed_ms:.2f}ms")
+
+    def log_message(self, format, *args):
+        # O log padrão é substituído pelo _log_request (com latência)
+        pass
+
+
+class DevServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer com resolvedor de arquivos e log com latência"""
+
+    daemon_threads = True
+
+    def __init__(self, address, resolver, cache_control='no-cache', quiet=False):
+        super().__init__(address, CachingRequestHandler)
+        self.resolver = resolver
+        self.cache_control = cache_control
+        self.quiet = quiet
+        self._log_lock = threading.Lock()
+
+    def log(self, message):
+        if self.quiet:
+            return
+        with self._log_lock:
+            sys.stderr.write(f"{time.strftime('%H:%M:%S')} {message}\n")
+
+
+def main(argv=None):
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Servidor de desenvolvimento do Card Creator")
+    parser.add_argument('port', nargs='?', type=int, default=8000)
+    parser.add_argument('--bind', default='127.0.0.1', help="endereço de escuta")
+    parser.add_argument('--root', default='.', help="diretório servido")
+    parser.add_argument('--cache-mb', type=int, default=64, help="limite do cache em memória")
+    parser.add_argument('--cache-control', default='no-cache',
+                        help="cabeçalho Cache-Control (no-cache força revalidação via ETag)")
+    parser.add_argument('--quiet', action='store_true', help="desativa o log de requisições")
+    parser.add_argument('--from-source', nargs='?', const='card-creator-com-marcacoes.html',
+                        metavar='MARKED_HTML',
+                        help="gera src/, styles/main.css e index.html em memória a partir do HTML marcado")
+    args = parser.parse_args(argv)
+
+    resolver = FileCache(args.root, args.cache_mb * 1024 * 1024)
+    served = resolver.root
+    if args.from_source:
+        extractor = ModuleExtractor(args.from_source, project_root=args.root, quiet=True)
+        resolver = VirtualFileResolver(extractor, resolver)
+        served = f"{args.from_source} (em memória) + {served}"
+    server = DevServer((args.bind, args.port), resolver, args.cache_control, args.quiet)
+
+    print(f"🌐 Servindo {served} em http://{args.bind}:{args.port}/ (Ctrl+C para sair)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n👋 Servidor encerrado (cache: {resolver.hits} hits, {resolver.misses} misses)")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
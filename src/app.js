@@ -1,16 +1,23 @@
+import { LayoutCache } from './layout/layoutCache.js';
 import { EnhancedUIController } from './ui/enhancedUIController.js';
 
 document.addEventListener('DOMContentLoaded', () => {
+    // Layouts pré-calculados (layout_cache.py --export); ausente é normal.
+    // Não bloqueia a interface: só o primeiro layout espera a resposta
+    LayoutCache.shared.preload('layout-cache.json');
+    
     try {
         window.cardCreator = new EnhancedUIController();
-        console.log('✅ Card Creator v4.1 (Refatorado) inicializado com sucesso');
-        console.log('🏛️  Arquitetura modular baseada nos princípios SOLID, KISS e DRY.');
+        console.log('✅ Card Creator v4.1 (CORRIGIDO) inicializado com sucesso');
+        console.log('🔧 Bug de validação de string corrigido');
         console.log('📦 Plugins disponíveis:', window.cardCreator.state.pluginRegistry.getAll().map(p => p.name));
+        console.log('🧪 Teste: Adicione um bloco de texto - deve funcionar normalmente agora');
     } catch (error) {
         console.error('❌ Erro na inicialização:', error);
+        
         const container = document.getElementById('cardContent');
         if (container) {
-            container.innerHTML = '<div style="color: red;">Erro crítico na inicialização da aplicação.</div>';
+            container.innerHTML = '<div style="color: red;">Erro crítico na inicialização da Fase 2</div>';
         }
     }
-});
+});
\ No newline at end of file
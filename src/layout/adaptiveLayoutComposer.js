@@ -1,60 +1,12 @@
-import { ContentAnalyzer } from '../analysis/contentAnalyzer.js';
-import { LayoutComposer } from './layoutComposer.js';
-import { LayoutOptimizer } from './layoutOptimizer.js';
-import { BlockPluginRegistry } from '../plugins/pluginRegistry.js';
 import { Result } from '../utils/result.js';
 import { LayoutError } from '../utils/customErrors.js';
-
-export class LayoutStrategy {
-    constructor(name) {
-        this.name = name;
-    }
-    
-    async compose(blocks, context) {
-        throw new Error('compose must be implemented by subclass');
-    }
-}
-
-export class TextOptimizedStrategy extends LayoutStrategy {
-    constructor() {
-        super('text-optimized');
-    }
-    
-    async compose(blocks, context) {
-        const composer = new LayoutComposer(blocks, context.config.typographicRatio);
-        return composer.findBestCandidate();
-    }
-}
-
-export class MixedContentStrategy extends LayoutStrategy {
-    constructor() {
-        super('mixed-content');
-    }
-    
-    async compose(blocks, context) {
-        const composer = new LayoutComposer(blocks, context.config.typographicRatio);
-        const result = await composer.findBestCandidate();
-        
-        if (result.isSuccess) {
-            const adjusted = { ...result.value };
-            adjusted.baseFontSize = Math.max(adjusted.baseFontSize * 0.9, 6);
-            return Result.success(adjusted);
-        }
-        
-        return result;
-    }
-}
-
-export class BalancedStrategy extends LayoutStrategy {
-    constructor() {
-        super('balanced');
-    }
-    
-    async compose(blocks, context) {
-        const composer = new LayoutComposer(blocks, context.config.typographicRatio);
-        return composer.findBestCandidate();
-    }
-}
+import { loadChunk } from '../utils/chunkLoader.js';
+import { BlockPluginRegistry } from '../plugins/pluginRegistry.js';
+import { ContentAnalyzer } from '../analysis/contentAnalyzer.js';
+import { LayoutOptimizer } from './layoutOptimizer.js';
+import { TextOptimizedStrategy } from './strategies/textOptimizedStrategy.js';
+import { MixedContentStrategy } from './strategies/mixedContentStrategy.js';
+import { BalancedStrategy } from './strategies/balancedStrategy.js';
 
 export class AdaptiveLayoutComposer {
     constructor() {
@@ -62,9 +14,15 @@ export class AdaptiveLayoutComposer {
         this.strategies = new Map();
         this.pluginRegistry = new BlockPluginRegistry();
         
-        this.strategies.set('text-optimized', new TextOptimizedStrategy());
-        this.strategies.set('mixed-content', new MixedContentStrategy());
-        this.strategies.set('balanced', new BalancedStrategy());
+        // Estratégias específicas são carregadas só quando selecionadas;
+        // a balanced é a padrão (primeira pintura) e fica no chunk principal
+        this.strategies.set('text-optimized', () =>
+            loadChunk('src/layout/strategies/textOptimizedStrategy.js', () => TextOptimizedStrategy)
+                .then(Strategy => new Strategy()));
+        this.strategies.set('mixed-content', () =>
+            loadChunk('src/layout/strategies/mixedContentStrategy.js', () => MixedContentStrategy)
+                .then(Strategy => new Strategy()));
+        this.strategies.set('balanced', async () => new BalancedStrategy());
     }
     
     async createLayout(blocks, config) {
@@ -74,7 +32,7 @@ export class AdaptiveLayoutComposer {
             }
             
             const analysis = this.contentAnalyzer.analyze(blocks);
-            const strategy = this.selectOptimalStrategy(analysis, config);
+            const strategy = await this.selectOptimalStrategy(analysis, config);
             const blocksWithHierarchy = this._calculateHierarchy(blocks, config);
             
             const candidateResult = await strategy.compose(blocksWithHierarchy, {
@@ -104,16 +62,16 @@ export class AdaptiveLayoutComposer {
         }
     }
     
-    selectOptimalStrategy(analysis, config) {
+    async selectOptimalStrategy(analysis, config) {
         if (analysis.hasImages && analysis.textDensity > 0.7) {
-            return this.strategies.get('mixed-content');
+            return this.strategies.get('mixed-content')();
         }
         
         if (analysis.hasOnlyText && analysis.totalBlocks > 3) {
-            return this.strategies.get('text-optimized');
+            return this.strategies.get('text-optimized')();
         }
         
-        return this.strategies.get('balanced');
+        return this.strategies.get('balanced')();
     }
     
     _calculateHierarchy(blocks, config) {
@@ -136,4 +94,4 @@ export class AdaptiveLayoutComposer {
             return { ...block, hierarchy: Math.round(hierarchy) };
         });
     }
-}
\ No newline at end of file
+}
@@ -0,0 +1,169 @@
+/**
+ * Cache LRU de resultados do LayoutComposer, chaveado pelo conteúdo dos blocos
+ * (tipo, hierarquia, texto, dimensões de imagem) e pela razão tipográfica.
+ * Pode ser pré-carregado com o JSON exportado por layout_cache.py.
+ */
+export class LayoutCache {
+    // Constantes de rodada do SHA-256 (FIPS 180-4)
+    static SHA256_K = [
+        0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+        0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+        0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+        0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+        0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+        0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+        0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+        0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+    ];
+        
+    constructor(maxEntries = 500) {
+        this.maxEntries = maxEntries;
+        this.entries = new Map();
+        this.hits = 0;
+        this.misses = 0;
+        // preload() em andamento; a primeira consulta espera por ele
+        this.pending = null;
+    }
+        
+    static get shared() {
+        if (!LayoutCache._shared) {
+            LayoutCache._shared = new LayoutCache();
+        }
+        return LayoutCache._shared;
+    }
+        
+    /**
+     * JSON canônico dos blocos (já na ordem do LayoutComposer)
+     * @returns {string}
+     */
+    static canonicalKey(blocks, ratio) {
+        return JSON.stringify([ratio, blocks.map(block => {
+            const data = block.content?.data || {};
+            return [block.type, block.hierarchy, data.text ?? null, data.width ?? null, data.height ?? null];
+        })]);
+    }
+        
+    /**
+     * Chave do cache: SHA-256 do JSON canônico (o mesmo hash do layout_cache.py)
+     * @returns {Promise<string>}
+     */
+    async key(blocks, ratio) {
+        const canonical = LayoutCache.canonicalKey(blocks, ratio);
+        if (!globalThis.crypto?.subtle) {
+            // Contexto não seguro (HTTP fora de localhost): sem crypto.subtle
+            return LayoutCache.sha256Hex(canonical);
+        }
+        const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(canonical));
+        return Array.from(new Uint8Array(digest), byte => byte.toString(16).padStart(2, '0')).join('');
+    }
+        
+    /**
+     * SHA-256 síncrono (hex) do texto em UTF-8
+     * @param {string} text
+     * @returns {string}
+     */
+    static sha256Hex(text) {
+        const bytes = new TextEncoder().encode(text);
+        const length = (bytes.length + 72) & ~63;
+        const padded = new Uint8Array(length);
+        padded.set(bytes);
+        padded[bytes.length] = 0x80;
+        const view = new DataView(padded.buffer);
+        view.setUint32(length - 8, Math.floor(bytes.length / 0x20000000));
+        view.setUint32(length - 4, (bytes.length << 3) >>> 0);
+        
+        const K = LayoutCache.SHA256_K;
+        const hash = [0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19];
+        const w = new Uint32Array(64);
+        const rotr = (x, n) => (x >>> n) | (x << (32 - n));
+        for (let offset = 0; offset < length; offset += 64) {
+            for (let i = 0; i < 16; i++) {
+                w[i] = view.getUint32(offset + i * 4);
+            }
+            for (let i = 16; i < 64; i++) {
+                const s0 = rotr(w[i - 15], 7) ^ rotr(w[i - 15], 18) ^ (w[i - 15] >>> 3);
+                const s1 = rotr(w[i - 2], 17) ^ rotr(w[i - 2], 19) ^ (w[i - 2] >>> 10);
+                w[i] = w[i - 16] + s0 + w[i - 7] + s1;
+            }
+            let [a, b, c, d, e, f, g, h] = hash;
+            for (let i = 0; i < 64; i++) {
+                const t1 = (h + (rotr(e, 6) ^ rotr(e, 11) ^ rotr(e, 25)) + ((e & f) ^ (~e & g)) + K[i] + w[i]) | 0;
+                const t2 = ((rotr(a, 2) ^ rotr(a, 13) ^ rotr(a, 22)) + ((a & b) ^ (a & c) ^ (b & c))) | 0;
+                h = g; g = f; f = e; e = (d + t1) | 0;
+                d = c; c = b; b = a; a = (t1 + t2) | 0;
+            }
+            [a, b, c, d, e, f, g, h].forEach((value, i) => { hash[i] = (hash[i] + value) | 0; });
+        }
+        return hash.map(value => (value >>> 0).toString(16).padStart(8, '0')).join('');
+    }
+        
+    get(key) {
+        const value = this.entries.get(key);
+        if (value === undefined) {
+            this.misses++;
+            return null;
+        }
+        // Reinsere para marcar como usado recentemente
+        this.entries.delete(key);
+        this.entries.set(key, value);
+        this.hits++;
+        return value;
+    }
+        
+    set(key, value) {
+        this.entries.delete(key);
+        this.entries.set(key, value);
+        if (this.entries.size > this.maxEntries) {
+            this.entries.delete(this.entries.keys().next().value);
+        }
+    }
+        
+    /**
+     * Carrega resultados pré-calculados sem bloquear quem chama; a
+     * primeira consulta do LayoutComposer espera por eles (ready)
+     * @param {string} url - JSON exportado ({ version, entries })
+     * @returns {Promise<number>} quantidade de resultados carregados
+     */
+    preload(url) {
+        this.pending = this._load(url).finally(() => {
+            this.pending = null;
+        });
+        return this.pending;
+    }
+        
+    /**
+     * Espera o preload em andamento, se houver
+     * @returns {Promise<void>}
+     */
+    async ready() {
+        if (this.pending) {
+            await this.pending;
+        }
+    }
+        
+    /**
+     * Busca o JSON exportado; um arquivo ausente não é erro
+     * @returns {Promise<number>}
+     */
+    async _load(url) {
+        try {
+            const response = await fetch(url);
+            if (!response.ok) {
+                return 0;
+            }
+            const data = await response.json();
+            const entries = Object.entries(data.entries || {});
+            this.maxEntries = Math.max(this.maxEntries, entries.length + 500);
+            for (const [key, value] of entries) {
+                this.set(key, value);
+            }
+            return entries.length;
+        } catch (error) {
+            return 0;
+        }
+    }
+        
+    getStats() {
+        return { hits: this.hits, misses: this.misses, entries: this.entries.size };
+    }
+}
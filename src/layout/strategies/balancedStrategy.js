@@ -0,0 +1,13 @@
+import { LayoutComposer } from '../layoutComposer.js';
+import { LayoutStrategy } from './layoutStrategy.js';
+
+export class BalancedStrategy extends LayoutStrategy {
+    constructor() {
+        super('balanced');
+    }
+    
+    async compose(blocks, context) {
+        const composer = new LayoutComposer(blocks, context.config.typographicRatio);
+        return composer.findBestCandidate();
+    }
+}
@@ -0,0 +1,9 @@
+export class LayoutStrategy {
+    constructor(name) {
+        this.name = name;
+    }
+    
+    async compose(blocks, context) {
+        throw new Error('compose must be implemented by subclass');
+    }
+}
@@ -0,0 +1,22 @@
+import { Result } from '../../utils/result.js';
+import { LayoutComposer } from '../layoutComposer.js';
+import { LayoutStrategy } from './layoutStrategy.js';
+
+export class MixedContentStrategy extends LayoutStrategy {
+    constructor() {
+        super('mixed-content');
+    }
+    
+    async compose(blocks, context) {
+        const composer = new LayoutComposer(blocks, context.config.typographicRatio);
+        const result = await composer.findBestCandidate();
+        
+        if (result.isSuccess) {
+            const adjusted = { ...result.value };
+            adjusted.baseFontSize = Math.max(adjusted.baseFontSize * 0.9, 6);
+            return Result.success(adjusted);
+        }
+        
+        return result;
+    }
+}
@@ -0,0 +1,13 @@
+import { LayoutComposer } from '../layoutComposer.js';
+import { LayoutStrategy } from './layoutStrategy.js';
+
+export class TextOptimizedStrategy extends LayoutStrategy {
+    constructor() {
+        super('text-optimized');
+    }
+    
+    async compose(blocks, context) {
+        const composer = new LayoutComposer(blocks, context.config.typographicRatio);
+        return composer.findBestCandidate();
+    }
+}
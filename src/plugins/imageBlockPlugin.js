@@ -1,6 +1,6 @@
-import { BlockPlugin } from './blockPlugin.js';
 import { Result } from '../utils/result.js';
 import { ValidationError } from '../utils/customErrors.js';
+import { BlockPlugin } from './blockPlugin.js';
 
 export class ImageBlockPlugin extends BlockPlugin {
     constructor() {
@@ -33,13 +33,13 @@ export class ImageBlockPlugin extends BlockPlugin {
         input.type = 'url';
         input.className = 'block-image-input';
         input.placeholder = 'URL da imagem...';
-        input.value = block.content.data.src || '';
+        input.value = block.content.data.src;
         
         const altInput = document.createElement('input');
         altInput.type = 'text';
         altInput.className = 'block-image-input';
         altInput.placeholder = 'Texto alternativo...';
-        altInput.value = block.content.data.alt || 'Imagem';
+        altInput.value = block.content.data.alt;
         
         container.appendChild(input);
         container.appendChild(altInput);
@@ -79,9 +79,8 @@ export class ImageBlockPlugin extends BlockPlugin {
         if (!block.content.data.src) {
             const placeholder = document.createElement('div');
             placeholder.className = 'card-element';
-            placeholder.textContent = '🖼️ Adicione uma URL de imagem';
+            placeholder.textContent = '🖼️ Imagem';
             placeholder.style.fontSize = `${context.fontSize}px`;
-            placeholder.style.color = '#64748b';
             return placeholder;
         }
         
@@ -92,9 +91,8 @@ export class ImageBlockPlugin extends BlockPlugin {
         img.onerror = () => {
             const fallback = document.createElement('div');
             fallback.className = 'card-element';
-            fallback.textContent = '🖼️ Erro ao carregar imagem';
+            fallback.textContent = '🖼️ Erro na imagem';
             fallback.style.fontSize = `${context.fontSize * 0.8}px`;
-            fallback.style.color = '#ef4444';
             img.parentNode?.replaceChild(fallback, img);
         };
         return img;
@@ -105,22 +103,20 @@ export class ImageBlockPlugin extends BlockPlugin {
             return Result.failure(new ValidationError('Dados da imagem devem ser um objeto'));
         }
         
-        // CORREÇÃO: Permitir URL vazia para blocos novos
-        const src = data.src || '';
+        if (!data.src || typeof data.src !== 'string') {
+            return Result.failure(new ValidationError('URL da imagem é obrigatória'));
+        }
         
-        // Se há URL, deve ser válida
-        if (src && src.trim()) {
-            try {
-                new URL(src.trim());
-            } catch {
-                return Result.failure(new ValidationError('URL da imagem inválida'));
-            }
+        try {
+            new URL(data.src);
+        } catch {
+            return Result.failure(new ValidationError('URL da imagem inválida'));
         }
         
         return Result.success({
-            src: src.trim(),
+            src: data.src.trim(),
             alt: (data.alt || 'Imagem').trim(),
             fit: data.fit || 'cover'
         });
     }
-}
\ No newline at end of file
+}
@@ -1,45 +1,84 @@
-import { BlockPlugin } from './blockPlugin.js';
 import { Result } from '../utils/result.js';
+import { BlockPlugin } from './blockPlugin.js';
 
 export class BlockPluginRegistry {
-            constructor() {
-                this.plugins = new Map();
-                this.selectedType = 'text';
-            }
-            
-            register(plugin) {
-                if (!(plugin instanceof BlockPlugin)) {
-                    throw new Error('Plugin must extend BlockPlugin');
-                }
-                this.plugins.set(plugin.type, plugin);
-            }
-            
-            get(type) {
-                return this.plugins.get(type);
-            }
-            
-            getAll() {
-                return Array.from(this.plugins.values());
-            }
-            
-            createBlock(type, data) {
-                const plugin = this.plugins.get(type);
-                if (!plugin) {
-                    return Result.failure(new Error(`Unknown block type: ${type}`));
-                }
-                return plugin.createBlock(data);
-            }
-            
-            setSelectedType(type) {
-                if (this.plugins.has(type)) {
-                    this.selectedType = type;
-                    return Result.success(type);
-                }
-                return Result.failure(new Error(`Plugin type ${type} not found`));
-            }
-            
-            getSelectedType() {
-                return this.selectedType;
-            }
+    constructor() {
+        this.plugins = new Map();
+        this.lazyPlugins = new Map();
+        this.selectedType = 'text';
+    }
+    
+    register(plugin) {
+        if (!(plugin instanceof BlockPlugin)) {
+            throw new Error('Plugin must extend BlockPlugin');
+        }
+        this.plugins.set(plugin.type, plugin);
+        this.lazyPlugins.delete(plugin.type);
+    }
+    
+    /**
+     * Registra um plugin carregado só quando for usado
+     * @param {Object} descriptor - { type, name, icon } exibidos antes do carregamento
+     * @param {Function} load - () => Promise<BlockPlugin>
+     */
+    registerLazy(descriptor, load) {
+        if (!this.plugins.has(descriptor.type)) {
+            this.lazyPlugins.set(descriptor.type, { ...descriptor, load, pending: null });
+        }
+    }
+    
+    /**
+     * Garante que o plugin do tipo esteja carregado
+     * @param {string} type - Tipo do bloco
+     * @returns {Promise<BlockPlugin|undefined>}
+     */
+    async load(type) {
+        const lazy = this.lazyPlugins.get(type);
+        if (!lazy) {
+            return this.plugins.get(type);
+        }
+        if (!lazy.pending) {
+            lazy.pending = lazy.load().then(plugin => {
+                this.register(plugin);
+                return plugin;
+            }).catch(error => {
+                lazy.pending = null;
+                throw error;
+            });
+        }
+        return lazy.pending;
+    }
+    
+    loadAll(types) {
+        return Promise.all([...new Set(types)].map(type => this.load(type)));
+    }
+    
+    get(type) {
+        return this.plugins.get(type);
+    }
+    
+    getAll() {
+        // Plugins ainda não carregados aparecem pelo descritor (tipo, nome e ícone)
+        return [...this.plugins.values(), ...this.lazyPlugins.values()];
+    }
+    
+    createBlock(type, data) {
+        const plugin = this.plugins.get(type);
+        if (!plugin) {
+            return Result.failure(new Error(`Unknown block type: ${type}`));
+        }
+        return plugin.createBlock(data);
+    }
+    
+    setSelectedType(type) {
+        if (this.plugins.has(type) || this.lazyPlugins.has(type)) {
+            this.selectedType = type;
+            return Result.success(type);
         }
-        //
+        return Result.failure(new Error(`Plugin type ${type} not found`));
+    }
+    
+    getSelectedType() {
+        return this.selectedType;
+    }
+}
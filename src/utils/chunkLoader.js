@@ -0,0 +1,13 @@
+/**
+ * Carrega um módulo sob demanda.
+ * No arquivo único o símbolo já está no escopo e `local` apenas o
+ * devolve; com `extraction_script.py --split` cada chamada é trocada por
+ * import() do chunk do módulo, baixado só quando for usado. Fora da
+ * chamada o símbolo não deve ser citado (use o valor resolvido).
+ * @param {string} modulePath - Caminho do módulo (ex.: src/plugins/imageBlockPlugin.js)
+ * @param {Function} local - () => Símbolo exportado pelo módulo
+ * @returns {Promise<*>}
+ */
+export function loadChunk(modulePath, local) {
+    return Promise.resolve(local());
+}
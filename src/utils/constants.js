@@ -1,7 +1,6 @@
-
 export const SCALE_OPTIONS = [
     { name: "Suave", value: 1.200 },
     { name: "Clássica", value: 1.333 },
     { name: "Impactante", value: 1.500 },
     { name: "Dinâmica", value: 1.618 }
-];
\ No newline at end of file
+];
@@ -6,17 +6,17 @@ export class CardCreatorError extends Error {
         this.context = context;
     }
 }
-
+        
 export class LayoutError extends CardCreatorError {
     constructor(message, context = {}) {
         super(message, 'LAYOUT_ERROR', context);
         this.name = 'LayoutError';
     }
 }
-
+        
 export class ValidationError extends CardCreatorError {
     constructor(message, context = {}) {
         super(message, 'VALIDATION_ERROR', context);
         this.name = 'ValidationError';
     }
-}
\ No newline at end of file
+}
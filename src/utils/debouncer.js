@@ -1,12 +1,11 @@
 export class Debouncer {
-            constructor(delay = 250) {
-                this.delay = delay;
-                this.timeoutId = null;
-            }
-            
-            execute(fn) {
-                clearTimeout(this.timeoutId);
-                this.timeoutId = setTimeout(fn, this.delay);
-            }
-        }
-        //
+    constructor(delay = 250) {
+        this.delay = delay;
+        this.timeoutId = null;
+    }
+    
+    execute(fn) {
+        clearTimeout(this.timeoutId);
+        this.timeoutId = setTimeout(fn, this.delay);
+    }
+}
@@ -0,0 +1,144 @@
+/**
+ * Exporta resultados de referência de LayoutComposer.findBestCandidate para
+ * comparar com layout_engine.py (--reference e tests/test_layout_engine.py).
+ * Cada linha da saída é {baseFontSize, lineHeight, badness} ou null; com
+ * --scores, a badness de cada candidato de _generateCandidates, na ordem.
+ *
+ * No navegador: abra card-creator-com-marcacoes.html, cole este arquivo no
+ * console e rode
+ *     copy(await exportLayoutReference(cards))
+ *     copy(await exportCandidateScores(cards))
+ * com `cards` = [{ratio, blocks}] (o mesmo JSONL lido por layout_engine.py).
+ *
+ * Sem navegador: roda o mesmo código do LayoutComposer, lido das regiões
+ * marcadas, sobre um DOM mínimo que mede o texto com uma tabela de glifos
+ * (quebra gulosa, white-space: normal). É assim que os fixtures de
+ * tests/fixtures foram gerados:
+ *     node tests/export_layout_reference.js cards.jsonl glyphs.json > reference.jsonl
+ *     node tests/export_layout_reference.js --scores cards.jsonl glyphs.json > scores.jsonl
+ */
+
+async function exportLayoutReference(cards, Composer = LayoutComposer) {
+    // Cache vazio: a referência vem sempre da medição, nunca de um layout-cache.json
+    if (typeof LayoutCache !== 'undefined') {
+        LayoutCache._shared = new LayoutCache();
+    }
+    const lines = [];
+    for (const card of cards) {
+        const result = await new Composer(card.blocks, card.ratio).findBestCandidate();
+        const { baseFontSize, lineHeight, badness } = result.value || {};
+        lines.push(JSON.stringify(result.isSuccess ? { baseFontSize, lineHeight, badness } : null));
+    }
+    return lines.join('\n') + '\n';
+}
+
+async function exportCandidateScores(cards, Composer = LayoutComposer) {
+    const lines = [];
+    for (const card of cards) {
+        const composer = new Composer(card.blocks, card.ratio);
+        const scores = [];
+        for (const candidate of composer._generateCandidates()) {
+            scores.push((await composer._evaluateCandidate(candidate)).badness);
+        }
+        lines.push(JSON.stringify(scores));
+    }
+    return lines.join('\n') + '\n';
+}
+
+if (typeof module !== 'undefined' && require.main === module) {
+    const fs = require('fs');
+    const path = require('path');
+    const vm = require('vm');
+
+    const SOURCE = path.join(__dirname, '..', 'card-creator-com-marcacoes.html');
+    const MODULES = [
+        'src/utils/result.js',
+        'src/utils/customErrors.js',
+        'src/layout/layoutCache.js',
+        'src/layout/layoutComposer.js'
+    ];
+    const WRAP_EPSILON = 1e-9;
+
+    const args = process.argv.slice(2);
+    const scores = args[0] === '--scores';
+    const [cardsPath, glyphsPath] = scores ? args.slice(1) : args;
+    if (!cardsPath || !glyphsPath) {
+        process.stderr.write('uso: node tests/export_layout_reference.js [--scores] cards.jsonl glyphs.json\n');
+        process.exit(2);
+    }
+
+    const glyphs = JSON.parse(fs.readFileSync(glyphsPath, 'utf-8'));
+    const unitsPerEm = glyphs.units_per_em || 1000;
+    const advance = char => {
+        let width = glyphs.advances[char];
+        if (width === undefined) {
+            width = glyphs.advances[char.normalize('NFD')[0]];
+        }
+        return (width === undefined ? (glyphs.default || 556) : width) / unitsPerEm;
+    };
+    const wordWidth = word => [...word].reduce((sum, char) => sum + advance(char), 0);
+
+    // Linhas de um texto numa largura disponível (em), palavra a palavra
+    const countLines = (text, available) => {
+        const space = advance(' ');
+        let lines = 0;
+        let lineWidth = 0;
+        for (const word of text.split(/\s+/).filter(Boolean)) {
+            const width = wordWidth(word);
+            if (lines > 0 && lineWidth + space + width <= available + WRAP_EPSILON) {
+                lineWidth += space + width;
+            } else {
+                lines++;
+                lineWidth = width;
+            }
+        }
+        return lines;
+    };
+
+    const styleValue = (cssText, property) => {
+        const match = new RegExp(`(?:^|;)\\s*${property}:\\s*([\\d.e+-]+)`).exec(cssText);
+        return match ? parseFloat(match[1]) : null;
+    };
+
+    class Element {
+        constructor() {
+            this.style = { cssText: '' };
+            this.children = [];
+            this.parent = null;
+            this.text = '';
+        }
+        set textContent(value) { this.text = String(value); }
+        get textContent() { return this.text; }
+        appendChild(child) { child.parent = this; this.children.push(child); return child; }
+        removeChild(child) { this.children.splice(this.children.indexOf(child), 1); return child; }
+        get offsetHeight() {
+            const fontSize = styleValue(this.style.cssText, 'font-size');
+            const lineHeight = styleValue(this.style.cssText, 'line-height');
+            const width = styleValue(this.parent.style.cssText, 'width');
+            return Math.round(countLines(this.text, width / fontSize) * fontSize * lineHeight);
+        }
+    }
+
+    const document = { createElement: () => new Element(), body: new Element() };
+    const window = {
+        getComputedStyle: el => ({ fontSize: `${styleValue(el.style.cssText, 'font-size')}px` })
+    };
+
+    const html = fs.readFileSync(SOURCE, 'utf-8');
+    const code = MODULES.map(modulePath => {
+        const escaped = modulePath.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+        const region = new RegExp(`===== CORTE: ${escaped} - INÍCIO =====([\\s\\S]*?)// ===== CORTE: ${escaped} - FIM`).exec(html);
+        if (!region) {
+            throw new Error(`${modulePath} sem marcações em ${SOURCE}`);
+        }
+        return region[1];
+    }).join('\n');
+
+    const context = vm.createContext({ document, window, console, TextEncoder });
+    context.globalThis = context;
+    vm.runInContext(`${code}\nthis.LayoutComposer = LayoutComposer;`, context);
+
+    const cards = fs.readFileSync(cardsPath, 'utf-8').split('\n').filter(line => line.trim()).map(JSON.parse);
+    const exporter = scores ? exportCandidateScores : exportLayoutReference;
+    exporter(cards, context.LayoutComposer).then(output => process.stdout.write(output));
+}
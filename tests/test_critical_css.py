@@ -0,0 +1,68 @@
+"""Seletores críticos e divisão do CSS no critical_css.py."""
+
+import pytest
+
+from critical_css import TemplateDocument, selector_matches, split_css
+
+HTML = '''
+<html><body>
+  <div id="app" class="shell">
+    <header class="top"><h1 class="title">Cards</h1></header>
+    <main class="grid" data-view="cards-list"><p>Vazio</p></main>
+    <input type="text" name="q">
+  </div>
+</body></html>
+'''
+
+
+@pytest.fixture(scope='module')
+def document():
+    return TemplateDocument(HTML)
+
+
+@pytest.mark.parametrize('selector', [
+    '#app',
+    '.shell > header .title',
+    'header + main',
+    'header ~ input',
+    'main > p:first-child',
+    'input[type="text"]',
+    '[data-view|=cards]',
+    'html:root body',
+    '.title:hover',
+    '.title::after',
+    'div:has(> p)',
+])
+def test_selector_matches_template(document, selector):
+    assert selector_matches(document, selector)
+
+
+@pytest.mark.parametrize('selector', [
+    '.card',
+    'header > p',
+    'main + header',
+    'p:last-child.missing',
+    'input[type=checkbox]',
+    '#app > h1',
+    'body:root',
+])
+def test_selector_does_not_match_template(document, selector):
+    assert not selector_matches(document, selector)
+
+
+def test_split_keeps_every_rule_and_wraps_media_children():
+    css = (
+        '@import url("fonts.css");\n'
+        '.shell { display: grid; }\n'
+        '.card { color: red; }\n'
+        '@media (max-width: 600px) { .title { font-size: 1rem; } .card { padding: 0; } }\n'
+        '@font-face { font-family: X; src: url(x.woff2); }\n'
+    )
+
+    critical, rest, report = split_css(css, HTML)
+
+    assert '@import' in critical and '.shell' in critical and '.title' in critical
+    assert '.card' not in critical and '@font-face' not in critical
+    assert critical.count('@media') == 1 and rest.count('@media') == 1
+    assert report['complete']
+    assert report['critical_rules'] + report['rest_rules'] == report['original_rules']
@@ -0,0 +1,154 @@
+"""Índice de marcações e grafo de módulos do extraction_script.py."""
+
+import pytest
+
+from extraction_script import ExportMarker, ExtractionError, MarkerIndex, ModuleGraph
+
+
+def marked(**regions):
+    """HTML mínimo com uma região CORTE por módulo (src/<nome>.js)"""
+    parts = []
+    for name, body in regions.items():
+        path = f'src/{name}.js'
+        parts.append(f'// ===== CORTE: {path} - INÍCIO =====\n{body}\n// ===== CORTE: {path} - FIM =====\n')
+    return '<script>\n' + ''.join(parts) + '</script>\n'
+
+
+def graph(content, split=False):
+    return ModuleGraph(content, MarkerIndex(content), split=split)
+
+
+def start(path):
+    return f'// ===== CORTE: {path} - INÍCIO =====\n'
+
+
+def end(path):
+    return f'// ===== CORTE: {path} - FIM =====\n'
+
+
+@pytest.mark.parametrize('encode', [False, True], ids=['str', 'bytes'])
+def test_marker_index_finds_region_bodies(encode):
+    content, body = marked(a='class Alpha {}', b='class Beta {}'), 'class Alpha {}'
+    if encode:
+        content, body = content.encode('utf-8'), body.encode('utf-8')
+
+    index = MarkerIndex(content)
+
+    assert index.problems == []
+    assert sorted(index.regions) == ['src/a.js', 'src/b.js']
+    region_start, region_end = index.get('src/a.js')
+    assert content[region_start:region_end].strip() == body
+
+
+def test_marker_index_reports_unmatched_markers():
+    index = MarkerIndex(end('src/a.js') + start('src/b.js') + 'let b;\n')
+
+    assert index.problems == ['FIM sem INÍCIO: src/a.js', 'INÍCIO sem FIM: src/b.js']
+    assert len(index) == 0
+
+
+def test_marker_index_reports_duplicate_regions():
+    index = MarkerIndex(marked(a='let a;') + start('src/a.js') + 'let again;\n' + end('src/a.js'))
+
+    assert index.problems[0] == 'Marcação duplicada: src/a.js'
+    assert 'src/a.js' in index
+
+
+def test_marker_index_reports_nested_regions():
+    index = MarkerIndex(start('src/a.js') + start('src/b.js') + 'let b;\n' + end('src/b.js') + end('src/a.js'))
+
+    assert index.problems == [
+        'Marcação aninhada: src/b.js aberta dentro de src/a.js',
+        'FIM de src/b.js encontrado dentro de src/a.js',
+    ]
+    assert list(index.regions) == ['src/a.js']
+
+
+@pytest.mark.parametrize('encode', [False, True], ids=['str', 'bytes'])
+def test_template_text_and_regex_bodies_are_not_references(encode):
+    content = marked(
+        a='class Alpha {}',
+        b='class Beta {}',
+        c='class Gamma {}',
+        app=(
+            'const label = `Alpha ${Beta.name + `Gamma`} ${ {k: 1}.k } Gamma`;\n'
+            "const pattern = /Gamma[/]Alpha\\/'/g;\n"
+            'const half = total / Alpha / 2;\n'
+        ),
+    )
+    if encode:
+        content = content.encode('utf-8')
+
+    imports = graph(content).imports['src/app.js']
+
+    assert imports == {'src/a.js': ['Alpha'], 'src/b.js': ['Beta']}
+
+
+def test_module_graph_levels_follow_imports():
+    modules = graph(marked(
+        result='class Result {}',
+        errors='class AppError extends Error {}',
+        cache='class Cache { get() { return Result.ok(); } }',
+        composer='class Composer { run() { throw new AppError(Cache.name); } }',
+        app='new Composer().run();',
+    ))
+
+    assert modules.problems == []
+    assert modules.imports['src/composer.js'] == {'src/errors.js': ['AppError'], 'src/cache.js': ['Cache']}
+    assert modules.levels() == [
+        ['src/result.js', 'src/errors.js'],
+        ['src/cache.js'],
+        ['src/composer.js'],
+        ['src/app.js'],
+    ]
+
+
+def test_module_graph_reports_cycle():
+    modules = graph(marked(
+        base='class Base {}',
+        a='class Alpha { b() { return Beta; } }',
+        b='class Beta { a() { return Alpha; } }',
+        app='new Alpha(); new Base();',
+    ))
+
+    levels = modules.levels()
+
+    # O que depende do ciclo também fica pendente e vai no último nível
+    assert levels == [['src/base.js'], ['src/a.js', 'src/b.js', 'src/app.js']]
+    assert modules.problems == ['Ciclo de dependências entre: src/a.js, src/b.js, src/app.js']
+
+
+def test_export_marker_marks_top_level_declarations_once():
+    marker = ExportMarker(['Alpha', 'beta', 'Gamma'])
+    text = (
+        'class Alpha {}\n'
+        'export async function beta() {}\n'
+        'const Gamma = 1;\n'
+        '    const Alpha = 2;\n'
+        'let Delta;\n'
+    )
+
+    assert marker.apply(text) == (
+        'export class Alpha {}\n'
+        'export async function beta() {}\n'
+        'export const Gamma = 1;\n'
+        '    const Alpha = 2;\n'
+        'let Delta;\n'
+    )
+    marker.check('src/a.js')
+
+
+def test_export_marker_rewrites_lines_in_place():
+    marker = ExportMarker(['Alpha'])
+    buffer = b'class Alpha {}\nclass Beta {}\n'
+
+    assert marker.apply_line(buffer, 0, 14) == b'export class Alpha {}'
+    assert marker.apply_line(buffer, 15, 28) is None
+
+
+def test_export_marker_fails_on_missing_export():
+    marker = ExportMarker(['Alpha', 'Missing', 'Nested'])
+    marker.apply('class Alpha {}\n    class Nested {}\n')
+
+    with pytest.raises(ExtractionError, match='src/a.js: Missing, Nested'):
+        marker.check('src/a.js')
@@ -0,0 +1,27 @@
+"""Cache persistente de layouts amarrado à configuração do motor."""
+
+import pytest
+
+from layout_cache import CacheConfigError, LayoutCache
+
+
+def test_reopening_with_same_config_keeps_results(tmp_path):
+    db_path = tmp_path / 'layout-cache.db'
+    cache = LayoutCache(db_path=db_path, config='a')
+    cache.put('key', {'baseFontSize': 10, 'lineHeight': 1.1})
+    cache.close()
+
+    cache = LayoutCache(db_path=db_path, config='a')
+    assert cache.get('key') == {'baseFontSize': 10, 'lineHeight': 1.1}
+    assert cache.stored_config() == 'a'
+    cache.close()
+
+
+def test_reopening_with_other_config_is_rejected(tmp_path):
+    db_path = tmp_path / 'layout-cache.db'
+    cache = LayoutCache(db_path=db_path, config='a')
+    cache.put('key', {'baseFontSize': 10, 'lineHeight': 1.1})
+    cache.close()
+
+    with pytest.raises(CacheConfigError):
+        LayoutCache(db_path=db_path, config='b')
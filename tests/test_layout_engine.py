@@ -0,0 +1,95 @@
+"""Paridade do layout_engine.py com o LayoutComposer original.
+
+As referências não vêm de um navegador: tests/export_layout_reference.js roda
+o código das regiões marcadas em Node, sobre um DOM mínimo que mede o texto
+com a tabela de glifos sans-serif-glyphs.json. layout_reference.jsonl traz o
+resultado de findBestCandidate para cada card de layout_cards.jsonl e
+layout_scores.jsonl a badness de cada candidato, na ordem de
+_generateCandidates. Para regerar:
+    node tests/export_layout_reference.js [--scores] cards.jsonl glyphs.json
+
+Uma altura de linha maior só aumenta a altura total e o espaçamento, então
+1.1 sempre vence (ou empata, e o primeiro candidato fica); os cards cobrem
+cada tamanho-base vencedor das três faixas de razão, e a matriz completa
+confere 1.2 e 1.3.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from layout_engine import (  # noqa: E402
+    GlyphTable, LayoutEngine, base_font_sizes, compare_with_reference, read_cards, read_reference
+)
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture(scope='module')
+def cards():
+    return read_cards(FIXTURES / 'layout_cards.jsonl')
+
+
+@pytest.fixture(scope='module')
+def reference():
+    return read_reference(FIXTURES / 'layout_reference.jsonl')
+
+
+@pytest.fixture(scope='module')
+def scores():
+    with open(FIXTURES / 'layout_scores.jsonl', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_fixture_glyphs_match_builtin_table():
+    fixture = GlyphTable.load(FIXTURES / 'sans-serif-glyphs.json')
+    builtin = GlyphTable.builtin()
+    assert fixture.advances == builtin.advances
+    assert fixture.default == builtin.default
+
+
+def test_find_best_matches_reference_composer(cards, reference):
+    results = LayoutEngine().find_best(cards)
+
+    assert compare_with_reference(results, reference) == []
+    for result, expected in zip(results, reference):
+        assert result['badness'] == pytest.approx(expected['badness'], rel=1e-9)
+
+
+def test_reference_covers_every_winning_base_size(cards, reference):
+    winners = {(tuple(base_font_sizes(card['ratio'])), expected['baseFontSize'])
+               for card, expected in zip(cards, reference)}
+    for ratio in (1.2, 1.5, 1.6):
+        sizes = tuple(base_font_sizes(ratio))
+        assert {(sizes, size) for size in sizes} <= winners
+
+
+def test_score_matches_reference_composer_for_every_candidate(cards, scores):
+    badness = LayoutEngine().score(cards)
+
+    assert len(badness) == len(scores)
+    for row, expected in zip(badness, scores):
+        assert row[:len(expected)] == pytest.approx(expected, rel=1e-9)
+        assert np.isinf(row[len(expected):]).all()
+
+
+def test_compare_rejects_reference_of_other_length(cards, reference):
+    results = LayoutEngine().find_best(cards)
+    with pytest.raises(ValueError):
+        compare_with_reference(results, reference[:-1])
+
+
+@pytest.mark.parametrize('line', [
+    '{"badness": 1}',
+    '{"baseFontSize": "12", "lineHeight": 1.1}',
+    '[12, 1.1]',
+    'not json',
+])
+def test_read_reference_rejects_malformed_rows(tmp_path, line):
+    path = tmp_path / 'reference.jsonl'
+    path.write_text('null\n' + line + '\n', encoding='utf-8')
+    with pytest.raises(ValueError, match=':2:'):
+        read_reference(path)
@@ -0,0 +1,33 @@
+"""Minificação conservadora do minifier.py: strings, regex e templates intactos."""
+
+from minifier import minify_css, minify_js
+
+
+def test_strings_keep_comment_markers_and_spacing():
+    code = 'const a = "x  // não é comentário";   // fim\nconst b = \'/* nem este */\';\n'
+
+    assert minify_js(code) == 'const a="x  // não é comentário";const b=\'/* nem este */\';\n'
+
+
+def test_template_text_and_substitutions_are_untouched():
+    template = '`linha   ${ a /* dentro */ + `  ${b}  ` }   fim`'
+
+    assert minify_js(f'const t = {template};\n') == f'const t={template};\n'
+
+
+def test_regex_literals_are_untouched_and_division_is_not_a_regex():
+    code = 'const r = /a\\/b  [/]  c/g.test(s) ? x / 2 / y : 0;\nreturn /  re  /.exec(s)\n'
+
+    assert minify_js(code) == 'const r=/a\\/b  [/]  c/g.test(s)?x/2/y:0;return/  re  /.exec(s)\n'
+
+
+def test_newlines_needed_by_asi_are_kept():
+    code = 'let n = i ++ + j;\nfoo()\nbar()\n'
+
+    assert minify_js(code) == 'let n=i++ +j;foo()\nbar()\n'
+
+
+def test_css_strings_are_untouched():
+    css = 'a  >  b { color: red ; /* c */ content: "  a ;  b " ; }\n\n@media (max-width: 10px) { p , q { margin: 0 } }'
+
+    assert minify_css(css) == 'a>b{color:red;content:"  a ;  b "}@media (max-width:10px){p,q{margin:0}}'
@@ -0,0 +1,64 @@
+"""Erros isolados por card no render_cards.py."""
+
+import json
+
+import pytest
+
+pytest.importorskip('numpy')
+
+import render_cards  # noqa: E402
+from render_cards import CardWriter, render_batch  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def engine():
+    render_cards._init_worker(None, 0)
+    yield render_cards._engine
+    render_cards._engine = None
+
+
+def numbered(*specs):
+    return [(number, json.dumps(spec)) for number, spec in enumerate(specs, start=1)]
+
+
+def test_invalid_spec_fails_only_its_card():
+    results, _ = render_batch(numbered(
+        {'id': 'a', 'blocks': [{'text': 'Um', 'hierarchy': 5}]},
+        {'id': 'b', 'blocks': [{'text': 'Dois', 'hierarchy': 'big'}]},
+        {'id': 'c', 'blocks': [{'text': 'Três'}]},
+    ))
+
+    errors = {line_number: error for line_number, _, _, error in results}
+    assert errors[1] is None and errors[3] is None
+    assert 'hierarchy' in errors[2]
+
+
+def test_engine_error_is_retried_card_by_card(engine, monkeypatch):
+    create_layouts = engine.create_layouts
+
+    def failing(specs):
+        if any(spec['blocks'][0]['content']['data']['text'] == 'ruim' for spec in specs):
+            raise ValueError('card ruim')
+        return create_layouts(specs)
+
+    monkeypatch.setattr(engine, 'create_layouts', failing)
+    results, _ = render_batch(numbered(
+        {'id': 'a', 'blocks': [{'text': 'bom'}]},
+        {'id': 'b', 'blocks': [{'text': 'ruim'}]},
+        {'id': 'c', 'blocks': [{'text': 'bom também'}]},
+    ))
+
+    errors = {card_id: error for _, card_id, _, error in results}
+    assert errors['a'] is None and errors['c'] is None
+    assert 'card ruim' in errors['b']
+
+
+def test_writer_keeps_distinct_ids_in_distinct_files(tmp_path):
+    writer = CardWriter(tmp_path)
+
+    assert writer.write('a/b', '<div>1</div>', None) is None
+    assert writer.write('a_b', '<div>2</div>', None) is None
+    assert writer.write('a_b', '<div>3</div>', None) is not None
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['a%2Fb.html', 'a_b.html']
+    assert '<div>2</div>' in (tmp_path / 'a_b.html').read_text(encoding='utf-8')
@@ -0,0 +1,121 @@
+"""ETag/304, negociação de gzip e Cache-Control do servidor de desenvolvimento."""
+
+import gzip
+import http.client
+import os
+import threading
+
+import pytest
+
+from serve import IMMUTABLE_CACHE_CONTROL, DevServer, FileCache
+
+SCRIPT = b'export const message = "ol\xc3\xa1";\n' * 20
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'app.js').write_bytes(SCRIPT)
+    (tmp_path / 'src' / 'app.0123abcd.js').write_bytes(SCRIPT)
+    (tmp_path / 'index.html').write_bytes(b'<!DOCTYPE html><title>x</title>\n')
+    return tmp_path
+
+
+@pytest.fixture
+def fetch(root):
+    server = DevServer(('127.0.0.1', 0), FileCache(root), quiet=True)
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+    thread.start()
+
+    def send(path, method='GET', **headers):
+        connection = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=5)
+        try:
+            connection.request(method, path, headers=headers)
+            response = connection.getresponse()
+            return response, response.read()
+        finally:
+            connection.close()
+
+    yield send
+    server.shutdown()
+    server.server_close()
+
+
+def test_etag_revalidation_returns_304(fetch):
+    response, body = fetch('/src/app.js')
+    etag = response.getheader('ETag')
+
+    assert response.status == 200 and body == SCRIPT
+    assert response.getheader('Cache-Control') == 'no-cache'
+
+    response, body = fetch('/src/app.js', **{'If-None-Match': f'"other", {etag}'})
+    assert response.status == 304 and body == b''
+    assert response.getheader('ETag') == etag
+
+    response, _ = fetch('/src/app.js', **{'If-None-Match': '"other"'})
+    assert response.status == 200
+
+
+def test_changed_file_gets_new_etag(root, fetch):
+    response, _ = fetch('/src/app.js')
+    etag = response.getheader('ETag')
+    path = root / 'src' / 'app.js'
+    path.write_bytes(SCRIPT + b'// editado\n')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    response, body = fetch('/src/app.js', **{'If-None-Match': etag})
+
+    assert response.status == 200 and body.endswith(b'// editado\n')
+    assert response.getheader('ETag') != etag
+
+
+@pytest.mark.parametrize('accept, compressed', [
+    ('gzip', True),
+    ('br, gzip;q=0.5', True),
+    ('gzip;q=0', False),
+    ('identity', False),
+    ('', False),
+])
+def test_gzip_negotiation(fetch, accept, compressed):
+    response, body = fetch('/src/app.js', **{'Accept-Encoding': accept})
+
+    assert response.getheader('Vary') == 'Accept-Encoding'
+    if compressed:
+        assert response.getheader('Content-Encoding') == 'gzip'
+        assert response.getheader('ETag').endswith('-gzip"')
+        assert gzip.decompress(body) == SCRIPT
+    else:
+        assert response.getheader('Content-Encoding') is None
+        assert body == SCRIPT
+
+
+def test_small_files_are_not_compressed(fetch):
+    response, body = fetch('/index.html', **{'Accept-Encoding': 'gzip'})
+
+    assert response.getheader('Content-Encoding') is None
+    assert body.startswith(b'<!DOCTYPE html>')
+
+
+def test_fresh_precompressed_sibling_is_served(root, fetch):
+    marker = gzip.compress(b'// do disco\n', mtime=0)
+    (root / 'src' / 'app.js.gz').write_bytes(marker)
+
+    response, body = fetch('/src/app.js', **{'Accept-Encoding': 'gzip'})
+
+    assert body == marker
+
+
+def test_fingerprinted_names_are_immutable(fetch):
+    response, _ = fetch('/src/app.0123abcd.js')
+    assert response.getheader('Cache-Control') == IMMUTABLE_CACHE_CONTROL
+
+    response, _ = fetch('/src/app.0123abcd.js', **{'If-None-Match': response.getheader('ETag')})
+    assert response.status == 304
+    assert response.getheader('Cache-Control') == IMMUTABLE_CACHE_CONTROL
+
+
+def test_paths_stay_under_the_root(root, fetch):
+    assert fetch('/src/missing.js')[0].status == 404
+    assert fetch('/%2e%2e/%2e%2e/etc/passwd')[0].status == 404
+    assert FileCache(root / 'src').resolve_path('/%2e%2e/index.html') == root / 'src' / 'index.html'